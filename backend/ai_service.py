@@ -1,17 +1,381 @@
+import asyncio
 import boto3
+from botocore.config import Config
+import contextvars
+import copy
+import functools
+import hashlib
+import inspect
 import json
+import re
+import threading
+import time
+from collections import OrderedDict, deque
 from typing import Optional, Dict, Any
 import os
 from datetime import datetime, timedelta
 from demo_flags import DEMO_MODE
+from redis_client import redis_client as _redis
+from ai_text_utils import (
+    _TWEET_MAX_LEN,
+    _VIDEO_CAPTION_MAX_LEN,
+    _SHORTS_CAPTION_BODY_LEN,
+    _SHORTS_CAPTION_MAX_LEN,
+    _fit_with_link,
+    _fallback_offer,
+    _fallback_content_ideas,
+    _fallback_cta_variation,
+    _fallback_campaign_strategy,
+    _fallback_platform_content,
+    _fallback_campaign_cta,
+    _fallback_platform_variation,
+    _fallback_pain_point,
+    _fallback_persona,
+)
+
+try:
+    import orjson
+except ImportError:  # stdlib fallback when orjson is not installed
+    orjson = None
+
+if orjson is not None:
+    _loads = orjson.loads
+
+    def _dumps_canonical(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS)
+else:
+    # One decoder reused for every parse instead of json.loads building its own
+    _loads = json.JSONDecoder().decode
+
+    def _dumps_canonical(obj) -> str:
+        return json.dumps(obj, sort_keys=True, separators=(',', ':'))
+
+# One pooled Bedrock client shared by every generate_* call. The pool is sized
+# above FastAPI's default threadpool (40) so concurrent sync handlers never
+# queue for a connection; keep-alive avoids a TLS handshake per call.
+_BEDROCK_CONFIG = Config(
+    max_pool_connections=64,
+    retries={"mode": "adaptive", "max_attempts": 5},
+    tcp_keepalive=True,
+    connect_timeout=3,
+    read_timeout=60,
+)
+_bedrock = boto3.client("bedrock-runtime", region_name=os.environ.get("AWS_REGION"), config=_BEDROCK_CONFIG) if not DEMO_MODE else None
+
+# Static preamble (role, JSON output rules) shared verbatim by every generator so
+# Bedrock prompt caching sees one common prefix. Per-call inputs go in the user
+# message only. Left empty in the open-source distribution, like the prompts.
+_SYSTEM_PROMPT = ""
+
+
+# Replies that could be JSON, and one line of a "- item" list with bullets/whitespace trimmed
+_JSON_START = re.compile(r"\s*[\[{]")
+_BULLET_LINE = re.compile(r"^(?:[^\S\n]|-)*(.*?)(?:[^\S\n]|-)*$", re.M)
+
+
+# Set while a generator call produced an error string or a fallback instead of model output,
+# so _semantic_cache returns that result without caching it
+_USED_FALLBACK = contextvars.ContextVar("ai_used_fallback", default=False)
+
+
+def _mark_fallback():
+    _USED_FALLBACK.set(True)
+
+
+def _merge_by_platform(items, platforms: list, fallback) -> list:
+    """Order a platform-keyed model response by the requested platforms.
+    Platforms missing from the response (or an unparseable response) get fallback(platform).
+    """
+    by_platform = {}
+    if isinstance(items, list):
+        for item in items:
+            if isinstance(item, dict) and item.get("platform") is not None:
+                by_platform.setdefault(str(item["platform"]).lower(), item)
+    merged = []
+    for platform in platforms:
+        item = by_platform.get(str(platform).lower())
+        if not item:
+            _mark_fallback()
+            item = fallback(platform)
+        merged.append(item)
+    return merged
+
+
+# ============================================================================
+# SEMANTIC RESPONSE CACHE
+# ============================================================================
+
+class _ResponseCache:
+    """Bounded LRU with per-entry expiry, used for generator results and raw Bedrock text.
+    Only successful model output is stored; entries expire after ttl_seconds. Shared by
+    threadpool handlers, so every access takes the lock.
+    """
+
+    def __init__(self, maxsize: int = 4096, ttl_seconds: float = 900.0):
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            stored_at, value = entry
+            if time.monotonic() - stored_at > self.ttl_seconds:
+                self._entries.pop(key, None)
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def put(self, key, value) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class _CacheProgram:
+    """A regex over one generator input plus a builder that templates the response.
+
+    The program only serves responses once its builder has agreed with at least
+    `threshold` of the last `window` live responses for matching inputs.
+    """
+
+    def __init__(self, pattern: str, builder, arg_index: int = 0, window: int = 20, threshold: float = 0.9):
+        self.pattern = re.compile(pattern)
+        self.builder = builder
+        self.arg_index = arg_index
+        self.threshold = threshold
+        self._history = deque(maxlen=window)
+
+    @property
+    def active(self) -> bool:
+        return len(self._history) == self._history.maxlen and sum(self._history) >= self.threshold * len(self._history)
+
+    def match(self, args: tuple):
+        if len(args) <= self.arg_index or not isinstance(args[self.arg_index], str):
+            return None
+        return self.pattern.match(args[self.arg_index].strip())
+
+    def observe(self, m, live_result) -> None:
+        self._history.append(self.builder(m) == live_result)
+
+
+_RESPONSE_CACHE = _ResponseCache()
+# Generator results are also shared across workers through Redis (when configured),
+# under a digest of the normalized call and with the same expiry as the local cache
+_SHARED_CACHE_PREFIX = "sgtma:ai:"
+# Raw model text keyed by the canonical serialized Converse request
+_BEDROCK_CACHE = _ResponseCache(maxsize=2048)
+
+
+def _normalize_cache_arg(value):
+    if isinstance(value, str):
+        return " ".join(value.split())
+    if isinstance(value, (list, tuple)):
+        return tuple(_normalize_cache_arg(v) for v in value)
+    return value
+
+
+def _shared_cache_key(key) -> str:
+    raw = _dumps_canonical(key)
+    if isinstance(raw, str):
+        raw = raw.encode()
+    return _SHARED_CACHE_PREFIX + hashlib.blake2b(raw, digest_size=16).hexdigest()
+
+
+def _shared_cache_get(key):
+    try:
+        raw = _redis.get(_shared_cache_key(key))
+        return _loads(raw) if raw is not None else None
+    except Exception:
+        # Redis trouble (or an unreadable entry) only costs the shared hit; generation goes ahead
+        return None
+
+
+def _shared_cache_fetch(key):
+    """Shared-cache lookup that also refills the local cache on a hit."""
+    hit = _shared_cache_get(key)
+    if hit is not None:
+        _RESPONSE_CACHE.put(key, hit)
+    return hit
+
+
+def _shared_cache_put(key, value) -> None:
+    try:
+        _redis.setex(_shared_cache_key(key), int(_RESPONSE_CACHE.ttl_seconds), _dumps_canonical(value))
+    except Exception:
+        pass
+
+
+def _semantic_cache(*programs: _CacheProgram):
+    """Serve generator results from the exact-match cache or an active cache program before calling Bedrock."""
+    def decorator(fn):
+        # Sync and async variants of a generator share cache entries
+        name = fn.__name__.removesuffix("_async")
+
+        def cache_key(args, kwargs):
+            return (name, _normalize_cache_arg(args), tuple(sorted((k, _normalize_cache_arg(v)) for k, v in kwargs.items())))
+
+        def resolve(args, hit):
+            """(matches, cached result) given the exact-match hit, if any."""
+            if hit is not None:
+                return [], copy.deepcopy(hit)
+            matches = []
+            for program in programs:
+                m = program.match(args)
+                if m:
+                    if program.active:
+                        return [], program.builder(m)
+                    matches.append((program, m))
+            return matches, None
+
+        def observe(key, matches, result):
+            for program, m in matches:
+                program.observe(m, result)
+            _RESPONSE_CACHE.put(key, result)
+
+        if inspect.iscoroutinefunction(fn):
+            @functools.wraps(fn)
+            async def async_wrapper(self, *args, **kwargs):
+                key = cache_key(args, kwargs)
+                hit = _RESPONSE_CACHE.get(key)
+                if hit is None and _redis is not None:
+                    # redis-py blocks, so the shared-cache round trips run in a worker thread
+                    hit = await asyncio.to_thread(_shared_cache_fetch, key)
+                matches, cached = resolve(args, hit)
+                if cached is not None:
+                    return cached
+                token = _USED_FALLBACK.set(False)
+                try:
+                    result = await fn(self, *args, **kwargs)
+                    if _USED_FALLBACK.get():
+                        return result
+                finally:
+                    _USED_FALLBACK.reset(token)
+                observe(key, matches, result)
+                if _redis is not None:
+                    await asyncio.to_thread(_shared_cache_put, key, result)
+                return copy.deepcopy(result)
+            return async_wrapper
+
+        @functools.wraps(fn)
+        def wrapper(self, *args, **kwargs):
+            key = cache_key(args, kwargs)
+            hit = _RESPONSE_CACHE.get(key)
+            if hit is None and _redis is not None:
+                hit = _shared_cache_fetch(key)
+            matches, cached = resolve(args, hit)
+            if cached is not None:
+                return cached
+            token = _USED_FALLBACK.set(False)
+            try:
+                result = fn(self, *args, **kwargs)
+                if _USED_FALLBACK.get():
+                    return result
+            finally:
+                _USED_FALLBACK.reset(token)
+            observe(key, matches, result)
+            if _redis is not None:
+                _shared_cache_put(key, result)
+            return copy.deepcopy(result)
+        return wrapper
+    return decorator
+
+
+# ============================================================================
+# DEMO-MODE FALLBACKS (builders live in ai_text_utils)
+# ============================================================================
+
+def _demo_short_circuit(fallback_factory):
+    """Replace a generator with its deterministic fallback when DEMO_MODE is set.
+
+    DEMO_MODE is fixed at import, so the choice is made once at class definition
+    and the non-demo path carries no extra branch or prompt construction.
+    """
+    def decorator(fn):
+        if not DEMO_MODE:
+            return fn
+        if inspect.iscoroutinefunction(fn):
+            @functools.wraps(fn)
+            async def async_wrapper(self, *args, **kwargs):
+                return fallback_factory(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(fn)
+        def wrapper(self, *args, **kwargs):
+            return fallback_factory(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def _demo_cta_variations(campaign_description: str, platforms: list) -> list:
+    return [_fallback_cta_variation(campaign_description, p) for p in platforms]
+
+
+def _demo_platform_variations(script_content: str, platforms: list) -> dict:
+    return {
+        "original_content": script_content,
+        "platform_variations": [_fallback_platform_variation(script_content, p) for p in platforms],
+    }
+
+
+def _demo_tweet(script_summary: str, cta_link: str) -> str:
+    # Demo Bedrock output is empty, so the tweet is just the fitted link
+    return _fit_with_link("", cta_link, _TWEET_MAX_LEN)
+
+
+def _demo_video_caption(script_text: str, cta_link: str) -> str:
+    return _fit_with_link("", cta_link, _VIDEO_CAPTION_MAX_LEN) or f"Watch how to solve this in 60s. Learn more: {cta_link}"
+
+
+def _demo_campaign_content(campaign_name: str, objective: str, target_persona: str, platforms: list) -> dict:
+    data = _fallback_campaign_strategy(campaign_name, objective, target_persona, platforms)
+    data["platform_content"] = [_fallback_platform_content(campaign_name, p) for p in platforms]
+    data["ctas"] = [_fallback_campaign_cta(p) for p in platforms]
+    return data
+
+
+# Pain points phrased as "struggling with X" reliably yield the templated offer
+_OFFER_PROGRAM = _CacheProgram(
+    r"(?i)^(?:struggling with|problem with|need help with)\s+(.+)$",
+    lambda m: _fallback_offer(m.string),
+)
+
 
 class AIService:
+    __slots__ = (
+        "region",
+        "bedrock",
+        "credentials",
+        "credentials_expiry",
+        "model_id",
+        "_aio_session",
+        "_aio_bedrock",
+        "_aio_lock",
+    )
+
     def __init__(self):
         # Preserve structural attributes, remove embedded credentials
         self.region = None
         self.bedrock = None
         self.credentials = None
         self.credentials_expiry = None
+        # Model to invoke: an on-demand model id or a Provisioned Throughput model ARN
+        # (BEDROCK_MODEL_ID); Bedrock accepts either as modelId.
+        self.model_id = os.environ.get("BEDROCK_MODEL_ID", "amazon.nova-pro-v1:0")
+        # Async Bedrock client is created lazily and kept for the process lifetime
+        self._aio_session = None
+        self._aio_bedrock = None
+        # Concurrent first calls (including ones arriving via from_thread.run) open one client
+        self._aio_lock = asyncio.Lock()
         
         # Do not initialize external clients in open-source demo
         if not DEMO_MODE:
@@ -19,16 +383,17 @@ class AIService:
             raise RuntimeError("Bedrock client initialization disabled in demo/open-source distribution.")
         
     def _initialize_bedrock_client(self):
-        """Initialize the Bedrock client (disabled in demo)."""
+        """Attach the shared module-level Bedrock client (disabled in demo)."""
         if DEMO_MODE:
             return
-        raise RuntimeError("Disabled in open-source demo (no credentials).")
+        self.bedrock = _bedrock
     
     def _check_bedrock_available(self):
         """Check if Bedrock is available before making calls."""
         if self.bedrock is None:
             raise Exception("AWS Bedrock not available. Please check credentials and permissions.")
         
+    @_semantic_cache()
     def generate_script_from_pain_point(self, pain_point: str, persona: str = None) -> str:
         """Generate a marketing script based on a pain point and optionally a persona."""
         
@@ -55,12 +420,16 @@ class AIService:
         prompt = ""
         
         response = self._call_bedrock(prompt)
-        try:
-            return json.loads(response)
-        except:
-            lines = response.strip().split('\n')
-            return [line.strip('- ').strip() for line in lines if line.strip()]
+        # Only attempt a JSON parse when the reply looks like JSON; bullet lists skip the exception path
+        if _JSON_START.match(response):
+            try:
+                return _loads(response)
+            except ValueError:
+                pass
+        return [line for line in _BULLET_LINE.findall(response) if line]
     
+    @_demo_short_circuit(_fallback_offer)
+    @_semantic_cache(_OFFER_PROGRAM)
     def generate_offer_from_pain_point(self, pain_point: str, persona: str = None) -> Dict[str, str]:
         """Generate a marketing offer based on a pain point."""
         
@@ -70,15 +439,12 @@ class AIService:
         
         response = self._call_bedrock(prompt)
         try:
-            return json.loads(response)
+            return _loads(response)
         except:
-            return {
-                "title": f"Free {pain_point.split()[0]} Assessment",
-                "description": f"Get a free assessment to solve your {pain_point.lower()} challenges",
-                "cta_text": "Get Free Assessment",
-                "link_url": "https://redacted.example.com"
-            }
+            _mark_fallback()
+            return _fallback_offer(pain_point)
     
+    @_semantic_cache()
     def generate_persona_description(self, title: str, industry: str = None) -> str:
         """Generate a detailed persona description based on title and industry."""
         
@@ -88,6 +454,8 @@ class AIService:
         
         return self._call_bedrock(prompt)
     
+    @_demo_short_circuit(_fallback_content_ideas)
+    @_semantic_cache()
     def generate_content_ideas(self, topic: str, platform: str = "LinkedIn") -> list:
         """Generate content ideas for a given topic and platform."""
         
@@ -97,21 +465,17 @@ class AIService:
         
         response = self._call_bedrock(prompt)
         try:
-            return json.loads(response)
+            return _loads(response)
         except:
-            return [
-                {
-                    "title": f"5 Ways to Improve {topic}",
-                    "description": f"Learn the top strategies for {topic.lower()}",
-                    "talking_points": [f"Strategy 1 for {topic}", f"Strategy 2 for {topic}"],
-                    "hashtags": [f"#{topic.replace(' ', '')}", "#MarketingTips"]
-                }
-            ]
+            _mark_fallback()
+            return _fallback_content_ideas(topic, platform)
     
     # ============================================================================
     # CAMPAIGN MANAGEMENT AI FUNCTIONS (Phase 3.1)
     # ============================================================================
     
+    @_demo_short_circuit(_demo_cta_variations)
+    @_semantic_cache()
     def generate_cta_variations(self, campaign_description: str, platforms: list) -> list:
         """Generate platform-specific CTA variations for a campaign."""
         
@@ -121,30 +485,31 @@ class AIService:
         prompt = ""
         
         response = self._call_bedrock(prompt)
+        return self._parse_cta_variations(response, campaign_description, platforms)
+    
+    @_demo_short_circuit(_demo_cta_variations)
+    @_semantic_cache()
+    async def generate_cta_variations_async(self, campaign_description: str, platforms: list) -> list:
+        """Async variant of generate_cta_variations for use with asyncio.gather."""
+        
+        self._check_bedrock_available()
+        
+        platforms_text = ", ".join(platforms)
+        prompt = ""
+        
+        response = await self._call_bedrock_async(prompt)
+        return self._parse_cta_variations(response, campaign_description, platforms)
+    
+    def _parse_cta_variations(self, response: str, campaign_description: str, platforms: list) -> list:
+        # One Bedrock call covers every platform; fill any platform the model skipped
         try:
-            return json.loads(response)
+            items = _loads(response)
         except:
-            # Fallback response
-            return [
-                {
-                    "platform": platform,
-                    "ctas": [
-                        {
-                            "text": "Learn More",
-                            "type": "link",
-                            "url": "https://redacted.example.com",
-                            "description": f"Standard CTA for {platform}"
-                        },
-                        {
-                            "text": f"#{campaign_description.replace(' ', '')}",
-                            "type": "hashtag",
-                            "description": f"App hashtag for {platform}"
-                        }
-                    ]
-                }
-                for platform in platforms
-            ]
+            items = []
+        return _merge_by_platform(items, platforms, lambda platform: _fallback_cta_variation(campaign_description, platform))
     
+    @_demo_short_circuit(_demo_campaign_content)
+    @_semantic_cache()
     def generate_campaign_content(self, campaign_name: str, objective: str, target_persona: str, platforms: list) -> dict:
         """Generate comprehensive campaign content including CTAs and platform variations."""
         
@@ -154,45 +519,36 @@ class AIService:
         prompt = ""
         
         response = self._call_bedrock(prompt)
+        return self._parse_campaign_content(response, campaign_name, objective, target_persona, platforms)
+    
+    @_demo_short_circuit(_demo_campaign_content)
+    @_semantic_cache()
+    async def generate_campaign_content_async(self, campaign_name: str, objective: str, target_persona: str, platforms: list) -> dict:
+        """Async variant of generate_campaign_content for use with asyncio.gather."""
+        
+        self._check_bedrock_available()
+        
+        platforms_text = ", ".join(platforms)
+        prompt = ""
+        
+        response = await self._call_bedrock_async(prompt)
+        return self._parse_campaign_content(response, campaign_name, objective, target_persona, platforms)
+    
+    def _parse_campaign_content(self, response: str, campaign_name: str, objective: str, target_persona: str, platforms: list) -> dict:
         try:
-            return json.loads(response)
+            data = _loads(response)
         except:
+            data = None
+        if not isinstance(data, dict):
             # Fallback response
-            return {
-                "campaign_name": campaign_name,
-                "objective": objective,
-                "target_persona": target_persona,
-                "platforms": platforms,
-                "content_strategy": {
-                    "main_message": f"Campaign focused on {objective.lower()}",
-                    "key_themes": ["Innovation", "Growth", "Success"],
-                    "hashtags": [f"#{campaign_name.replace(' ', '')}", "#RedactedApp"]
-                },
-                "platform_content": [
-                    {
-                        "platform": platform,
-                        "content_variations": [
-                            {
-                                "title": f"{campaign_name} on {platform}",
-                                "content": f"Platform-specific content for {platform}",
-                                "cta": "Learn More",
-                                "hashtags": [f"#{platform}", "#RedactedApp"]
-                            }
-                        ]
-                    }
-                    for platform in platforms
-                ],
-                "ctas": [
-                    {
-                        "text": "Learn More",
-                        "type": "link",
-                        "platform": platform,
-                        "description": f"Standard CTA for {platform}"
-                    }
-                    for platform in platforms
-                ]
-            }
+            _mark_fallback()
+            data = _fallback_campaign_strategy(campaign_name, objective, target_persona, platforms)
+        data["platform_content"] = _merge_by_platform(data.get("platform_content"), platforms, lambda platform: _fallback_platform_content(campaign_name, platform))
+        data["ctas"] = _merge_by_platform(data.get("ctas"), platforms, _fallback_campaign_cta)
+        return data
     
+    @_demo_short_circuit(_demo_platform_variations)
+    @_semantic_cache()
     def generate_platform_variations(self, script_content: str, platforms: list) -> dict:
         """Generate platform-specific content variations from a base script."""
         
@@ -202,24 +558,34 @@ class AIService:
         prompt = ""
         
         response = self._call_bedrock(prompt)
+        return self._parse_platform_variations(response, script_content, platforms)
+    
+    @_demo_short_circuit(_demo_platform_variations)
+    @_semantic_cache()
+    async def generate_platform_variations_async(self, script_content: str, platforms: list) -> dict:
+        """Async variant of generate_platform_variations for use with asyncio.gather."""
+        
+        self._check_bedrock_available()
+        
+        platforms_text = ", ".join(platforms)
+        prompt = ""
+        
+        response = await self._call_bedrock_async(prompt)
+        return self._parse_platform_variations(response, script_content, platforms)
+    
+    def _parse_platform_variations(self, response: str, script_content: str, platforms: list) -> dict:
+        # Expected shape: {"platform_variations": [{"platform": ..., "content": ...}, ...]}
         try:
-            return json.loads(response)
+            data = _loads(response)
         except:
-            # Fallback response
-            return {
-                "original_content": script_content,
-                "platform_variations": [
-                    {
-                        "platform": platform,
-                        "content": f"{script_content[:100]}... (optimized for {platform})",
-                        "character_count": len(script_content),
-                        "format_notes": f"Optimized for {platform} format",
-                        "cta_suggestion": "Learn More"
-                    }
-                    for platform in platforms
-                ]
-            }
+            data = None
+        items = data.get("platform_variations") if isinstance(data, dict) else data
+        return {
+            "original_content": script_content,
+            "platform_variations": _merge_by_platform(items, platforms, lambda platform: _fallback_platform_variation(script_content, platform))
+        }
     
+    @_demo_short_circuit(_fallback_pain_point)
     def generate_pain_point_from_offer(self, title: str, description: str) -> str:
         """Generate a primary pain point from an offer's title and description.
         Returns a concise pain point string. Falls back to a sensible default when AI is unavailable.
@@ -227,16 +593,16 @@ class AIService:
         prompt = ""
         try:
             ai_text = self._call_bedrock(prompt)
-            data = json.loads(ai_text)
+            data = _loads(ai_text)
             pain = (data or {}).get('pain_point', '').strip()
             if pain:
                 return pain
         except Exception:
             pass
         # Fallback
-        base = title.strip() or 'your current marketing'
-        return f"Struggling to get results from {base}"
+        return _fallback_pain_point(title, description)
 
+    @_demo_short_circuit(_fallback_persona)
     def suggest_persona_for_offer(self, title: str, description: str) -> dict:
         """Suggest a persona for an offer based on its title and description.
         Returns a dict with keys: title, description. Falls back when AI is unavailable.
@@ -244,91 +610,197 @@ class AIService:
         prompt = ""
         try:
             ai_text = self._call_bedrock(prompt)
-            data = json.loads(ai_text)
+            data = _loads(ai_text)
             persona_title = (data or {}).get('persona_title', '').strip() or 'Generic Persona'
             persona_desc = (data or {}).get('persona_description', '').strip() or 'No description available'
             return {"title": persona_title, "description": persona_desc}
         except Exception:
             # Fallback
-            return {
-                "title": "Content Manager",
-                "description": "Time-strapped content manager at a growing SMB seeking faster, consistent content that drives measurable results."
-            }
+            return _fallback_persona(title, description)
 
+    @_demo_short_circuit(_demo_video_caption)
     def generate_video_caption(self, script_text: str, cta_link: str) -> str:
         """Generate a concise video caption (1-2 sentences) that includes the CTA link.
         Ensures the CTA link is present and returns a short fallback if AI is unavailable.
         """
         prompt = ""
         try:
-            text = (self._call_bedrock(prompt) or '').strip()
-            if cta_link not in text:
-                base = text[: max(0, 160 - 1 - len(cta_link))].rstrip()
-                text = (base + (' ' if base else '') + cta_link).strip()
+            text = _fit_with_link((self._call_bedrock(prompt, _VIDEO_CAPTION_MAX_LEN) or '').strip(), cta_link, _VIDEO_CAPTION_MAX_LEN)
             return text or f"Watch how to solve this in 60s. Learn more: {cta_link}"
         except Exception:
             return f"Watch how to solve this in 60s. Learn more: {cta_link}"
 
+    @_demo_short_circuit(_demo_video_caption)
+    async def generate_video_caption_async(self, script_text: str, cta_link: str) -> str:
+        """Async variant of generate_video_caption for use with asyncio.gather."""
+        prompt = ""
+        try:
+            text = _fit_with_link((await self._call_bedrock_async(prompt, _VIDEO_CAPTION_MAX_LEN) or '').strip(), cta_link, _VIDEO_CAPTION_MAX_LEN)
+            return text or f"Watch how to solve this in 60s. Learn more: {cta_link}"
+        except Exception:
+            return f"Watch how to solve this in 60s. Learn more: {cta_link}"
+
+    @_demo_short_circuit(_demo_tweet)
     def generate_tweet(self, script_summary: str, cta_link: str) -> str:
         """Generate a tweet (<= 280 chars) that includes the CTA link.
         Ensures the CTA link is included and enforces the character limit with graceful truncation.
         """
-        max_len = 280
         prompt = ""
         try:
-            text = (self._call_bedrock(prompt) or '').strip()
+            text = (self._call_bedrock(prompt, _TWEET_MAX_LEN) or '').strip()
+        except Exception:
+            text = f"{script_summary[:180].rstrip(' .')} — Learn more: {cta_link}"
+        return _fit_with_link(text, cta_link, _TWEET_MAX_LEN)
+
+    @_demo_short_circuit(_demo_tweet)
+    async def generate_tweet_async(self, script_summary: str, cta_link: str) -> str:
+        """Async variant of generate_tweet for use with asyncio.gather."""
+        prompt = ""
+        try:
+            text = (await self._call_bedrock_async(prompt, _TWEET_MAX_LEN) or '').strip()
         except Exception:
             text = f"{script_summary[:180].rstrip(' .')} — Learn more: {cta_link}"
-        # Ensure link presence and enforce limit
-        if cta_link not in text:
-            available = max_len - 1 - len(cta_link)
-            base = text[: max(0, available)].rstrip()
-            text = (base + (' ' if base else '') + cta_link).strip()
-        # Final hard cap
-        return text[:max_len].rstrip()
+        return _fit_with_link(text, cta_link, _TWEET_MAX_LEN)
+
+    async def generate_social_copy_async(self, script_text: str, cta_link: str) -> tuple:
+        """Generate the tweet and video caption for a script concurrently.
+        Returns (tweet_text, video_caption); both Bedrock calls are in flight at once.
+        """
+        return tuple(await asyncio.gather(
+            self.generate_tweet_async(script_text, cta_link),
+            self.generate_video_caption_async(script_text, cta_link),
+        ))
     
-    def _call_bedrock(self, prompt: str) -> str:
-        """Make a call to AWS Bedrock with Nova Pro."""
-        
-        # In demo mode, return blank output and do not call external services
-        if DEMO_MODE:
-            return ""
+    def _call_bedrock(self, prompt: str, max_chars: Optional[int] = None) -> str:
+        """Make a call to AWS Bedrock with Nova Pro.
+        With max_chars, the reply is streamed and the stream is closed once that many
+        characters have arrived, for callers that truncate the text anyway.
+        """
         
         if self.bedrock is None:
+            _mark_fallback()
             return "AI service not available. Please check credentials and permissions."
         
+        request = self._converse_request(prompt)
+        key = (self._request_key(request), max_chars)
+        cached = _BEDROCK_CACHE.get(key)
+        if cached is not None:
+            return cached
         try:
-            # Nova Pro request format - send empty messages to avoid publishing prompts
-            body = json.dumps({
-                "messages": []
-            })
-            
-            response = self.bedrock.invoke_model(
-                modelId="amazon.nova-pro-v1:0",
-                body=body
-            )
+            if max_chars is None:
+                response = self.bedrock.converse(**request)
+                text = response['output']['message']['content'][0]['text']
+            else:
+                stream = self.bedrock.converse_stream(**request)['stream']
+                parts, size = [], 0
+                try:
+                    for event in stream:
+                        delta = event.get('contentBlockDelta', {}).get('delta', {}).get('text')
+                        if delta:
+                            parts.append(delta)
+                            size += len(delta)
+                            if size >= max_chars:
+                                break
+                finally:
+                    stream.close()
+                text = ''.join(parts)
+            _BEDROCK_CACHE.put(key, text)
+            return text
             
-            response_body = json.loads(response.get('body').read())
-            return response_body['output']['message']['content'][0]['text']
+        except Exception as e:
+            print(f"Error calling Bedrock: {e}")
+            _mark_fallback()
+            return f"AI service error: {str(e)}"
+
+    @staticmethod
+    def _request_key(request: dict):
+        # Canonical serialization so equal requests share one cache entry
+        return _dumps_canonical(request)
+
+    def _converse_request(self, prompt: str) -> dict:
+        """Build Converse API kwargs: cached static system prefix + per-call user message."""
+        request = {
+            "modelId": self.model_id,
+            "messages": [{"role": "user", "content": [{"text": prompt}]}],
+        }
+        if _SYSTEM_PROMPT:
+            # Everything before the cachePoint is billed at the cached-input rate on reuse
+            request["system"] = [{"text": _SYSTEM_PROMPT}, {"cachePoint": {"type": "default"}}]
+        return request
+
+    async def _get_bedrock_async(self):
+        """Return the shared aioboto3 bedrock-runtime client, creating it on first use.
+        The client context is entered once and kept open; exiting it would close the pool.
+        """
+        if self._aio_bedrock is None:
+            async with self._aio_lock:
+                if self._aio_bedrock is None:
+                    import aioboto3
+                    self._aio_session = aioboto3.Session()
+                    # Same timeouts, retries and pool size as the sync client
+                    self._aio_bedrock = await self._aio_session.client(
+                        "bedrock-runtime", region_name=self.region, config=_BEDROCK_CONFIG
+                    ).__aenter__()
+        return self._aio_bedrock
+
+    async def _call_bedrock_async(self, prompt: str, max_chars: Optional[int] = None) -> str:
+        """Async variant of _call_bedrock backed by aioboto3."""
+        
+        if self.bedrock is None:
+            _mark_fallback()
+            return "AI service not available. Please check credentials and permissions."
+        
+        request = self._converse_request(prompt)
+        key = (self._request_key(request), max_chars)
+        cached = _BEDROCK_CACHE.get(key)
+        if cached is not None:
+            return cached
+        try:
+            client = await self._get_bedrock_async()
+            if max_chars is None:
+                response = await client.converse(**request)
+                text = response['output']['message']['content'][0]['text']
+            else:
+                stream = (await client.converse_stream(**request))['stream']
+                parts, size = [], 0
+                try:
+                    async for event in stream:
+                        delta = event.get('contentBlockDelta', {}).get('delta', {}).get('text')
+                        if delta:
+                            parts.append(delta)
+                            size += len(delta)
+                            if size >= max_chars:
+                                break
+                finally:
+                    stream.close()
+                text = ''.join(parts)
+            _BEDROCK_CACHE.put(key, text)
+            return text
             
         except Exception as e:
             print(f"Error calling Bedrock: {e}")
+            _mark_fallback()
             return f"AI service error: {str(e)}"
 
+    def cache_clear(self) -> None:
+        """Drop all memoized generator results and raw Bedrock responses."""
+        _RESPONSE_CACHE.clear()
+        _BEDROCK_CACHE.clear()
+
+    async def aclose(self):
+        """Close the shared async Bedrock client, if one was opened."""
+        async with self._aio_lock:
+            if self._aio_bedrock is not None:
+                await self._aio_bedrock.__aexit__(None, None, None)
+                self._aio_bedrock = None
+
     def generate_tweet_text(self, seed_text: str, cta_link: Optional[str] = None) -> str:
-        base = (seed_text or "").strip()
-        if cta_link:
-            text = f"{base[:240]} {cta_link}".strip()
-        else:
-            text = base[:280]
-        return text[:280]
+        return _fit_with_link((seed_text or "").strip(), cta_link, _TWEET_MAX_LEN)
 
     def generate_shorts_caption(self, script_text: str, cta_link: Optional[str] = None) -> str:
-        base = (script_text or "").strip()
-        caption = base[:160].strip()
-        if cta_link:
-            caption = (caption + "\n" + cta_link).strip()
-        return caption[:220]
+        return _fit_with_link(
+            (script_text or "").strip(), cta_link, _SHORTS_CAPTION_MAX_LEN, sep="\n", body_max=_SHORTS_CAPTION_BODY_LEN
+        )
 
 # Create a singleton instance
 ai_service = AIService()
\ No newline at end of file
@@ -0,0 +1,147 @@
+"""Pure text helpers for AI-generated copy: length fitting and deterministic fallbacks.
+
+Kept free of I/O and third-party imports so the module can be compiled in place
+with ``cythonize -i ai_text_utils.py``; the compiled extension is picked up by the
+same import with no code changes.
+"""
+import functools
+from typing import Dict, Optional
+
+# Character limits for generated social copy
+_TWEET_MAX_LEN = 280
+_VIDEO_CAPTION_MAX_LEN = 160
+_SHORTS_CAPTION_BODY_LEN = 160
+_SHORTS_CAPTION_MAX_LEN = 220
+
+
+def _fit_with_link(text: str, link: Optional[str], max_len: int, sep: str = " ", body_max: Optional[int] = None) -> str:
+    """Truncate text so that it, plus sep and the link (if not already present), fits in max_len.
+    body_max additionally caps the text before the link is considered.
+    """
+    if body_max is not None:
+        text = text[:body_max]
+    if not link or link in text:
+        return text[:max_len].rstrip()
+    body = text[:max(0, max_len - len(sep) - len(link))].rstrip()
+    return f"{body}{sep}{link}" if body else link[:max_len]
+
+
+_FALLBACK_LINK = "https://redacted.example.com"
+
+
+@functools.lru_cache(maxsize=64)
+def _platform_phrases(platform: str) -> tuple:
+    """Platform-only strings shared by the fallbacks, built once per platform.
+    Returns (standard CTA description, app hashtag description, format notes, platform hashtag).
+    """
+    return (
+        f"Standard CTA for {platform}",
+        f"App hashtag for {platform}",
+        f"Optimized for {platform} format",
+        f"#{platform}",
+    )
+
+
+@functools.lru_cache(maxsize=64)
+def _campaign_cta_template(platform: str) -> dict:
+    return {
+        "text": "Learn More",
+        "type": "link",
+        "platform": platform,
+        "description": _platform_phrases(platform)[0],
+    }
+
+
+def _fallback_offer(pain_point: str, persona: str = None) -> Dict[str, str]:
+    return {
+        "title": f"Free {pain_point.split()[0]} Assessment",
+        "description": f"Get a free assessment to solve your {pain_point.lower()} challenges",
+        "cta_text": "Get Free Assessment",
+        "link_url": _FALLBACK_LINK
+    }
+
+
+def _fallback_content_ideas(topic: str, platform: str = "LinkedIn") -> list:
+    return [
+        {
+            "title": f"5 Ways to Improve {topic}",
+            "description": f"Learn the top strategies for {topic.lower()}",
+            "talking_points": [f"Strategy 1 for {topic}", f"Strategy 2 for {topic}"],
+            "hashtags": [f"#{topic.replace(' ', '')}", "#MarketingTips"]
+        }
+    ]
+
+
+def _fallback_cta_variation(campaign_description: str, platform: str) -> dict:
+    standard_desc, hashtag_desc, _, _ = _platform_phrases(platform)
+    return {
+        "platform": platform,
+        "ctas": [
+            {
+                "text": "Learn More",
+                "type": "link",
+                "url": _FALLBACK_LINK,
+                "description": standard_desc
+            },
+            {
+                "text": f"#{campaign_description.replace(' ', '')}",
+                "type": "hashtag",
+                "description": hashtag_desc
+            }
+        ]
+    }
+
+
+def _fallback_campaign_strategy(campaign_name: str, objective: str, target_persona: str, platforms: list) -> dict:
+    return {
+        "campaign_name": campaign_name,
+        "objective": objective,
+        "target_persona": target_persona,
+        "platforms": platforms,
+        "content_strategy": {
+            "main_message": f"Campaign focused on {objective.lower()}",
+            "key_themes": ["Innovation", "Growth", "Success"],
+            "hashtags": [f"#{campaign_name.replace(' ', '')}", "#RedactedApp"]
+        },
+    }
+
+
+def _fallback_platform_content(campaign_name: str, platform: str) -> dict:
+    return {
+        "platform": platform,
+        "content_variations": [
+            {
+                "title": f"{campaign_name} on {platform}",
+                "content": f"Platform-specific content for {platform}",
+                "cta": "Learn More",
+                "hashtags": [_platform_phrases(platform)[3], "#RedactedApp"]
+            }
+        ]
+    }
+
+
+def _fallback_campaign_cta(platform: str) -> dict:
+    # Values are all strings, so a shallow copy keeps callers from mutating the template
+    return dict(_campaign_cta_template(platform))
+
+
+def _fallback_platform_variation(script_content: str, platform: str) -> dict:
+    return {
+        "platform": platform,
+        "content": f"{script_content[:100]}... (optimized for {platform})",
+        "character_count": len(script_content),
+        "format_notes": _platform_phrases(platform)[2],
+        "cta_suggestion": "Learn More"
+    }
+
+
+def _fallback_pain_point(title: str, description: str = None) -> str:
+    base = title.strip() or 'your current marketing'
+    return f"Struggling to get results from {base}"
+
+
+def _fallback_persona(title: str = None, description: str = None) -> dict:
+    return {
+        "title": "Content Manager",
+        "description": "Time-strapped content manager at a growing SMB seeking faster, consistent content that drives measurable results."
+    }
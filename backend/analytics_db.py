@@ -0,0 +1,130 @@
+# analytics_db.py
+
+import asyncio
+import itertools
+import os
+import re
+import threading
+from contextlib import contextmanager
+from typing import Optional
+
+from psycopg2.pool import PoolError, ThreadedConnectionPool
+
+from demo_flags import DB_TRANSACTION_POOLING, DEMO_MODE
+
+try:
+    import asyncpg
+except ImportError:  # analytics reads fall back to psycopg2 in the threadpool
+    asyncpg = None
+
+# Postgres connections one worker may hold, across both pools below; size it so that
+# workers x DB_POOL_MAX stays under the server's max_connections. The sync pool gets
+# the larger half (most handlers are sync), the async pool the rest when asyncpg is present.
+_DB_POOL_MAX = max(2, int(os.environ.get("DB_POOL_MAX", "20")))
+_SYNC_POOL_MAX = _DB_POOL_MAX - _DB_POOL_MAX // 2 if asyncpg is not None else _DB_POOL_MAX
+_POOL_MAX = _DB_POOL_MAX - _SYNC_POOL_MAX
+
+# Async pool for read-heavy handlers, so DB waits do not hold threadpool workers
+_POOL_MIN = min(1, _POOL_MAX)
+# Idle connections above min_size are closed after this long
+_POOL_MAX_INACTIVE_SECONDS = 600.0
+_pool: Optional["asyncpg.Pool"] = None
+_pool_lock = asyncio.Lock()
+
+# Sync pool for psycopg2 code (handlers and the campaign service), shared by the whole worker
+_SYNC_POOL_MIN = min(2, _SYNC_POOL_MAX)
+# How long a thread waits for a free connection before giving up
+_POOL_TIMEOUT_SECONDS = float(os.environ.get("DB_POOL_TIMEOUT", "30"))
+_sync_pool: Optional["BlockingConnectionPool"] = None
+_sync_pool_lock = threading.Lock()
+
+_PLACEHOLDER = re.compile(r"%[s%]")
+
+
+class BlockingConnectionPool(ThreadedConnectionPool):
+    """ThreadedConnectionPool whose getconn waits for a free connection (up to timeout
+    seconds) instead of raising PoolError as soon as every connection is checked out."""
+
+    def __init__(self, minconn: int, maxconn: int, *args, timeout: float = _POOL_TIMEOUT_SECONDS, **kwargs):
+        super().__init__(minconn, maxconn, *args, **kwargs)
+        self._slots = threading.BoundedSemaphore(maxconn)
+        self._timeout = timeout
+
+    def getconn(self, key=None):
+        if not self._slots.acquire(timeout=self._timeout):
+            raise PoolError(f"no database connection free after {self._timeout:g}s")
+        try:
+            return super().getconn(key)
+        except Exception:
+            self._slots.release()
+            raise
+
+    def putconn(self, conn=None, key=None, close=False):
+        try:
+            super().putconn(conn, key, close)
+        finally:
+            self._slots.release()
+
+
+async def get_async_pool() -> Optional["asyncpg.Pool"]:
+    """Return the shared asyncpg pool, creating it on first use (None if asyncpg is unavailable)."""
+    global _pool
+    if _pool is None and asyncpg is not None and not DEMO_MODE:
+        async with _pool_lock:
+            if _pool is None:
+                _pool = await asyncpg.create_pool(
+                    os.environ.get("DATABASE_URL", ""),
+                    min_size=_POOL_MIN,
+                    max_size=_POOL_MAX,
+                    max_inactive_connection_lifetime=_POOL_MAX_INACTIVE_SECONDS,
+                    # asyncpg's per-connection prepared statements do not survive transaction pooling
+                    statement_cache_size=0 if DB_TRANSACTION_POOLING else 100,
+                )
+    return _pool
+
+
+async def close_async_pool() -> None:
+    """Close the shared asyncpg pool, if one was opened."""
+    global _pool
+    if _pool is not None:
+        await _pool.close()
+        _pool = None
+
+
+def get_sync_pool() -> Optional[BlockingConnectionPool]:
+    """Return the shared psycopg2 pool, creating it on first use (None in demo mode)."""
+    global _sync_pool
+    if _sync_pool is None and not DEMO_MODE:
+        with _sync_pool_lock:
+            if _sync_pool is None:
+                _sync_pool = BlockingConnectionPool(
+                    _SYNC_POOL_MIN, _SYNC_POOL_MAX, os.environ.get("DATABASE_URL", "")
+                )
+    return _sync_pool
+
+
+@contextmanager
+def pooled_connection(pool: ThreadedConnectionPool):
+    """Borrow a connection from pool and hand it back on exit.
+
+    The pool rolls back any transaction the caller left open before reusing the connection.
+    """
+    conn = pool.getconn()
+    try:
+        yield conn
+    finally:
+        pool.putconn(conn)
+
+
+def close_sync_pool() -> None:
+    """Close every connection in the shared psycopg2 pool, if one was opened."""
+    global _sync_pool
+    if _sync_pool is not None:
+        _sync_pool.closeall()
+        _sync_pool = None
+
+
+def to_asyncpg_sql(sql: str) -> str:
+    """Rewrite psycopg2-style SQL (%s placeholders, %% literals) for asyncpg ($1..$n)."""
+    numbers = itertools.count(1)
+    return _PLACEHOLDER.sub(lambda m: "%" if m.group() == "%%" else f"${next(numbers)}", sql)
@@ -1,14 +1,20 @@
 from typing import Optional
 
-# Registry of platform capabilities used by the orchestration layer
-PLATFORM_CAPS = {
-    "twitter": {"content": ["tweet"]},
-    "shorts": {"content": ["shorts_caption", "video"]},
-}
+from platform_caps import PLATFORM_CAPS, SUPPORTED_PLATFORMS  # noqa: F401 (re-exported)
+
+
+def get_pool():
+    """Return the shared connection pool.
+    
+    
+    This function now returns None for API compatibility.
+    """
+    
+    return None
 
 
 def insert_campaign(
-    conn,
+    pool_or_conn,
     name: str,
     description: str,
     persona_id: int,
@@ -23,7 +29,7 @@ def insert_campaign(
     return 1  # Mock campaign ID
 
 def update_campaign_core(
-    conn,
+    pool_or_conn,
     campaign_id: int,
     *,
     offer_id: Optional[int],
@@ -39,15 +45,44 @@ def update_campaign_core(
     
     pass
 
-def attach_platform(conn, campaign_id: int, platform: str, enabled: bool = True) -> None:
+def attach_platform(pool_or_conn, campaign_id: int, platform: str, enabled: bool = True) -> None:
     """Attach a platform to the campaign if not already attached.
     
     
     """
+
+def create_campaign_bundle(
+    pool_or_conn,
+    name: str,
+    description: str,
+    persona_id: int,
+    *,
+    status: str = "draft",
+    tweet_text: Optional[str] = None,
+    tweet_source: str = "ai",
+    shorts_caption_text: Optional[str] = None,
+    shorts_caption_source: str = "ai",
+    shorts_video: bool = False,
+    heygen_note: Optional[str] = None,
+) -> dict:
+    """Insert a campaign and its initial content rows in a single round trip.
+    
+    
+    This function now returns mock IDs for API compatibility.
+    """
+    
+    return {
+        "campaign_id": 1,
+        "tweet_id": 1 if tweet_text else None,
+        "shorts_caption_id": 1 if shorts_caption_text else None,
+        "asset_id": 1 if heygen_note else None,
+        "shorts_video_id": 1 if shorts_video else None,
+    }
+
 # Content helpers
 
 def create_content_tweet(
-    conn,
+    pool_or_conn,
     campaign_id: int,
     text: str,
     source: str = "ai",
@@ -60,7 +95,7 @@ def create_content_tweet(
     return 1  # Mock content ID
 
 def create_content_shorts_caption(
-    conn,
+    pool_or_conn,
     campaign_id: int,
     text: str,
     source: str = "ai",
@@ -72,7 +107,7 @@ def create_content_shorts_caption(
     
     return 1  # Mock content ID
 
-def create_pending_heygen_asset(conn, campaign_id: int, note: str) -> int:
+def create_pending_heygen_asset(pool_or_conn, campaign_id: int, note: str) -> int:
     """Create a placeholder asset row compliant with current assets schema and return asset_id.
     
     
@@ -81,7 +116,7 @@ def create_pending_heygen_asset(conn, campaign_id: int, note: str) -> int:
     return 1  # Mock asset ID
 
 def create_content_shorts_video(
-    conn,
+    pool_or_conn,
     campaign_id: int,
     asset_id: Optional[int],
     source: str = "ai",
@@ -1,14 +1,49 @@
+import functools
+import re
+import weakref
+from contextlib import contextmanager
 from typing import Optional
 
-# Registry of platform capabilities used by the orchestration layer
-PLATFORM_CAPS = {
-    "twitter": {"content": ["tweet"]},
-    "shorts": {"content": ["shorts_caption", "video"]},
-}
+from psycopg2.pool import AbstractConnectionPool, ThreadedConnectionPool
+
+from analytics_db import get_sync_pool
+from demo_flags import DB_TRANSACTION_POOLING
+from platform_caps import PLATFORM_CAPS, SUPPORTED_PLATFORMS  # noqa: F401 (re-exported)
+
+# Objective recorded on orchestrated campaigns (see insert_campaign)
+CAMPAIGN_OBJECTIVE = "awareness"
+
+# Names of statements already PREPAREd on each connection (prepared statements are per session)
+_PREPARED: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+
+def get_pool() -> Optional[ThreadedConnectionPool]:
+    """Return the worker's shared connection pool (the one the API handlers use), so
+    helpers can run concurrently from worker threads without a pool of their own."""
+    return get_sync_pool()
+
+
+@contextmanager
+def _cursor(pool_or_conn):
+    """Yield a cursor from a connection or from a connection checked out of a pool.
+
+    Pool connections are committed (or rolled back on error) and returned on exit;
+    a caller-supplied connection is left for the caller to commit.
+    """
+    if isinstance(pool_or_conn, AbstractConnectionPool):
+        conn = pool_or_conn.getconn()
+        try:
+            with conn, conn.cursor() as cur:
+                yield cur
+        finally:
+            pool_or_conn.putconn(conn)
+    else:
+        with pool_or_conn.cursor() as cur:
+            yield cur
 
 
 def insert_campaign(
-    conn,
+    pool_or_conn,
     name: str,
     description: str,
     persona_id: int,
@@ -19,14 +54,13 @@ def insert_campaign(
     Note: Uses a fixed objective for now to keep this helper minimal. The
     orchestration determines the objective at a higher level.
     """
-    cur = conn.cursor()
-    campaign_id = cur.fetchone()[0]
-    cur.close()
+    with _cursor(pool_or_conn) as cur:
+        campaign_id = cur.fetchone()[0]
     return campaign_id
 
 
 def update_campaign_core(
-    conn,
+    pool_or_conn,
     campaign_id: int,
     *,
     offer_id: Optional[int],
@@ -37,70 +71,185 @@ def update_campaign_core(
 ) -> None:
     """Update core campaign relationships/fields.
 
-    This function does not commit. The caller controls the transaction.
+    This function does not commit a caller-supplied connection. The caller
+    controls the transaction.
     """
-    cur = conn.cursor()
-    cur.close()
+    with _cursor(pool_or_conn) as cur:
+        pass
 
 
-def attach_platform(conn, campaign_id: int, platform: str, enabled: bool = True) -> None:
+def attach_platform(pool_or_conn, campaign_id: int, platform: str, enabled: bool = True) -> None:
     """Attach a platform to the campaign if not already attached.
 
     Idempotent via ON CONFLICT DO NOTHING on the unique constraint.
     """
-    cur = conn.cursor()
-    cur.close()
+    with _cursor(pool_or_conn) as cur:
+        pass
+
+
+def create_campaign_bundle(
+    pool_or_conn,
+    name: str,
+    description: str,
+    persona_id: int,
+    *,
+    status: str = "draft",
+    tweet_text: Optional[str] = None,
+    tweet_source: str = "ai",
+    shorts_caption_text: Optional[str] = None,
+    shorts_caption_source: str = "ai",
+    shorts_video: bool = False,
+    heygen_note: Optional[str] = None,
+) -> dict:
+    """Insert a campaign and its initial content rows in a single round trip.
+
+    Chains data-modifying CTEs so the campaign, tweet, Shorts caption, placeholder
+    HeyGen asset and Shorts video are created by one execute/fetchone instead of one
+    INSERT per helper. Only the requested pieces are included, and each shape is
+    PREPAREd once per connection so later calls skip server-side parse/plan. Returns a dict with
+    campaign_id, tweet_id, shorts_caption_id, asset_id and shorts_video_id (None when
+    not created). A caller-supplied connection is not committed; passing the pool
+    runs the bundle in its own transaction.
+    """
+    args = [name, description, CAMPAIGN_OBJECTIVE, persona_id, status]
+    if tweet_text:
+        args += [tweet_text, tweet_source]
+    if shorts_caption_text:
+        args += [shorts_caption_text, shorts_caption_source]
+    if heygen_note:
+        args.append(heygen_note)
+    stmt, sql, keys = _bundle_statement(
+        bool(tweet_text), bool(shorts_caption_text), bool(heygen_note), bool(shorts_video)
+    )
+
+    with _cursor(pool_or_conn) as cur:
+        if DB_TRANSACTION_POOLING:
+            # A PREPAREd name would not exist on the next server session the pooler hands out
+            cur.execute(_inline_params(sql), args)
+        else:
+            prepared = _PREPARED.setdefault(cur.connection, set())
+            if stmt not in prepared:
+                cur.execute(f"PREPARE {stmt} AS {sql}")
+                prepared.add(stmt)
+            cur.execute(f"EXECUTE {stmt} ({', '.join(['%s'] * len(args))})", args)
+        row = cur.fetchone()
+
+    result = dict.fromkeys(("campaign_id", "tweet_id", "shorts_caption_id", "asset_id", "shorts_video_id"))
+    result.update(zip(keys, row))
+    return result
+
+
+@functools.lru_cache(maxsize=None)
+def _inline_params(sql: str) -> str:
+    """psycopg2 form of a bundle statement ($n placeholders appear once each, in order)."""
+    return re.sub(r"\$\d+", "%s", sql)
+
+
+@functools.lru_cache(maxsize=None)
+def _bundle_statement(tweet: bool, caption: bool, asset: bool, video: bool) -> tuple:
+    """Build the (statement name, SQL, result keys) for one bundle shape.
+
+    Placeholders are positional ($1, $2, ...) so the SQL can be PREPAREd once per
+    connection; the order matches the argument list built in create_campaign_bundle.
+    """
+    ctes = [
+        "c AS (INSERT INTO campaigns (name, description, objective, target_persona_id, status) "
+        "VALUES ($1, $2, $3, $4, $5) RETURNING campaign_id)"
+    ]
+    columns = ["c.campaign_id"]
+    sources = ["c"]
+    keys = ["campaign_id"]
+    n = 5
+
+    if tweet:
+        ctes.append(
+            "t AS (INSERT INTO campaign_content (campaign_id, platform, content_type, text, source) "
+            f"SELECT campaign_id, 'twitter', 'tweet', ${n + 1}, ${n + 2} FROM c RETURNING content_id)"
+        )
+        columns.append("t.content_id")
+        sources.append("t")
+        keys.append("tweet_id")
+        n += 2
+
+    if caption:
+        ctes.append(
+            "sc AS (INSERT INTO campaign_content (campaign_id, platform, content_type, text, source) "
+            f"SELECT campaign_id, 'shorts', 'shorts_caption', ${n + 1}, ${n + 2} FROM c RETURNING content_id)"
+        )
+        columns.append("sc.content_id")
+        sources.append("sc")
+        keys.append("shorts_caption_id")
+        n += 2
+
+    if asset:
+        ctes.append(
+            "a AS (INSERT INTO assets (type, url, description) "
+            f"VALUES ('video', 'pending://heygen', ${n + 1}) RETURNING asset_id)"
+        )
+        columns.append("a.asset_id")
+        sources.append("a")
+        keys.append("asset_id")
+        n += 1
+
+    if video:
+        asset_expr, asset_from = ("a.asset_id", "c, a") if asset else ("NULL", "c")
+        ctes.append(
+            "sv AS (INSERT INTO campaign_content (campaign_id, platform, content_type, asset_id, source) "
+            f"SELECT c.campaign_id, 'shorts', 'video', {asset_expr}, 'ai' FROM {asset_from} RETURNING content_id)"
+        )
+        columns.append("sv.content_id")
+        sources.append("sv")
+        keys.append("shorts_video_id")
+
+    stmt = "campaign_bundle_" + "".join("1" if flag else "0" for flag in (tweet, caption, asset, video))
+    sql = "WITH " + ", ".join(ctes) + " SELECT " + ", ".join(columns) + " FROM " + ", ".join(sources)
+    return stmt, sql, tuple(keys)
 
 
 # Content helpers
 
 def create_content_tweet(
-    conn,
+    pool_or_conn,
     campaign_id: int,
     text: str,
     source: str = "ai",
 ) -> int:
     """Create a tweet draft content row for the given campaign and return id."""
-    cur = conn.cursor()
-    content_id = cur.fetchone()[0]
-    cur.close()
+    with _cursor(pool_or_conn) as cur:
+        content_id = cur.fetchone()[0]
     return content_id
 
 
 def create_content_shorts_caption(
-    conn,
+    pool_or_conn,
     campaign_id: int,
     text: str,
     source: str = "ai",
 ) -> int:
     """Create a Shorts caption content row and return id."""
-    cur = conn.cursor()
-    content_id = cur.fetchone()[0]
-    cur.close()
+    with _cursor(pool_or_conn) as cur:
+        content_id = cur.fetchone()[0]
     return content_id
 
 
-def create_pending_heygen_asset(conn, campaign_id: int, note: str) -> int:
+def create_pending_heygen_asset(pool_or_conn, campaign_id: int, note: str) -> int:
     """Create a placeholder asset row compliant with current assets schema and return asset_id.
 
     Note: Current schema requires (type, url). We'll store a descriptive note and a dummy url.
     Prefer deferring real asset creation to webhook completion where we have the real URL.
     """
-    cur = conn.cursor()
-    asset_id = cur.fetchone()[0]
-    cur.close()
+    with _cursor(pool_or_conn) as cur:
+        asset_id = cur.fetchone()[0]
     return asset_id
 
 
 def create_content_shorts_video(
-    conn,
+    pool_or_conn,
     campaign_id: int,
     asset_id: Optional[int],
     source: str = "ai",
 ) -> int:
     """Create a Shorts video content row referencing an optional asset and return id."""
-    cur = conn.cursor()
-
-    content_id = cur.fetchone()[0]
-    cur.close()
+    with _cursor(pool_or_conn) as cur:
+        content_id = cur.fetchone()[0]
     return content_id 
\ No newline at end of file
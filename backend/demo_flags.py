@@ -1,4 +1,8 @@
 import os
 
 # Global demo flag to gate external effects
-DEMO_MODE = os.getenv("DEMO_MODE", "0") == "1" 
\ No newline at end of file
+DEMO_MODE = os.getenv("DEMO_MODE", "0") == "1"
+
+# Set when DATABASE_URL points at a transaction-mode pooler (e.g. PgBouncer): consecutive
+# transactions may land on different server sessions, so nothing session-scoped is reused
+DB_TRANSACTION_POOLING = os.getenv("DB_TRANSACTION_POOLING", "0") == "1"
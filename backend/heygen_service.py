@@ -1,99 +1,317 @@
 # heygen_service.py
 
+import asyncio
 import requests
 import json
 import logging
+import os
+import threading
+import time
+from typing import IO, Dict
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from demo_flags import DEMO_MODE
 
+try:
+    import orjson
+except ImportError:  # stdlib fallback when orjson is not installed
+    orjson = None
+
+try:
+    from requests_toolbelt.multipart.encoder import MultipartEncoder
+except ImportError:  # requests builds the multipart body in memory instead
+    MultipartEncoder = None
+
 logger = logging.getLogger(__name__)
 
+# Seconds to serve voice/avatar/template listings from memory before refetching
+CATALOG_TTL_SECONDS = float(os.environ.get("HEYGEN_CATALOG_TTL", "300"))
+
+# JSON request bodies are serialized up front (orjson when available) and sent as raw bytes
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def _json_body(payload) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload, separators=(",", ":")).encode()
+
+
+# Upstream statuses retried with exponential backoff (sync: urllib3 Retry; async: _apost)
+RETRY_STATUSES = frozenset({500, 502, 503, 504})
+RETRY_TOTAL = 3
+RETRY_BACKOFF_FACTOR = 1.0
+
+# Read size when streaming an upload body from a file object
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
+# Photo upload paths on upload_base_url: the asset endpoint, and the talking-photo
+# endpoint used when the asset endpoint is unavailable
+PHOTO_UPLOAD_PATHS = ("/v1/asset", "/v1/talking_photo")
+
+# Photo avatar group creation path, and the older path tried when it 404s
+AVATAR_GROUP_CREATE_PATHS = ("/photo_avatar/avatar_group/create", "/photo_avatar/create")
+
+# Minimum seconds between upstream training-status polls for one group; steps up
+# while the status is unchanged and resets when it changes
+TRAINING_POLL_BACKOFF = (5.0, 30.0, 120.0)
+
+# Training statuses that will not change again; their poll entries are dropped
+TRAINING_TERMINAL_STATUSES = frozenset({"ready", "completed", "failed"})
+
+
+def webhook_url_from_env():
+    """Resolve the public /webhooks/heygen URL from HEYGEN_WEBHOOK_URL or PUBLIC_URL.
+    Returns None when neither is configured.
+    """
+    explicit = os.environ.get("HEYGEN_WEBHOOK_URL")
+    if explicit:
+        # Normalize to /webhooks/heygen
+        if explicit.endswith("/webhooks"):
+            return explicit + "/heygen"
+        if explicit.endswith("/webhooks/"):
+            return explicit + "heygen"
+        return explicit
+    public_base = os.environ.get("PUBLIC_URL")
+    if public_base:
+        return f"{public_base.rstrip('/')}/webhooks/heygen"
+    return None
+
+# Learned endpoint variants are persisted here so a restart does not re-probe; the default
+# lives in the app's own cache directory, not the shared temp dir
+ENDPOINT_CACHE_PATH = os.environ.get("HEYGEN_ENDPOINT_CACHE") or os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"), "sgtma", "heygen_endpoints.json"
+)
+
+# The only values each learned endpoint key may take; anything else in the file is ignored
+ENDPOINT_VARIANTS = {
+    "avatar_group_create": frozenset(AVATAR_GROUP_CREATE_PATHS),
+    "photo_upload": frozenset({"talking_photo"}),
+}
+
+
+def _load_endpoint_cache() -> Dict[str, str]:
+    try:
+        with open(ENDPOINT_CACHE_PATH) as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict):
+        return {}
+    return {k: v for k, v in data.items() if v in ENDPOINT_VARIANTS.get(k, ())}
+
+
 class HeyGenService:
+    # Endpoint variants learned when a fallback path succeeds after a 404; they do not change for a deployment, so
+    # later calls skip the failed probe. Keys: "avatar_group_create", "photo_upload".
+    _endpoint_cache: Dict[str, str] = _load_endpoint_cache()
+
     def __init__(self, api_key):
+        # Bound once so each method's demo check is an attribute read, not a module-global lookup
+        self._demo = DEMO_MODE
         self.api_key = "REDACTED" if DEMO_MODE else api_key
         self.base_url = "https://redacted.example.com"
+        # Photo uploads go to a separate host
+        self.upload_base_url = "https://redacted.example.com"
+        # One keep-alive session for all HeyGen calls; urllib3 retries 5xx and
+        # network errors with exponential backoff (raise_on_status=False hands the
+        # last response back so raise_for_status reports it as before).
+        retry = Retry(
+            total=RETRY_TOTAL,
+            backoff_factor=RETRY_BACKOFF_FACTOR,
+            status_forcelist=RETRY_STATUSES,
+            allowed_methods=frozenset(["GET", "POST"]),
+            raise_on_status=False,
+            respect_retry_after_header=True,
+        )
+        self._session = requests.Session()
+        # Uploads and API calls get their own adapters (the longest matching prefix wins), so a
+        # burst of uploads cannot evict the API's keep-alive connections or vice versa. The upload
+        # adapter is mounted on the full upload URLs so the prefixes stay distinct even when both
+        # base URLs share a host.
+        self._session.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=50, max_retries=retry))
+        self._session.mount(f"{self.base_url}/", HTTPAdapter(pool_connections=1, pool_maxsize=50, max_retries=retry))
+        # Upload bodies are streamed (MultipartEncoder / file object) and cannot be rewound by
+        # urllib3, so POSTs there are never retried on status or read errors; the talking-photo
+        # fallback in upload_photo re-sends from a seek instead
+        upload_retry = Retry(
+            total=RETRY_TOTAL,
+            backoff_factor=RETRY_BACKOFF_FACTOR,
+            status_forcelist=RETRY_STATUSES,
+            allowed_methods=frozenset(["GET"]),
+            raise_on_status=False,
+            respect_retry_after_header=True,
+        )
+        upload_adapter = HTTPAdapter(pool_connections=1, pool_maxsize=10, max_retries=upload_retry)
+        for path in PHOTO_UPLOAD_PATHS:
+            self._session.mount(f"{self.upload_base_url}{path}", upload_adapter)
+        # Auth header built once and shared by the sync session and the async client.
+        # Content-Type is left to each request (JSON_HEADERS) so multipart uploads are not overridden
+        self._auth_headers = {"X-Api-Key": self.api_key}
+        self._session.headers.update(self._auth_headers)
+        # Async client for async FastAPI handlers is created lazily and kept for the process lifetime
+        self._aclient = None
+        # Catalog listings cache: key -> (fetched_at, data); handlers may run in the threadpool
+        self._cache = {}
+        self._cache_lock = threading.Lock()
+        # Training status polls: group_id -> (next_poll_at, backoff_step, last_result); entries
+        # are dropped once the status is terminal
+        self._training_polls = {}
+
+    def _learn_endpoint(self, key: str, value: str):
+        """Record a learned endpoint variant and persist it (best effort).
+        Callers only learn from 2xx responses.
+        """
+        if self._endpoint_cache.get(key) == value or value not in ENDPOINT_VARIANTS.get(key, ()):
+            return
+        self._endpoint_cache[key] = value
+        tmp_path = f"{ENDPOINT_CACHE_PATH}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(ENDPOINT_CACHE_PATH), mode=0o700, exist_ok=True)
+            with open(tmp_path, "w") as f:
+                json.dump(self._endpoint_cache, f)
+            os.replace(tmp_path, ENDPOINT_CACHE_PATH)
+        except OSError as e:
+            logger.warning("Could not persist HeyGen endpoint cache: %s", e)
+
+    def close(self):
+        """Close the pooled HTTP session."""
+        self._session.close()
+
+    def _cache_get(self, key):
+        with self._cache_lock:
+            entry = self._cache.get(key)
+        if entry is not None and time.monotonic() - entry[0] < CATALOG_TTL_SECONDS:
+            return entry[1]
+        return None
+
+    def _cache_put(self, key, data):
+        with self._cache_lock:
+            self._cache[key] = (time.monotonic(), data)
+        return data
+
+    def invalidate(self, key=None):
+        """Drop a cached listing ("voices", "avatars", "templates"), or all of them."""
+        with self._cache_lock:
+            if key is None:
+                self._cache.clear()
+            else:
+                self._cache.pop(key, None)
 
     def list_voices(self):
         """Get all available voices including custom ones"""
-        if DEMO_MODE:
+        if self._demo:
             return {"data": {"voices": []}}
+        cached = self._cache_get("voices")
+        if cached is not None:
+            return cached
         try:
-            response = requests.get(f"{self.base_url}/voices", headers=self._headers())
+            response = self._session.get(f"{self.base_url}/voices")
             response.raise_for_status()
             data = response.json()
-            logger.info(f"Listed {len(data.get('data', {}).get('voices', []))} voices")
-            return data
+            logger.info("Listed %d voices", len((data.get("data") or {}).get("voices", ())))
+            return self._cache_put("voices", data)
         except Exception as e:
             logger.error(f"Error listing voices: {str(e)}")
             return {"error": str(e), "data": {"voices": []}}
 
     def list_avatars(self):
         """Get all available avatars including custom ones"""
-        if DEMO_MODE:
+        if self._demo:
             return {"data": {"avatars": [], "talking_photos": []}}
+        cached = self._cache_get("avatars")
+        if cached is not None:
+            return cached
         try:
-            response = requests.get(f"{self.base_url}/avatars", headers=self._headers())
+            response = self._session.get(f"{self.base_url}/avatars")
             response.raise_for_status()
             data = response.json()
-            logger.info(f"Listed {len(data.get('data', {}).get('avatars', []))} avatars")
-            logger.info(f"Listed {len(data.get('data', {}).get('talking_photos', []))} talking photos")
-            return data
+            listing = data.get("data") or {}
+            logger.info(
+                "Listed %d avatars and %d talking photos",
+                len(listing.get("avatars", ())),
+                len(listing.get("talking_photos", ())),
+            )
+            return self._cache_put("avatars", data)
         except Exception as e:
             logger.error(f"Error listing avatars: {str(e)}")
             return {"error": str(e), "data": {"avatars": [], "talking_photos": []}}
 
     def get_avatar(self, avatar_id):
         """Get specific avatar details"""
-        if DEMO_MODE:
+        if self._demo:
             return {"data": {}}
-        response = requests.get(f"{self.base_url}/avatars/{avatar_id}", headers=self._headers())
+        response = self._session.get(f"{self.base_url}/avatars/{avatar_id}")
         response.raise_for_status()
         return response.json()
 
     def get_voice(self, voice_id):
         """Get specific voice details"""
-        if DEMO_MODE:
+        if self._demo:
             return {"data": {}}
-        response = requests.get(f"{self.base_url}/voices/{voice_id}", headers=self._headers())
+        response = self._session.get(f"{self.base_url}/voices/{voice_id}")
         response.raise_for_status()
         return response.json()
 
     def generate_video(self, data):
         """Generate video with HeyGen"""
-        if DEMO_MODE:
+        if self._demo:
             raise RuntimeError("HeyGen write operations disabled in demo.")
-        import time
-        max_retries = 3
+        payload = self._video_payload(data)
+
+        # Server errors and network failures are retried by the session's adapter
+        try:
+            logger.info("Generating video")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Video payload: %s", _json_body(payload).decode())
+            response = self._session.post(f"{self.base_url}/video/generate", data=_json_body(payload), headers=JSON_HEADERS)
+            # Raise for 4xx/5xx
+            response.raise_for_status()
+            result = response.json()
+            logger.info(
+                "Video generation started id=%s error=%s",
+                (result.get("data") or {}).get("video_id"), result.get("error"),
+            )
+            return result
+        except Exception as e:
+            logger.error(f"Error generating video: {str(e)}")
+            raise
+
+    def _video_payload(self, data):
+        """Build the /video/generate request body from the caller's video data"""
         # Construct payload
         # Check if using free tier (test mode required for free plan)
         is_free_tier = data.get("free_tier", True)
         
-        # Check if this is a talking photo
         avatar_id = data.get("avatar_id")
-        is_talking_photo = data.get("is_talking_photo", False) or (
-            avatar_id and avatar_id.startswith("talking_photo_") 
+        is_talking_photo = bool(data.get("is_talking_photo")) or (
+            isinstance(avatar_id, str) and avatar_id.startswith("talking_photo_")
         )
-        
-        # Build character/avatar config based on type
-        video_input = {}
+
+        # Image URL, color value, or default white
+        bg = data.get("background")
+        if not bg:
+            background = {"type": "color", "value": "#FFFFFF"}
+        elif bg.startswith("http"):
+            background = {"type": "image", "source": {"type": "url", "url": bg}}
+        else:
+            background = {"type": "color", "value": bg}
+
         if is_talking_photo:
-            video_input["character"] = {
-                "type": "talking_photo",
-                "talking_photo_id": avatar_id
-            }
+            character_key, character = "character", {"type": "talking_photo", "talking_photo_id": avatar_id}
         else:
-            video_input["avatar"] = {
-                "avatar_id": avatar_id,
-                "avatar_style": data.get("avatar_style", "normal")
-            }
-        
-        video_input["voice"] = {
-            "type": "text",
-            "voice_id": data.get("voice_id"),
-            "input_text": data.get("input_text", "")
-        }
-        
+            character_key, character = "avatar", {"avatar_id": avatar_id, "avatar_style": data.get("avatar_style", "normal")}
+
         payload = {
-            "video_inputs": [video_input],
+            "video_inputs": [{
+                character_key: character,
+                "voice": {
+                    "type": "text",
+                    "voice_id": data.get("voice_id"),
+                    "input_text": data.get("input_text", "")
+                },
+                "background": background,
+            }],
             # CRITICAL: Set test=true for free tier to avoid resolution errors
             "test": data.get("test", is_free_tier),
             "caption": data.get("caption", False)
@@ -106,66 +324,25 @@ class HeyGenService:
                 "height": 360
             }
 
-        # Add background if provided
-        bg = data.get("background")
-        if bg:
-            if bg.startswith("http"):
-                # Image background
-                payload["video_inputs"][0]["background"] = {
-                    "type": "image",
-                    "source": {"type": "url", "url": bg}
-                }
-            else:
-                # Color background
-                payload["video_inputs"][0]["background"] = {"type": "color", "value": bg}
-        else:
-            # Default to white
-            payload["video_inputs"][0]["background"] = {"type": "color", "value": "#FFFFFF"}
-
-        # Add webhook URL if provided
-        if data.get("webhook_url"):
-            payload["webhook_url"] = data["webhook_url"]
-
-        # Retry on failures (HTTP 5xx or network issues)
-        for attempt in range(max_retries):
-            try:
-                logger.info(f"Generating video (attempt {attempt+1}) with payload: {json.dumps(payload, indent=2)}")
-                response = requests.post(f"{self.base_url}/video/generate", json=payload, headers=self._headers())
-                # Raise for 4xx/5xx
-                response.raise_for_status()
-                result = response.json()
-                logger.info(f"Video generation started: {result}")
-                return result
-            except requests.exceptions.HTTPError as e:
-                status = e.response.status_code if e.response is not None else None
-                # Retry on server errors
-                if status and status >= 500 and attempt < max_retries - 1:
-                    logger.warning(f"HeyGen API server error {status}, retrying after backoff...")
-                    time.sleep(2 ** attempt)
-                    continue
-                logger.error(f"Error generating video: {str(e)}")
-                raise
-            except Exception as e:
-                # Network or other error
-                if attempt < max_retries - 1:
-                    logger.warning(f"Network error during video generation: {e}, retrying... ")
-                    time.sleep(2 ** attempt)
-                    continue
-                logger.error(f"Error generating video: {str(e)}")
-                raise
+        # Status is pushed to our webhook; fall back to the configured one when not provided
+        webhook_url = data.get("webhook_url") or webhook_url_from_env()
+        if webhook_url:
+            payload["webhook_url"] = webhook_url
+
+        return payload
 
     def get_video_status(self, video_id):
         """Get video generation status"""
-        if DEMO_MODE:
+        if self._demo:
             return {"status": "unknown", "message": "Use webhook for status updates"}
         # Note: HeyGen v2 doesn't seem to have a direct status endpoint
         # Status is typically delivered via webhook
-        logger.warning(f"Video status endpoint not available for video_id: {video_id}")
+        logger.warning("Video status endpoint not available for video_id: %s", video_id)
         return {"status": "unknown", "message": "Use webhook for status updates"}
 
     def create_talking_photo_avatar(self, avatar_data):
         """Create a talking photo avatar"""
-        if DEMO_MODE:
+        if self._demo:
             raise RuntimeError("HeyGen write operations disabled in demo.")
         # Note: The talking photo creation endpoint seems to be removed in v2
         # Talking photos are pre-made and listed in the avatars response
@@ -174,15 +351,18 @@ class HeyGenService:
 
     def list_templates(self):
         """Get available video templates"""
-        if DEMO_MODE:
+        if self._demo:
             return {"data": {"templates": []}}
+        cached = self._cache_get("templates")
+        if cached is not None:
+            return cached
         try:
-            response = requests.get(f"{self.base_url}/templates", headers=self._headers())
+            response = self._session.get(f"{self.base_url}/templates")
             if response.status_code == 404:
                 logger.info("Templates endpoint not available")
-                return {"data": {"templates": []}}
+                return self._cache_put("templates", {"data": {"templates": []}})
             response.raise_for_status()
-            return response.json()
+            return self._cache_put("templates", response.json())
         except Exception as e:
             logger.error(f"Error listing templates: {str(e)}")
             return {"error": str(e), "data": {"templates": []}}
@@ -191,58 +371,71 @@ class HeyGenService:
         """Start training a photo avatar group.
         Expected data keys: group_id
         """
-        if DEMO_MODE:
+        if self._demo:
             raise RuntimeError("HeyGen write operations disabled in demo.")
         payload = {
             "group_id": data.get("group_id")
         }
         try:
-            logger.info(f"Starting photo avatar group training with payload: {json.dumps(payload, indent=2)}")
-            response = requests.post(f"{self.base_url}/photo_avatar/train", json=payload, headers=self._headers())
+            logger.info("Starting photo avatar group training for group %s", payload["group_id"])
+            response = self._session.post(f"{self.base_url}/photo_avatar/train", data=_json_body(payload), headers=JSON_HEADERS)
             response.raise_for_status()
+            self.invalidate("avatars")
             return response.json()
         except requests.exceptions.HTTPError as e:
             logger.error(f"HeyGen photo avatar training HTTP error: {e}")
             if hasattr(e, 'response') and e.response is not None:
-                logger.error(f"Response content: {e.response.text}")
+                logger.error("Response content: %s", e.response.text)
             raise
         except Exception as e:
             logger.error(f"HeyGen photo avatar training error: {e}")
             raise
 
-    def upload_photo(self, image_data: bytes, content_type: str = "image/jpeg") -> dict:
+    def upload_photo(self, image_stream: IO[bytes], content_type: str = "image/jpeg") -> dict:
         """Upload a photo to HeyGen and get an image_key for avatar creation.
+        image_stream (e.g. UploadFile.file) is streamed rather than loaded into memory.
         Returns: {"image_key": "image/xxx/original", "image_url": "https://redacted.example.com"}
         """
-        if DEMO_MODE:
+        if self._demo:
             raise RuntimeError("HeyGen write operations disabled in demo.")
         try:
-            logger.info(f"Uploading photo to HeyGen ({len(image_data)} bytes, type: {content_type})")
-            headers = {
-                "X-Api-Key": self.api_key,
-                "Content-Type": content_type
-            }
-            # Try the standard upload endpoint first
-            upload_url = "https://redacted.example.com"
-            try:
-                response = requests.post(upload_url, files={'file': ('photo.jpg', image_data, content_type)}, headers={"X-Api-Key": self.api_key})
-                if response.status_code == 200:
-                    result = response.json()
-                    if result.get("code") == 100 and result.get("data"):
-                        return {
-                            "image_key": result["data"].get("url") or result["data"].get("key"),
-                            "image_url": result["data"].get("url")
-                        }
-            except Exception as e:
-                logger.warning(f"Standard upload failed, trying talking photo: {e}")
-            
+            logger.info("Uploading photo to HeyGen (type: %s)", content_type)
+            headers = {"Content-Type": content_type}
+            start = image_stream.tell()
+            # Try the standard upload endpoint first, unless it is known to be unavailable
+            standard_missing = False
+            if self._endpoint_cache.get("photo_upload") != "talking_photo":
+                upload_url = f"{self.upload_base_url}{PHOTO_UPLOAD_PATHS[0]}"
+                try:
+                    if MultipartEncoder is not None:
+                        encoder = MultipartEncoder(fields={'file': ('photo.jpg', image_stream, content_type)})
+                        response = self._session.post(upload_url, data=encoder, headers={"Content-Type": encoder.content_type})
+                    else:
+                        response = self._session.post(upload_url, files={'file': ('photo.jpg', image_stream, content_type)})
+                    if response.status_code == 404:
+                        standard_missing = True
+                    elif response.status_code == 200:
+                        result = response.json()
+                        if result.get("code") == 100 and result.get("data"):
+                            return {
+                                "image_key": result["data"].get("url") or result["data"].get("key"),
+                                "image_url": result["data"].get("url")
+                            }
+                except Exception as e:
+                    logger.warning(f"Standard upload failed, trying talking photo: {e}")
+
             # Fallback to talking photo endpoint
-            upload_url = "https://redacted.example.com"
-            response = requests.post(upload_url, data=image_data, headers=headers)
+            upload_url = f"{self.upload_base_url}{PHOTO_UPLOAD_PATHS[1]}"
+            image_stream.seek(start)
+            response = self._session.post(upload_url, data=image_stream, headers=headers)
             response.raise_for_status()
+            if standard_missing:
+                self._learn_endpoint("photo_upload", "talking_photo")
             result = response.json()
             # Extract image key from response
             if result.get("code") == 100 and result.get("data"):
+                # A new talking photo shows up in the avatars listing
+                self.invalidate("avatars")
                 data = result["data"]
                 # Convert talking_photo response to image_key format
                 return {
@@ -260,21 +453,23 @@ class HeyGenService:
         """Generate photo avatar photos from an uploaded image.
         This might be required before creating a photo avatar group.
         """
-        if DEMO_MODE:
+        if self._demo:
             raise RuntimeError("HeyGen write operations disabled in demo.")
         payload = {
             "image_url": image_url
         }
         try:
-            logger.info(f"Generating photo avatar photos from: {image_url}")
-            response = requests.post(
+            logger.info("Generating photo avatar photos from: %s", image_url)
+            response = self._session.post(
                 f"{self.base_url}/photo_avatar/photo/generate",
-                json=payload,
-                headers=self._headers()
+                data=_json_body(payload),
+                headers=JSON_HEADERS
             )
             response.raise_for_status()
             result = response.json()
-            logger.info(f"Photo generation response: {result}")
+            logger.info("Photo generation response code=%s", result.get("code"))
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Photo generation response: %r", result)
             return result
         except Exception as e:
             logger.error(f"Photo generation error: {e}")
@@ -284,57 +479,317 @@ class HeyGenService:
         """Create a photo avatar group with an uploaded image.
         Returns: {"group_id": "xxx", "id": "xxx", ...}
         """
-        if DEMO_MODE:
+        if self._demo:
             raise RuntimeError("HeyGen write operations disabled in demo.")
         payload = {
             "name": name,
             "image_key": image_key
         }
         try:
-            logger.info(f"Creating photo avatar group: {name} with image_key: {image_key}")
-            response = requests.post(
-                f"{self.base_url}/photo_avatar/avatar_group/create", 
-                json=payload, 
-                headers=self._headers()
-            )
-            if response.status_code == 404:
+            logger.info("Creating photo avatar group: %s with image_key: %s", name, image_key)
+            path = self._endpoint_cache.get("avatar_group_create", AVATAR_GROUP_CREATE_PATHS[0])
+            response = self._session.post(f"{self.base_url}{path}", data=_json_body(payload), headers=JSON_HEADERS)
+            if response.status_code == 404 and path != AVATAR_GROUP_CREATE_PATHS[1]:
                 # Try without avatar_group in path
                 logger.info("Trying alternate endpoint without avatar_group")
-                response = requests.post(
-                    f"{self.base_url}/photo_avatar/create", 
-                    json=payload, 
-                    headers=self._headers()
-                )
+                path = AVATAR_GROUP_CREATE_PATHS[1]
+                response = self._session.post(f"{self.base_url}{path}", data=_json_body(payload), headers=JSON_HEADERS)
+            if 200 <= response.status_code < 300:
+                self._learn_endpoint("avatar_group_create", path)
             response.raise_for_status()
             result = response.json()
-            logger.info(f"Create photo avatar group response: {result}")
+            self.invalidate("avatars")
+            group = result.get("data") or {}
+            logger.info("Created photo avatar group id=%s", group.get("group_id") or group.get("id"))
             return result
         except requests.exceptions.HTTPError as e:
             logger.error(f"Photo avatar group creation HTTP error: {e}")
             if hasattr(e, 'response') and e.response is not None:
-                logger.error(f"Response content: {e.response.text}")
+                logger.error("Response content: %s", e.response.text)
             raise
         except Exception as e:
             logger.error(f"Photo avatar group creation error: {e}")
             raise
 
     def get_training_status(self, group_id: str) -> dict:
-        """Get the training status of a photo avatar group."""
-        if DEMO_MODE:
+        """Get the training status of a photo avatar group.
+        Repeated polls inside the backoff window (see TRAINING_POLL_BACKOFF) get the last result
+        instead of another upstream request.
+        """
+        if self._demo:
             return {"status": "unknown"}
+        now = time.monotonic()
+        with self._cache_lock:
+            entry = self._training_polls.get(group_id)
+        if entry is not None and now < entry[0]:
+            return entry[2]
         try:
-            response = requests.get(
-                f"{self.base_url}/photo_avatar/train/status/{group_id}",
-                headers=self._headers()
+            response = self._session.get(
+                f"{self.base_url}/photo_avatar/train/status/{group_id}"
             )
             response.raise_for_status()
-            return response.json()
+            result = response.json()
         except Exception as e:
             logger.error(f"Error getting training status: {e}")
             raise
+        if ((result or {}).get("data") or {}).get("status") in TRAINING_TERMINAL_STATUSES:
+            with self._cache_lock:
+                self._training_polls.pop(group_id, None)
+            return result
+        step = 0
+        if entry is not None and entry[2] == result:
+            step = min(entry[1] + 1, len(TRAINING_POLL_BACKOFF) - 1)
+        with self._cache_lock:
+            self._training_polls[group_id] = (now + TRAINING_POLL_BACKOFF[step], step, result)
+        return result
+
+    # ------------------------------------------------------------------
+    # Async variants (httpx) for async FastAPI handlers, so HeyGen round
+    # trips do not block the event loop
+    # ------------------------------------------------------------------
+
+    def _get_aclient(self):
+        """Return the shared httpx.AsyncClient, creating it on first use."""
+        if self._aclient is None:
+            import httpx
+            self._aclient = httpx.AsyncClient(
+                base_url=self.base_url,
+                headers=self._auth_headers,
+                timeout=30.0,
+                # Connection failures are retried by the transport
+                transport=httpx.AsyncHTTPTransport(
+                    retries=3,
+                    limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+                ),
+            )
+        return self._aclient
+
+    async def aclose(self):
+        """Close the shared async HTTP client, if one was opened."""
+        if self._aclient is not None:
+            await self._aclient.aclose()
+            self._aclient = None
+
+    async def _apost(self, url, **kwargs):
+        """POST on the async client, retrying RETRY_STATUSES with non-blocking backoff.
+
+        The last response is returned either way so raise_for_status reports it.
+        """
+        client = self._get_aclient()
+        for attempt in range(RETRY_TOTAL + 1):
+            response = await client.post(url, **kwargs)
+            if response.status_code not in RETRY_STATUSES or attempt == RETRY_TOTAL:
+                return response
+            retry_after = response.headers.get("Retry-After")
+            delay = float(retry_after) if retry_after and retry_after.isdigit() else RETRY_BACKOFF_FACTOR * (2 ** attempt)
+            logger.warning("HeyGen POST %s returned %d, retrying in %.1fs", url, response.status_code, delay)
+            await asyncio.sleep(delay)
 
-    def _headers(self):
-        return {
-            "X-Api-Key": self.api_key,
-            "Content-Type": "application/json"
+    async def a_list_voices(self):
+        """Async variant of list_voices"""
+        if self._demo:
+            return {"data": {"voices": []}}
+        cached = self._cache_get("voices")
+        if cached is not None:
+            return cached
+        try:
+            response = await self._get_aclient().get("/voices")
+            response.raise_for_status()
+            data = response.json()
+            logger.info("Listed %d voices", len((data.get("data") or {}).get("voices", ())))
+            return self._cache_put("voices", data)
+        except Exception as e:
+            logger.error(f"Error listing voices: {str(e)}")
+            return {"error": str(e), "data": {"voices": []}}
+
+    async def a_list_avatars(self):
+        """Async variant of list_avatars"""
+        if self._demo:
+            return {"data": {"avatars": [], "talking_photos": []}}
+        cached = self._cache_get("avatars")
+        if cached is not None:
+            return cached
+        try:
+            response = await self._get_aclient().get("/avatars")
+            response.raise_for_status()
+            data = response.json()
+            listing = data.get("data") or {}
+            logger.info(
+                "Listed %d avatars and %d talking photos",
+                len(listing.get("avatars", ())),
+                len(listing.get("talking_photos", ())),
+            )
+            return self._cache_put("avatars", data)
+        except Exception as e:
+            logger.error(f"Error listing avatars: {str(e)}")
+            return {"error": str(e), "data": {"avatars": [], "talking_photos": []}}
+
+    async def a_list_templates(self):
+        """Async variant of list_templates"""
+        if self._demo:
+            return {"data": {"templates": []}}
+        cached = self._cache_get("templates")
+        if cached is not None:
+            return cached
+        try:
+            response = await self._get_aclient().get("/templates")
+            if response.status_code == 404:
+                logger.info("Templates endpoint not available")
+                return self._cache_put("templates", {"data": {"templates": []}})
+            response.raise_for_status()
+            return self._cache_put("templates", response.json())
+        except Exception as e:
+            logger.error(f"Error listing templates: {str(e)}")
+            return {"error": str(e), "data": {"templates": []}}
+
+    async def bootstrap(self):
+        """Fetch the voice, avatar and template catalogs concurrently.
+        Returns {"voices": ..., "avatars": ..., "templates": ...} with each list call's response.
+        """
+        voices, avatars, templates = await asyncio.gather(
+            self.a_list_voices(), self.a_list_avatars(), self.a_list_templates()
+        )
+        return {"voices": voices, "avatars": avatars, "templates": templates}
+
+    async def a_generate_video(self, data):
+        """Async variant of generate_video"""
+        if self._demo:
+            raise RuntimeError("HeyGen write operations disabled in demo.")
+        payload = self._video_payload(data)
+        try:
+            logger.info("Generating video")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Video payload: %s", _json_body(payload).decode())
+            response = await self._apost("/video/generate", content=_json_body(payload), headers=JSON_HEADERS)
+            response.raise_for_status()
+            result = response.json()
+            logger.info(
+                "Video generation started id=%s error=%s",
+                (result.get("data") or {}).get("video_id"), result.get("error"),
+            )
+            return result
+        except Exception as e:
+            logger.error(f"Error generating video: {str(e)}")
+            raise
+
+    async def a_train_avatar(self, data: dict) -> dict:
+        """Async variant of train_avatar"""
+        if self._demo:
+            raise RuntimeError("HeyGen write operations disabled in demo.")
+        payload = {
+            "group_id": data.get("group_id")
+        }
+        try:
+            logger.info("Starting photo avatar group training for group %s", payload["group_id"])
+            response = await self._get_aclient().post("/photo_avatar/train", content=_json_body(payload), headers=JSON_HEADERS)
+            response.raise_for_status()
+            self.invalidate("avatars")
+            return response.json()
+        except Exception as e:
+            logger.error(f"HeyGen photo avatar training error: {e}")
+            raise
+
+    async def a_upload_photo(self, image_stream: IO[bytes], content_type: str = "image/jpeg") -> dict:
+        """Async variant of upload_photo"""
+        if self._demo:
+            raise RuntimeError("HeyGen write operations disabled in demo.")
+        client = self._get_aclient()
+
+        async def chunks():
+            while True:
+                chunk = image_stream.read(UPLOAD_CHUNK_SIZE)
+                if not chunk:
+                    break
+                yield chunk
+
+        try:
+            logger.info("Uploading photo to HeyGen (type: %s)", content_type)
+            start = image_stream.tell()
+            # Try the standard upload endpoint first, unless it is known to be unavailable
+            standard_missing = False
+            if self._endpoint_cache.get("photo_upload") != "talking_photo":
+                upload_url = f"{self.upload_base_url}{PHOTO_UPLOAD_PATHS[0]}"
+                try:
+                    # httpx streams file objects in multipart bodies
+                    response = await client.post(upload_url, files={'file': ('photo.jpg', image_stream, content_type)})
+                    if response.status_code == 404:
+                        standard_missing = True
+                    elif response.status_code == 200:
+                        result = response.json()
+                        if result.get("code") == 100 and result.get("data"):
+                            return {
+                                "image_key": result["data"].get("url") or result["data"].get("key"),
+                                "image_url": result["data"].get("url")
+                            }
+                except Exception as e:
+                    logger.warning(f"Standard upload failed, trying talking photo: {e}")
+
+            # Fallback to talking photo endpoint
+            upload_url = f"{self.upload_base_url}{PHOTO_UPLOAD_PATHS[1]}"
+            image_stream.seek(start)
+            response = await client.post(upload_url, content=chunks(), headers={"Content-Type": content_type})
+            response.raise_for_status()
+            if standard_missing:
+                self._learn_endpoint("photo_upload", "talking_photo")
+            result = response.json()
+            if result.get("code") == 100 and result.get("data"):
+                # A new talking photo shows up in the avatars listing
+                self.invalidate("avatars")
+                data = result["data"]
+                return {
+                    "image_key": f"image/{data.get('talking_photo_id')}/original",
+                    "image_url": data.get("talking_photo_url"),
+                    "talking_photo_id": data.get("talking_photo_id")
+                }
+            else:
+                raise RuntimeError(f"Unexpected upload response: {result}")
+        except Exception as e:
+            logger.error(f"Photo upload error: {e}")
+            raise
+
+    async def a_generate_photo_avatar_photos(self, image_url: str) -> dict:
+        """Async variant of generate_photo_avatar_photos"""
+        if self._demo:
+            raise RuntimeError("HeyGen write operations disabled in demo.")
+        try:
+            logger.info("Generating photo avatar photos from: %s", image_url)
+            response = await self._get_aclient().post("/photo_avatar/photo/generate", content=_json_body({"image_url": image_url}), headers=JSON_HEADERS)
+            response.raise_for_status()
+            result = response.json()
+            logger.info("Photo generation response code=%s", result.get("code"))
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Photo generation response: %r", result)
+            return result
+        except Exception as e:
+            logger.error(f"Photo generation error: {e}")
+            raise
+
+    async def a_create_photo_avatar_group(self, name: str, image_key: str) -> dict:
+        """Async variant of create_photo_avatar_group"""
+        if self._demo:
+            raise RuntimeError("HeyGen write operations disabled in demo.")
+        payload = {
+            "name": name,
+            "image_key": image_key
         }
+        client = self._get_aclient()
+        try:
+            logger.info("Creating photo avatar group: %s with image_key: %s", name, image_key)
+            path = self._endpoint_cache.get("avatar_group_create", AVATAR_GROUP_CREATE_PATHS[0])
+            response = await client.post(path, content=_json_body(payload), headers=JSON_HEADERS)
+            if response.status_code == 404 and path != AVATAR_GROUP_CREATE_PATHS[1]:
+                # Try without avatar_group in path
+                logger.info("Trying alternate endpoint without avatar_group")
+                path = AVATAR_GROUP_CREATE_PATHS[1]
+                response = await client.post(path, content=_json_body(payload), headers=JSON_HEADERS)
+            if 200 <= response.status_code < 300:
+                self._learn_endpoint("avatar_group_create", path)
+            response.raise_for_status()
+            result = response.json()
+            self.invalidate("avatars")
+            group = result.get("data") or {}
+            logger.info("Created photo avatar group id=%s", group.get("group_id") or group.get("id"))
+            return result
+        except Exception as e:
+            logger.error(f"Photo avatar group creation error: {e}")
+            raise
@@ -1,19 +1,37 @@
-from fastapi import FastAPI, HTTPException, Depends, BackgroundTasks, Header, File, UploadFile, Form, Request
-from fastapi.responses import HTMLResponse
+from fastapi import FastAPI, HTTPException, Depends, BackgroundTasks, Header, File, UploadFile, Form, Query, Request
+from fastapi.responses import HTMLResponse, JSONResponse, ORJSONResponse, Response, StreamingResponse
+from anyio import from_thread
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel, Field, validator
-from typing import List, Optional, Dict
+from fastapi.middleware.gzip import GZipMiddleware
+from pydantic import BaseModel, ConfigDict, Field, SecretStr, TypeAdapter, ValidationError as PydanticValidationError, field_validator
+from pydantic.dataclasses import dataclass as pydantic_dataclass
+from typing import Any, List, Literal, Mapping, Optional, Dict
 from datetime import datetime, date
+from collections import OrderedDict
+from contextlib import contextmanager
+from decimal import Decimal
+from types import MappingProxyType
+import asyncio
+import contextvars
+import dataclasses
+import functools
+import io
 import os
 import requests
+from requests.adapters import HTTPAdapter
 import json
 import hmac
 import hashlib
 import logging
+import threading
 import time
-import boto3
 import uuid
 import mimetypes
+import operator
+import posixpath
+from urllib.parse import unquote, urlsplit
+from psycopg2.extras import execute_values
 
 # Import AI service
 from ai_service import ai_service
@@ -22,6 +40,9 @@ import auto_campaign_service as svc
 # Social integrations (4.3)
 from twitter_integration import TwitterPlatform, TwitterAuthState
 from twitter_oauth1_integration import TwitterOAuth1State, TwitterOAuth1Platform
+from oauth_state_store import OAuthStateStore
+from response_cache import analytics_cache, self_test_probes, social_account_jobs, social_accounts_cache
+from analytics_db import close_async_pool, close_sync_pool, get_async_pool, get_sync_pool, pooled_connection, to_asyncpg_sql
 from social_media_service import (
     load_platform_config_from_env, 
     PlatformConfig, 
@@ -29,11 +50,10 @@ from social_media_service import (
     AuthorizationError,
     ValidationError
 )
-from reddit_integration import RedditPlatform, register_with_service as register_reddit
 
 # HeyGen service
-from heygen_service import HeyGenService
-from storage_service import StorageService
+from heygen_service import HeyGenService, webhook_url_from_env
+from storage_service import StorageService, get_s3_client
 from demo_flags import DEMO_MODE
 
 # Configure logging
@@ -43,36 +63,107 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Shared keep-alive session for outbound sync calls, so repeat requests to the same
+# host reuse the TCP/TLS connection instead of handshaking every time
+_HTTP_SESSION = requests.Session()
+_HTTP_SESSION.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=0))
+
+@functools.lru_cache(maxsize=1)
+def _reddit_platform_cls():
+    """RedditPlatform, imported on first use: praw is slow to import and only the Reddit routes need it."""
+    from reddit_integration import RedditPlatform
+    return RedditPlatform
+
+@functools.lru_cache(maxsize=1)
+def _base_reddit_config() -> PlatformConfig:
+    cfg = load_platform_config_from_env("reddit", prefix="REDDIT")
+    cfg.extra["user_agent"] = "redacted-app:v1.0 (by u/redacted-app)"
+    return cfg
+
+def _reddit_config() -> PlatformConfig:
+    """Reddit app config from the environment, parsed and validated once; each caller gets
+    its own copy (with its own extra dict) to set tokens and redirect settings on."""
+    base = _base_reddit_config()
+    return base.model_copy(update={"extra": dict(base.extra)})
+
 def log_heygen_operation(operation: str, job_id: str = None, provider_id: str = None, duration: float = None, status: str = None):
-    """Log HeyGen operations with structured data"""
+    """Log HeyGen operations with structured data (timestamped by the log record)"""
+    if not logger.isEnabledFor(logging.INFO):
+        return
     log_data = {
         "operation": operation,
         "job_id": job_id,
         "provider_id": provider_id,
         "duration": duration,
         "status": status,
-        "timestamp": datetime.utcnow().isoformat()
     }
-    logger.info(f"HeyGen operation: {log_data}")
+    logger.info("HeyGen operation: %s", log_data, extra={"operation_data": log_data})
 
 def log_s3_operation(operation: str, bucket: str = None, key: str = None, duration: float = None, status: str = None):
-    """Log S3 operations with structured data"""
+    """Log S3 operations with structured data (timestamped by the log record)"""
+    if not logger.isEnabledFor(logging.INFO):
+        return
     log_data = {
         "operation": operation,
         "bucket": bucket,
         "key": key,
         "duration": duration,
         "status": status,
-        "timestamp": datetime.utcnow().isoformat()
     }
-    logger.info(f"S3 operation: {log_data}")
+    logger.info("S3 operation: %s", log_data, extra={"operation_data": log_data})
+
+# Serialize JSON responses with orjson when it is installed
+try:
+    import orjson
+    _default_response_class = ORJSONResponse
+except ImportError:
+    orjson = None
+    _default_response_class = JSONResponse
+
+# Optional binary encoding for dashboards that send Accept: application/msgpack
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+
+def _json_default(obj):
+    # NUMERIC aggregates come back from psycopg2 as Decimal
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _json_bytes(content) -> bytes:
+    """Compact UTF-8 JSON for content, via orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(content, default=_json_default, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(content, default=_json_default, separators=(",", ":")).encode("utf-8")
 
-app = FastAPI(title="Content Management API")
 
-# In-memory OAuth session store (state -> TwitterAuthState)
-_twitter_oauth_sessions: Dict[str, TwitterAuthState] = {}
-# Keep track of OAuth state
-_twitter_oauth1_sessions: Dict[str, TwitterOAuth1State] = {}
+def _json_loads(body):
+    return orjson.loads(body) if orjson is not None else json.loads(body)
+
+
+class RowsJSONResponse(JSONResponse):
+    """JSON response for handlers that return cursor rows as-is.
+
+    Returning it directly skips FastAPI's jsonable_encoder walk over every row;
+    datetimes and Decimals are converted here instead.
+    """
+
+    def render(self, content) -> bytes:
+        return _json_bytes(content)
+
+
+app = FastAPI(title="Content Management API", default_response_class=_default_response_class)
+
+# Pending OAuth sessions (state -> TwitterAuthState), shared via Redis when REDIS_URL is set
+_twitter_oauth_sessions = OAuthStateStore("x_oauth2", TwitterAuthState)
+# Keep track of OAuth state (oauth_token -> TwitterOAuth1State)
+_twitter_oauth1_sessions = OAuthStateStore("x_oauth1", TwitterOAuth1State)
 
 # Configure allowed origins from environment
 frontend_url = os.getenv("FRONTEND_URL", "https://redacted.example.com")
@@ -88,6 +179,29 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+class _GZipExceptEventStreams(GZipMiddleware):
+    """GZip responses, except server-sent event streams (buffering would delay events)."""
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["path"].endswith("/events"):
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
+
+# Analytics and list payloads repeat the same keys per row and compress ~10x
+app.add_middleware(_GZipExceptEventStreams, minimum_size=1024, compresslevel=5)
+
+@app.on_event("shutdown")
+async def close_ai_clients():
+    """Release the shared async Bedrock client on shutdown."""
+    await ai_service.aclose()
+
+@app.on_event("shutdown")
+async def close_analytics_pool():
+    """Close the connection pools used by analytics handlers."""
+    await close_async_pool()
+    close_sync_pool()
+
 # Pydantic models for request/response
 class PersonaCreate(BaseModel):
     title: str
@@ -158,7 +272,8 @@ class OfferResponse(BaseModel):
     features: Optional[str] = None
     requirements: Optional[str] = None
 
-    @validator('start_date', 'end_date', pre=True)
+    @field_validator('start_date', 'end_date', mode='before')
+    @classmethod
     def convert_date_to_string(cls, v):
         if isinstance(v, date):
             return v.isoformat()
@@ -265,9 +380,18 @@ class CampaignContentGenerationRequest(BaseModel):
 # ============================================================================
 
 # Analytics Data Models
-class AnalyticsDataPoint(BaseModel):
+# Platforms analytics are recorded for, and the trend bucket sizes
+AnalyticsPlatform = Literal["twitter", "x", "linkedin", "facebook", "instagram", "reddit", "tiktok", "youtube", "shorts"]
+TrendPeriod = Literal["hourly", "daily", "weekly", "monthly"]
+
+# Ingest payloads are parsed once and unpacked straight into INSERT rows, so they are
+# slotted pydantic dataclasses rather than BaseModels (no per-instance __dict__)
+_ingest_model = pydantic_dataclass(slots=True, kw_only=True, config=ConfigDict(extra="ignore"))
+
+@_ingest_model
+class AnalyticsDataPoint:
     campaign_id: int
-    platform: str
+    platform: AnalyticsPlatform
     content_id: Optional[str] = None
     metric_category: str
     metric_name: str
@@ -281,10 +405,11 @@ class AnalyticsDataPoint(BaseModel):
     location_region: Optional[str] = None
     confidence_score: Optional[float] = 1.0
 
-class ContentPerformanceData(BaseModel):
+@_ingest_model
+class ContentPerformanceData:
     campaign_id: int
     content_type: str
-    platform: str
+    platform: AnalyticsPlatform
     content_id: Optional[str] = None
     title: Optional[str] = None
     content_text: Optional[str] = None
@@ -299,9 +424,10 @@ class ContentPerformanceData(BaseModel):
     hashtags: Optional[list] = None
     mentions: Optional[list] = None
 
-class ConversionData(BaseModel):
+@_ingest_model
+class ConversionData:
     campaign_id: int
-    platform: str
+    platform: AnalyticsPlatform
     conversion_type: str
     conversion_value: Optional[float] = None
     conversion_currency: str = "USD"
@@ -335,7 +461,8 @@ class CampaignActivationResponse(BaseModel):
     campaign_id: int
 
 # Platform-Specific Analytics Models
-class TwitterAnalyticsData(BaseModel):
+@_ingest_model
+class TwitterAnalyticsData:
     campaign_id: int
     tweet_id: str
     retweets: Optional[int] = None
@@ -360,7 +487,8 @@ class TwitterAnalyticsData(BaseModel):
     email_click: Optional[int] = None
     date_recorded: str
 
-class LinkedInAnalyticsData(BaseModel):
+@_ingest_model
+class LinkedInAnalyticsData:
     campaign_id: int
     post_id: str
     impressions: Optional[int] = None
@@ -377,10 +505,11 @@ class LinkedInAnalyticsData(BaseModel):
     paid_impressions: Optional[int] = None
     date_recorded: str
 
-class FacebookAnalyticsData(BaseModel):
+@_ingest_model
+class FacebookAnalyticsData:
     campaign_id: int
     post_id: str
-    platform_type: str  # 'facebook' or 'instagram'
+    platform_type: Literal["facebook", "instagram"]
     impressions: Optional[int] = None
     reach: Optional[int] = None
     engagement: Optional[int] = None
@@ -397,6 +526,12 @@ class FacebookAnalyticsData(BaseModel):
     follows: Optional[int] = None
     date_recorded: str
 
+# Validators built once for the bulk/NDJSON analytics ingest route, which parses bodies itself
+_POINT_ADAPTER = TypeAdapter(AnalyticsDataPoint)
+_POINT_LIST_ADAPTER = TypeAdapter(List[AnalyticsDataPoint])
+# Payload -> INSERT row tuple in field order, as one C-level attrgetter call
+_POINT_ROW = operator.attrgetter(*(f.name for f in dataclasses.fields(AnalyticsDataPoint)))
+
 # Social Media Account Models
 class SocialMediaAccountCreate(BaseModel):
     platform: str
@@ -423,36 +558,39 @@ def create_persona(persona: PersonaCreate):
     try:
         
         # Return mock data for API compatibility
+        now = datetime.utcnow()
         new_persona = {
             "persona_id": 1,
             "title": persona.title,
             "description": persona.description,
-            "created_at": datetime.utcnow(),
-            "updated_at": datetime.utcnow()
+            "created_at": now,
+            "updated_at": now
         }
-        return dict(new_persona)
+        return new_persona
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
-@app.get("/personas", response_model=List[PersonaResponse])
+@app.get("/personas", response_model=None, responses={200: {"model": List[PersonaResponse]}})
 def get_personas():
         
         # Return mock data for API compatibility
+        now = datetime.utcnow()
         personas = [
             {
                 "persona_id": 1,
                 "title": "Sample Persona",
                 "description": "A sample persona for demo purposes",
-                "created_at": datetime.utcnow(),
-                "updated_at": datetime.utcnow()
+                "created_at": now,
+                "updated_at": now
         
         # Return mock data for API compatibility
+        now = datetime.utcnow()
         updated_persona = {
             "persona_id": persona_id,
             "title": persona.title,
             "description": persona.description,
-            "created_at": datetime.utcnow(),
-            "updated_at": datetime.utcnow()
+            "created_at": now,
+            "updated_at": now
         }
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -461,7 +599,7 @@ def get_personas():
 def update_persona(persona_id: int, persona: PersonaCreate):
     try:
         
-        return dict(updated_persona)
+        return updated_persona
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -478,15 +616,15 @@ def delete_persona(persona_id: int):
 def create_script(script: ScriptCreate):
     try:
         
-        return dict(new_script)
+        return new_script
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
-@app.get("/scripts", response_model=List[ScriptResponse])
+@app.get("/scripts", response_model=None, responses={200: {"model": List[ScriptResponse]}})
 def get_scripts():
     try:
         
-        return [dict(script) for script in scripts]
+        return RowsJSONResponse(scripts)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -494,7 +632,7 @@ def get_scripts():
 def update_script(script_id: int, script: ScriptCreate):
     try:
         
-        return dict(updated_script)
+        return updated_script
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -511,15 +649,15 @@ def delete_script(script_id: int):
 def create_pain_point(pain_point: PainPointCreate):
     try:
         
-        return dict(new_pain_point)
+        return new_pain_point
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
-@app.get("/pain-points", response_model=List[PainPointResponse])
+@app.get("/pain-points", response_model=None, responses={200: {"model": List[PainPointResponse]}})
 def get_pain_points():
     try:
         
-        return [dict(pain_point) for pain_point in pain_points]
+        return RowsJSONResponse(pain_points)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -527,7 +665,7 @@ def get_pain_points():
 def update_pain_point(pain_point_id: int, pain_point: PainPointCreate):
     try:
         
-        return dict(updated_pain_point)
+        return updated_pain_point
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -544,15 +682,15 @@ def delete_pain_point(pain_point_id: int):
 def create_offer(offer: OfferCreate):
     try:
         
-        return dict(new_offer)
+        return new_offer
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
-@app.get("/offers", response_model=List[OfferResponse])
+@app.get("/offers", response_model=None, responses={200: {"model": List[OfferResponse]}})
 def get_offers():
     try:
         
-        return [dict(offer) for offer in offers]
+        return RowsJSONResponse(offers)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -560,7 +698,7 @@ def get_offers():
 def update_offer(offer_id: int, offer: OfferCreate):
     try:
         
-        return dict(updated_offer)
+        return updated_offer
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -585,14 +723,9 @@ def generate_script(request: ScriptGenerationRequest):
 def generate_script_from_offer(request: ScriptFromOfferRequest):
     try:
     
-        try:
-            tweet_text = ai_service.generate_tweet(script, "")
-        except Exception:
-            tweet_text = ai_service.generate_tweet_text(script, None)
-        try:
-            video_caption = ai_service.generate_video_caption(script, "")
-        except Exception:
-            video_caption = ai_service.generate_shorts_caption(script, None)
+        # Tweet and caption are independent; both Bedrock calls run concurrently on the
+        # event loop while this worker thread waits (they fall back internally, never raise)
+        tweet_text, video_caption = from_thread.run(ai_service.generate_social_copy_async, script, "")
         return {"script": script, "tweet_text": tweet_text, "tweet": tweet_text, "video_caption": video_caption, "caption": video_caption}
     except HTTPException:
         raise
@@ -640,15 +773,15 @@ def generate_content_ideas(request: ContentIdeasRequest):
 def create_cta(cta: CTACreate):
     try:
         
-        return dict(new_cta)
+        return new_cta
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
-@app.get("/ctas", response_model=List[CTAResponse])
+@app.get("/ctas", response_model=None, responses={200: {"model": List[CTAResponse]}})
 def get_ctas():
     try:
         
-        return [dict(cta) for cta in ctas]
+        return RowsJSONResponse(ctas)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -656,7 +789,7 @@ def get_ctas():
 def update_cta(cta_id: int, cta: CTACreate):
     try:
         
-        return dict(updated_cta)
+        return updated_cta
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -669,11 +802,29 @@ def delete_cta(cta_id: int):
         raise HTTPException(status_code=500, detail=str(e))
 
 # Campaign Endpoints
+
+# Draft/active dropdown listings are polled by every dashboard but only change when a
+# campaign is created, edited or activated; each worker serves them from memory briefly
+# (campaign writes in this worker clear them, other workers catch up within the TTL)
+_CAMPAIGN_LIST_TTL_SECONDS = 30.0
+_campaign_lists: Dict[str, tuple] = {}
+
+def _cached_campaign_list(key: str):
+    entry = _campaign_lists.get(key)
+    if entry is not None and time.monotonic() - entry[0] < _CAMPAIGN_LIST_TTL_SECONDS:
+        return entry[1]
+    return None
+
+def _store_campaign_list(key: str, rows):
+    _campaign_lists[key] = (time.monotonic(), rows)
+    return rows
+
 @app.post("/campaigns", response_model=CampaignResponse)
 def create_campaign(campaign: CampaignCreate):
     try:
         
-        return dict(new_campaign)
+        _campaign_lists.clear()
+        return new_campaign
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -681,7 +832,7 @@ def create_campaign(campaign: CampaignCreate):
 def get_campaigns():
     try:
         
-        return [dict(campaign) for campaign in campaigns]
+        return campaigns
     except Exception as e:
         # Return empty list instead of error for now
         return []
@@ -690,7 +841,8 @@ def get_campaigns():
 def update_campaign(campaign_id: int, campaign: CampaignCreate):
     try:
         
-        return dict(updated_campaign)
+        _campaign_lists.clear()
+        return updated_campaign
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -699,8 +851,9 @@ def delete_campaign(campaign_id: int):
     try:
         
         
+        _campaign_lists.clear()
         if campaign:
-            return dict(campaign)
+            return campaign
         else:
             return {"message": "No pending campaigns found"}
     except Exception as e:
@@ -709,18 +862,24 @@ def delete_campaign(campaign_id: int):
 @app.get("/campaigns/draft")
 def get_draft_campaigns():
     """Get all non-activated campaigns for dropdown selection"""
+    cached = _cached_campaign_list("draft")
+    if cached is not None:
+        return cached
     try:
         
         
-        return [dict(campaign) for campaign in campaigns]
+        return _store_campaign_list("draft", campaigns)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
 
-@app.get("/campaigns/active", response_model=List[CampaignResponse])
+@app.get("/campaigns/active", response_model=None, responses={200: {"model": List[CampaignResponse]}})
 def get_active_campaigns():
+    cached = _cached_campaign_list("active")
+    if cached is not None:
+        return RowsJSONResponse(cached)
     try:
         
-        return [dict(campaign) for campaign in active_campaigns]
+        return RowsJSONResponse(_store_campaign_list("active", active_campaigns))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -728,7 +887,8 @@ def get_active_campaigns():
 def activate_campaign(campaign_id: int):
     try:
         
-        return dict(activated_campaign)
+        _campaign_lists.clear()
+        return activated_campaign
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -741,7 +901,9 @@ def get_campaign_activation_status(campaign_id: int):
         if not result:
             raise HTTPException(status_code=404, detail="Campaign not found")
         
-        return dict(result)
+        return result
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
 
@@ -750,7 +912,7 @@ def get_campaign_activation_status(campaign_id: int):
 def add_script_to_campaign(campaign_script: CampaignScriptCreate):
     try:
         
-        return dict(new_campaign_script)
+        return new_campaign_script
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -758,7 +920,7 @@ def add_script_to_campaign(campaign_script: CampaignScriptCreate):
 def add_cta_to_campaign(campaign_cta: CampaignCTACreate):
     try:
         
-        return dict(new_campaign_cta)
+        return new_campaign_cta
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -766,7 +928,7 @@ def add_cta_to_campaign(campaign_cta: CampaignCTACreate):
 def add_publication_to_campaign(campaign_publication: CampaignPublicationCreate):
     try:
         
-        return dict(new_campaign_publication)
+        return new_campaign_publication
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -800,6 +962,8 @@ def generate_platform_variations(request: dict):
         
         variations = ai_service.generate_platform_variations(script_content, platforms)
         return variations
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -819,22 +983,120 @@ def health_check():
 # ANALYTICS MODELS (Task 2.1)
 # ============================================================================
 
+@contextmanager
+def _db_connection():
+    """A pooled connection (a one-off connection when there is no pool, e.g. demo mode)."""
+    pool = get_sync_pool()
+    if pool is not None:
+        with pooled_connection(pool) as conn:
+            yield conn
+        return
+    conn = get_db_connection()
+    try:
+        yield conn
+    finally:
+        conn.close()
+
+def db():
+    """Request-scoped connection, returned to the pool once the response is sent."""
+    with _db_connection() as conn:
+        yield conn
+
 @app.post("/analytics/collect")
 def collect_analytics_data(analytics_data: AnalyticsDataPoint):
     """Collect raw analytics data from social media platforms"""
     try:
         
         
+        analytics_cache.invalidate(analytics_data.campaign_id)
         return {"message": "Analytics data collected successfully", "analytics_id": analytics_id}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
 
+# Bulk ingest writes every AnalyticsDataPoint field, in declaration order
+_ANALYTICS_COLUMNS = tuple(f.name for f in dataclasses.fields(AnalyticsDataPoint))
+_ANALYTICS_COLUMN_LIST = ", ".join(_ANALYTICS_COLUMNS)
+_ANALYTICS_BULK_INSERT_SQL = f"INSERT INTO analytics_data ({_ANALYTICS_COLUMN_LIST}) VALUES %s RETURNING analytics_id"
+# Batches at least this large are COPYed into a staging table instead (no per-row SQL to parse)
+_ANALYTICS_COPY_MIN_ROWS = 1000
+_ANALYTICS_STAGE_SQL = (
+    f"CREATE TEMP TABLE analytics_data_stage ON COMMIT DROP AS "
+    f"SELECT {_ANALYTICS_COLUMN_LIST} FROM analytics_data WITH NO DATA"
+)
+_ANALYTICS_COPY_SQL = f"COPY analytics_data_stage ({_ANALYTICS_COLUMN_LIST}) FROM STDIN"
+_ANALYTICS_FROM_STAGE_SQL = (
+    f"INSERT INTO analytics_data ({_ANALYTICS_COLUMN_LIST}) "
+    f"SELECT {_ANALYTICS_COLUMN_LIST} FROM analytics_data_stage RETURNING analytics_id"
+)
+# COPY text format: backslash escapes for the delimiter/line characters, \N for NULL
+_COPY_TEXT_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+
+def _copy_text_rows(points: List[AnalyticsDataPoint]) -> io.StringIO:
+    row_of = _POINT_ROW
+    buf = io.StringIO()
+    for p in points:
+        buf.write("\t".join("\\N" if v is None else str(v).translate(_COPY_TEXT_ESCAPES) for v in row_of(p)))
+        buf.write("\n")
+    buf.seek(0)
+    return buf
+
+def _insert_analytics_points(points: List[AnalyticsDataPoint]) -> List[int]:
+    with _db_connection() as conn, conn.cursor() as cur:
+        if len(points) >= _ANALYTICS_COPY_MIN_ROWS:
+            # COPY into a per-transaction staging table, then one INSERT ... SELECT for the ids
+            cur.execute(_ANALYTICS_STAGE_SQL)
+            cur.copy_expert(_ANALYTICS_COPY_SQL, _copy_text_rows(points))
+            cur.execute(_ANALYTICS_FROM_STAGE_SQL)
+            rows = cur.fetchall()
+        else:
+            rows = execute_values(
+                cur,
+                _ANALYTICS_BULK_INSERT_SQL,
+                list(map(_POINT_ROW, points)),
+                page_size=1000,
+                fetch=True,
+            )
+        conn.commit()
+        return [row[0] for row in rows]
+
+@app.post("/analytics/collect/bulk")
+async def collect_analytics_data_bulk(request: Request):
+    """Collect many analytics data points with a single multi-row INSERT.
+
+    The body is a JSON array of data points, or NDJSON (one data point per line)
+    when sent as application/x-ndjson; NDJSON is parsed as it streams in.
+    """
+    try:
+        if request.headers.get("content-type", "").startswith("application/x-ndjson"):
+            validate_point = _POINT_ADAPTER.validate_json
+            points = []
+            pending = b""
+            async for chunk in request.stream():
+                *lines, pending = (pending + chunk).split(b"\n")
+                points.extend(validate_point(line) for line in lines if line.strip())
+            if pending.strip():
+                points.append(validate_point(pending))
+        else:
+            points = _POINT_LIST_ADAPTER.validate_json(await request.body())
+    except PydanticValidationError as e:
+        raise HTTPException(status_code=422, detail=e.errors(include_url=False, include_context=False))
+
+    if not points:
+        return {"message": "No analytics data points received", "analytics_ids": []}
+    try:
+        analytics_ids = await run_in_threadpool(_insert_analytics_points, points)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
+    await asyncio.gather(*(analytics_cache.ainvalidate(campaign_id) for campaign_id in {p.campaign_id for p in points}))
+    return {"message": f"Collected {len(analytics_ids)} analytics data points", "analytics_ids": analytics_ids}
+
 @app.post("/analytics/content-performance")
 def collect_content_performance(content_data: ContentPerformanceData):
     """Collect content performance data"""
     try:
         
         
+        analytics_cache.invalidate(content_data.campaign_id)
         return {"message": "Content performance data collected successfully", "performance_id": performance_id}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
@@ -845,6 +1107,7 @@ def collect_conversion_data(conversion_data: ConversionData):
     try:
         
         
+        analytics_cache.invalidate(conversion_data.campaign_id)
         return {"message": "Conversion data collected successfully", "conversion_id": conversion_id}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
@@ -855,6 +1118,7 @@ def collect_twitter_analytics(twitter_data: TwitterAnalyticsData):
     try:
         
         
+        analytics_cache.invalidate(twitter_data.campaign_id)
         return {"message": "Twitter analytics data collected successfully", "twitter_analytics_id": twitter_analytics_id}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
@@ -865,6 +1129,7 @@ def collect_linkedin_analytics(linkedin_data: LinkedInAnalyticsData):
     try:
         
         
+        analytics_cache.invalidate(linkedin_data.campaign_id)
         return {"message": "LinkedIn analytics data collected successfully", "linkedin_analytics_id": linkedin_analytics_id}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
@@ -875,132 +1140,220 @@ def collect_facebook_analytics(facebook_data: FacebookAnalyticsData):
     try:
         
         
+        analytics_cache.invalidate(facebook_data.campaign_id)
         return {"message": "Facebook analytics data collected successfully", "facebook_analytics_id": facebook_analytics_id}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
 
+@functools.lru_cache(maxsize=32)
+def _json_sections_sql(named_sql: tuple) -> str:
+    # One statement text per query shape (e.g. with / without a date range), built once;
+    # asyncpg then prepares each distinct text once per connection. The object comes back
+    # as UTF-8 bytea, so neither driver decodes it to str only for it to be encoded again
+    parts = [f"'{name}', COALESCE((SELECT json_agg(t) FROM ({sql}) t), '[]'::json)" for name, sql in named_sql]
+    return f"SELECT convert_to(json_build_object({', '.join(parts)})::text, 'UTF8')"
+
+@functools.lru_cache(maxsize=32)
+def _json_rows_with_count_sql(sql: str, rows_key: str, count_key: str) -> str:
+    # One JSON object (as UTF-8 bytea) holding the rows of sql as an array plus their count
+    return (
+        f"SELECT convert_to(json_build_object('{rows_key}', COALESCE(json_agg(t), '[]'::json), "
+        f"'{count_key}', count(*))::text, 'UTF8') FROM ({sql}) t"
+    )
+
+def _json_sections_query(sections):
+    """Combine several row-returning SELECTs into one statement.
+
+    sections maps a result name (a fixed identifier, inlined as a key) to (sql, params).
+    Each SELECT is wrapped in a json_agg subquery, so Postgres returns a single JSON
+    object (as UTF-8 bytes) keyed by name, with an empty list for sections that match no rows.
+    """
+    params = []
+    for _, section_params in sections.values():
+        params.extend(section_params)
+    return _json_sections_sql(tuple((name, sql) for name, (sql, _) in sections.items())), params
+
+def _fetch_value_sync(sql, params):
+    with _db_connection() as conn, conn.cursor() as cur:
+        cur.execute(sql, params)
+        return cur.fetchone()[0]
+
+async def _fetch_value(sql, params):
+    """Run a single-value query: on the asyncpg pool when available,
+    otherwise with psycopg2 in the threadpool."""
+    pool = await get_async_pool()
+    if pool is None:
+        return await run_in_threadpool(_fetch_value_sync, sql, params)
+    async with pool.acquire() as conn:
+        return await conn.fetchval(to_asyncpg_sql(sql), *params)
+
+def _fetch_rows_sync(sql, params):
+    # Plain tuple cursor: the dicts are built once here, not through RealDictRow
+    with _db_connection() as conn, conn.cursor() as cur:
+        cur.execute(sql, params)
+        columns = [column.name for column in cur.description]
+        return [dict(zip(columns, row)) for row in cur.fetchall()]
+
+async def _fetch_rows(sql, params):
+    """Run a row-returning query (rows come back as read-only mappings): on the
+    asyncpg pool when available, otherwise with psycopg2 in the threadpool."""
+    pool = await get_async_pool()
+    if pool is None:
+        return await run_in_threadpool(_fetch_rows_sync, sql, params)
+    async with pool.acquire() as conn:
+        # asyncpg Records already support row["col"] and **row; no per-row dict copy
+        return await conn.fetch(to_asyncpg_sql(sql), *params)
+
+def _json_object_with(head: dict, raw_object) -> bytes:
+    """Render head and append the members of a JSON object that is already encoded.
+
+    Used to ship row data assembled by Postgres without decoding it into Python
+    objects and encoding it again. raw_object is UTF-8 bytes (psycopg2 hands bytea
+    back as a memoryview, asyncpg as bytes).
+    """
+    body = RowsJSONResponse(head).body
+    members = bytes(raw_object).strip()[1:-1].strip()
+    if not members:
+        return body
+    return b"".join((body[:-1], b",", members, b"}"))
+
+# Optional WHERE fragments, keyed by whether the filter applies; picking a fixed string keeps the
+# statement text identical for every request of the same shape (so cached plans are reused)
+_RECORDED_RANGE_FILTER = MappingProxyType({False: "", True: "AND date_recorded BETWEEN %s AND %s"})
+_PUBLISHED_RANGE_FILTER = MappingProxyType({False: "", True: "AND publish_date BETWEEN %s AND %s"})
+_CONVERTED_RANGE_FILTER = MappingProxyType({False: "", True: "AND conversion_date BETWEEN %s AND %s"})
+_PLATFORM_FILTER = MappingProxyType({False: "", True: "AND platform = %s"})
+
+def _analytics_body_response(request: Request, body: bytes) -> Response:
+    """Respond with a rendered JSON analytics body, or its MessagePack equivalent
+    when the client asks for application/msgpack (and msgpack is installed)."""
+    headers = {"Vary": "Accept"}
+    if msgpack is not None and "application/msgpack" in request.headers.get("accept", ""):
+        payload = _json_loads(body)
+        return Response(content=msgpack.packb(payload, use_bin_type=True), media_type="application/msgpack", headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+def _parse_date_bound(value: str) -> datetime:
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        raise HTTPException(status_code=400, detail=f"Invalid date: {value}")
+
 @app.get("/analytics/campaign/{campaign_id}/summary")
-def get_campaign_analytics_summary(campaign_id: int, start_date: Optional[str] = None, end_date: Optional[str] = None):
-    """Get comprehensive analytics summary for a campaign"""
+async def get_campaign_analytics_summary(request: Request, campaign_id: int, start_date: Optional[str] = None, end_date: Optional[str] = None):
+    """Get comprehensive analytics summary for a campaign (MessagePack with Accept: application/msgpack)"""
+    cache_key = analytics_cache.key(campaign_id, "summary", start_date, end_date)
+    cached = await analytics_cache.aget(cache_key)
+    if cached is not None:
+        return _analytics_body_response(request, cached)
     try:
-        conn = get_db_connection()
-        cur = conn.cursor(cursor_factory=RealDictCursor)
-        
-        # Build date filter
-        date_filter = ""
+        # Build date filter (bounds are parsed here: asyncpg does not coerce strings)
+        has_range = bool(start_date and end_date)
+        date_filter = _RECORDED_RANGE_FILTER[has_range]
         params = [campaign_id]
-        if start_date and end_date:
-            date_filter = "AND date_recorded BETWEEN %s AND %s"
-            params.extend([start_date, end_date])
+        if has_range:
+            params.extend([_parse_date_bound(start_date), _parse_date_bound(end_date)])
         
         # Get aggregated analytics dat
         
-        analytics_summary = [dict(row) for row in cur.fetchall()]
         
         # Get content performance data
-        content_date_filter = ""
-        if start_date and end_date:
-            content_date_filter = "AND publish_date BETWEEN %s AND %s"
+        content_date_filter = _PUBLISHED_RANGE_FILTER[has_range]
         
        
-        content_performance = [dict(row) for row in cur.fetchall()]
         
         # Get conversion summary
-        conversion_date_filter = ""
-        if start_date and end_date:
-            conversion_date_filter = "AND conversion_date BETWEEN %s AND %s"
+        conversion_date_filter = _CONVERTED_RANGE_FILTER[has_range]
         
        
         
-        conversion_summary = [dict(row) for row in cur.fetchall()]
-        
-        cur.close()
-        conn.close()
+        # All three sections come back in one round trip (every section takes the same params),
+        # as JSON text that is spliced into the response as-is
+        sections = await _fetch_value(*_json_sections_query({
+            "analytics_summary": (analytics_summary_sql, params),
+            "content_performance": (content_performance_sql, params),
+            "conversion_summary": (conversion_summary_sql, params),
+        }))
         
-        return {
+        body = _json_object_with({
             "campaign_id": campaign_id,
             "date_range": {
                 "start_date": start_date,
                 "end_date": end_date
             },
-            "analytics_summary": analytics_summary,
-            "content_performance": content_performance,
-            "conversion_summary": conversion_summary
-        }
+        }, sections)
+        await analytics_cache.aset(cache_key, campaign_id, body)
+        return _analytics_body_response(request, body)
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
 
+# Trend period -> GROUP BY bucket expression (keys match TrendPeriod)
+_TREND_BUCKETS = MappingProxyType({
+    "hourly": "DATE_TRUNC('hour', date_recorded)",
+    "daily": "DATE(date_recorded)",
+    "weekly": "DATE_TRUNC('week', date_recorded)",
+    "monthly": "DATE_TRUNC('month', date_recorded)",
+})
+
 @app.get("/analytics/campaign/{campaign_id}/trends/{metric}")
-def get_campaign_analytics_trends(campaign_id: int, metric: str, period: str = "daily", platform: Optional[str] = None):
-    """Get analytics trends for a specific metric"""
+def get_campaign_analytics_trends(request: Request, campaign_id: int, metric: str, period: TrendPeriod = "daily", platform: Optional[AnalyticsPlatform] = None):
+    """Get analytics trends for a specific metric (MessagePack with Accept: application/msgpack)"""
+    cache_key = analytics_cache.key(campaign_id, "trends", metric, period, platform)
+    cached = analytics_cache.get(cache_key)
+    if cached is not None:
+        return _analytics_body_response(request, cached)
     try:
-        conn = get_db_connection()
-        cur = conn.cursor(cursor_factory=RealDictCursor)
-        
         # Build platform filter
-        platform_filter = ""
+        platform_filter = _PLATFORM_FILTER[platform is not None]
         params = [campaign_id, metric]
-        if platform:
-            platform_filter = "AND platform = %s"
+        if platform is not None:
             params.append(platform)
         
         # Get trend data based on period
-        if period == "hourly":
-            group_by = "DATE_TRUNC('hour', date_recorded)"
-        elif period == "daily":
-            group_by = "DATE(date_recorded)"
-        elif period == "weekly":
-            group_by = "DATE_TRUNC('week', date_recorded)"
-        elif period == "monthly":
-            group_by = "DATE_TRUNC('month', date_recorded)"
-        else:
-            group_by = "DATE(date_recorded)"
+        group_by = _TREND_BUCKETS[period]
         
+        with _db_connection() as conn, conn.cursor(cursor_factory=RealDictCursor) as cur:
       
         
-        trends = [dict(row) for row in cur.fetchall()]
+            trends = cur.fetchall()
         
-        cur.close()
-        conn.close()
-        
-        return {
+        body = RowsJSONResponse({
             "campaign_id": campaign_id,
             "metric": metric,
             "period": period,
             "platform": platform,
             "trends": trends
-        }
+        }).body
+        analytics_cache.set(cache_key, campaign_id, body)
+        return _analytics_body_response(request, body)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
 
 @app.get("/analytics/platform/{platform}/summary")
-def get_platform_analytics_summary(platform: str, start_date: Optional[str] = None, end_date: Optional[str] = None):
+def get_platform_analytics_summary(platform: AnalyticsPlatform, start_date: Optional[str] = None, end_date: Optional[str] = None, conn=Depends(db)):
     """Get analytics summary for a specific platform across all campaigns"""
     try:
-        conn = get_db_connection()
-        cur = conn.cursor(cursor_factory=RealDictCursor)
-        
         # Build date filter
-        date_filter = ""
+        has_range = bool(start_date and end_date)
+        date_filter = _RECORDED_RANGE_FILTER[has_range]
         params = [platform]
-        if start_date and end_date:
-            date_filter = "AND date_recorded BETWEEN %s AND %s"
+        if has_range:
             params.extend([start_date, end_date])
         
-        # Get platform-specific analytics
+        with conn.cursor(cursor_factory=RealDictCursor) as cur:
+            # Get platform-specific analytics
     
         
-        cur.close()
-        conn.close()
-        
-        return {
+        return RowsJSONResponse({
             "platform": platform,
             "date_range": {
                 "start_date": start_date,
                 "end_date": end_date
             },
             "analytics_summary": platform_analytics
-        }
+        })
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
 
@@ -1008,94 +1361,355 @@ def get_platform_analytics_summary(platform: str, start_date: Optional[str] = No
 # SOCIAL MEDIA ACCOUNT MANAGEMENT ENDPOINTS (Task 2.4)
 # ============================================================================
 
+# Cached account reads share one group, so any account write drops them all
+_SOCIAL_ACCOUNTS_GROUP = "accounts"
+_SOCIAL_ACCOUNT_LIST = TypeAdapter(List[SocialMediaAccountResponse])
+# WHERE clause per (platform given, is_active): six fixed statement texts, each prepared once
+# per pooled connection by asyncpg's statement cache. is_active is inlined rather than bound
+# so generic plans can still match a partial index on active accounts (WHERE is_active)
+_SOCIAL_ACCOUNT_FILTERS = MappingProxyType({
+    (False, None): "",
+    (True, None): "WHERE platform = %s",
+    (False, True): "WHERE is_active",
+    (True, True): "WHERE platform = %s AND is_active",
+    (False, False): "WHERE NOT is_active",
+    (True, False): "WHERE platform = %s AND NOT is_active",
+})
+
+# Authenticated RedditPlatform per account: authenticate() is a full OAuth exchange, so posts,
+# metrics and status checks for the same account reuse one client for a while (rebuilt if the
+# stored refresh token changes; account updates/deletes drop it). praw is not thread-safe, so
+# each account's client is only used while holding that account's lock, which also makes
+# concurrent misses share one OAuth exchange. Least recently used accounts are evicted.
+_REDDIT_CLIENT_TTL_SECONDS = 1800.0
+_REDDIT_CLIENT_MAX_ACCOUNTS = 256
+
+@dataclasses.dataclass
+class _RedditClientSlot:
+    lock: threading.Lock = dataclasses.field(default_factory=threading.Lock)
+    created_at: float = 0.0
+    refresh_token: Optional[str] = None
+    platform: object = None
+
+_reddit_platforms: "OrderedDict[int, _RedditClientSlot]" = OrderedDict()
+_reddit_platforms_lock = threading.Lock()
+
+@contextmanager
+def _reddit_platform(account_id: int, account):
+    """Yield the account's authenticated RedditPlatform, holding the account's lock."""
+    refresh_token = account.get("refresh_token")
+    with _reddit_platforms_lock:
+        slot = _reddit_platforms.get(account_id)
+        if slot is None:
+            slot = _reddit_platforms[account_id] = _RedditClientSlot()
+        _reddit_platforms.move_to_end(account_id)
+        while len(_reddit_platforms) > _REDDIT_CLIENT_MAX_ACCOUNTS:
+            _reddit_platforms.popitem(last=False)
+    with slot.lock:
+        if (
+            slot.platform is None
+            or slot.refresh_token != refresh_token
+            or time.monotonic() - slot.created_at >= _REDDIT_CLIENT_TTL_SECONDS
+        ):
+            slot.platform = None
+            cfg = _reddit_config()
+            if refresh_token:
+                cfg.refresh_token = SecretStr(refresh_token)
+            platform = _reddit_platform_cls()(cfg)
+            platform.authenticate()
+            slot.created_at, slot.refresh_token, slot.platform = time.monotonic(), refresh_token, platform
+        yield slot.platform
+
+def _drop_reddit_platform(account_id: int) -> None:
+    with _reddit_platforms_lock:
+        _reddit_platforms.pop(account_id, None)
+
+def _reddit_user(account_id: int, account):
+    """Fetch the account's Reddit identity, so the stored token is checked against Reddit itself
+    (a reused client alone does not prove the token was not revoked)."""
+    try:
+        with _reddit_platform(account_id, account) as rp:
+            return rp._reddit_client.user.me()
+    except Exception:
+        # A client whose token stopped working is rebuilt on the next call
+        _drop_reddit_platform(account_id)
+        raise
+
+def _validate_reddit_token(account_id: int, account) -> dict:
+    # Reddit tokens are refresh-token based and typically permanent: validate, no rotation
+    try:
+        _reddit_user(account_id, account)
+    except Exception as e:
+        raise HTTPException(status_code=401, detail=f"Reddit authentication failed: {e}")
+    return {
+        "message": "Reddit token validated successfully",
+        "account_id": account_id,
+        "platform": "reddit",
+    }
+
+def _check_account_connection(account_id: int, account) -> dict:
+    platform_name = (account["platform"] or "").lower()
+    if platform_name == "reddit":
+        user = _reddit_user(account_id, account)
+        connection_status = "connected"
+        account_info = {
+            "platform": "reddit",
+            "account_name": getattr(user, "name", account['account_name']),
+            "account_handle": getattr(user, "name", account['account_handle']),
+            "link_karma": getattr(user, "link_karma", None),
+            "comment_karma": getattr(user, "comment_karma", None),
+            "created_utc": getattr(user, "created_utc", None),
+        }
+        return {
+            "message": "Connection test completed",
+            "account_id": account_id,
+            "connection_status": connection_status,
+            "account_info": account_info
+        }
+    
+    # Default behavior for other platforms (simulate success)
+    connection_status = "connected"
+    account_info = {
+        "platform": account['platform'],
+        "account_name": account['account_name'],
+        "account_handle": account['account_handle'],
+    }
+    return {
+        "message": "Connection test completed",
+        "account_id": account_id,
+        "connection_status": connection_status,
+        "account_info": account_info
+    }
+
+def _run_account_job(key: str, account_id: int, check, *args) -> None:
+    try:
+        outcome = {"status": "completed", "result": check(*args)}
+    except HTTPException as e:
+        outcome = {"status": "failed", "status_code": e.status_code, "detail": e.detail}
+    except Exception as e:
+        outcome = {"status": "failed", "status_code": 500, "detail": str(e)}
+    try:
+        body = RowsJSONResponse(outcome).body
+    except Exception as e:
+        # An unserialisable result must still end the job rather than leave it pending
+        body = RowsJSONResponse({"status": "failed", "status_code": 500, "detail": str(e)}).body
+    social_account_jobs.set(key, account_id, body)
+
+def _enqueue_account_job(background_tasks: BackgroundTasks, account_id: int, check, *args):
+    """Run check(*args) after the response is sent; 202 with the job's status URL.
+
+    Job state must be visible to whichever worker serves the poll, so without a shared
+    job store (REDIS_URL unset and several workers) the check runs inline instead.
+    """
+    if not social_account_jobs.shared:
+        return check(*args)
+    job_id = uuid.uuid4().hex
+    key = social_account_jobs.key(account_id, "job", job_id)
+    social_account_jobs.set(key, account_id, b'{"status":"pending"}')
+    background_tasks.add_task(_run_account_job, key, account_id, check, *args)
+    return JSONResponse(status_code=202, content={
+        "job_id": job_id,
+        "status": "pending",
+        "status_url": f"/social-accounts/{account_id}/jobs/{job_id}",
+    })
+
+@functools.lru_cache(maxsize=8)
+def _account_page_sql(sql: str) -> str:
+    # Keyset page over a social-account query: resumes after the last account_id sent
+    return f"SELECT * FROM ({sql}) accounts WHERE account_id > %s ORDER BY account_id LIMIT %s"
+
+def _account_json(account) -> bytes:
+    # Rows come straight from the table: construct without validation; fields outside the
+    # response model (tokens) are dropped
+    return SocialMediaAccountResponse.model_construct(**account).model_dump_json().encode("utf-8")
+
+def _account_response(account) -> Response:
+    """Render an account row through the response model, skipping FastAPI's
+    validate + jsonable_encoder pass."""
+    return Response(content=_account_json(account), media_type="application/json")
+
+def _accounts_json_response(request: Request, body: bytes) -> Response:
+    """Send body with a validator derived from its bytes; a client that already holds
+    this version (If-None-Match) gets an empty 304. Clients revalidate on every use."""
+    etag = f'W/"{hashlib.blake2b(body, digest_size=12).hexdigest()}"'
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+def _cached_accounts_json(request: Request, key: str) -> Optional[Response]:
+    body = social_accounts_cache.get(key)
+    return None if body is None else _accounts_json_response(request, body)
+
+def _cache_accounts_json(request: Request, key: str, body: bytes) -> Response:
+    social_accounts_cache.set(key, _SOCIAL_ACCOUNTS_GROUP, body)
+    return _accounts_json_response(request, body)
+
+async def _acached_accounts_json(request: Request, key: str) -> Optional[Response]:
+    body = await social_accounts_cache.aget(key)
+    return None if body is None else _accounts_json_response(request, body)
+
+async def _acache_accounts_json(request: Request, key: str, body: bytes) -> Response:
+    await social_accounts_cache.aset(key, _SOCIAL_ACCOUNTS_GROUP, body)
+    return _accounts_json_response(request, body)
+
 @app.post("/social-accounts", response_model=SocialMediaAccountResponse)
-def create_social_account(account: SocialMediaAccountCreate):
+def create_social_account(account: SocialMediaAccountCreate, conn=Depends(db)):
     """Create a new social media account"""
     try:
         
         
-        return dict(new_account)
+        social_accounts_cache.invalidate(_SOCIAL_ACCOUNTS_GROUP)
+        return _account_response(new_account)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
+
+# Bulk creation writes every SocialMediaAccountCreate field and returns the public columns
+_SOCIAL_ACCOUNT_COLUMNS = tuple(SocialMediaAccountCreate.model_fields)
+_SOCIAL_ACCOUNT_RETURNING = tuple(SocialMediaAccountResponse.model_fields)
+_SOCIAL_ACCOUNT_BULK_INSERT_SQL = (
+    f"INSERT INTO social_media_accounts ({', '.join(_SOCIAL_ACCOUNT_COLUMNS)}) VALUES %s "
+    f"RETURNING {', '.join(_SOCIAL_ACCOUNT_RETURNING)}"
+)
+_SOCIAL_ACCOUNT_ROW = operator.attrgetter(*_SOCIAL_ACCOUNT_COLUMNS)
+# Update and delete report a missing account through RETURNING (no existence SELECT first)
+_SOCIAL_ACCOUNT_UPDATE_SQL = (
+    f"UPDATE social_media_accounts SET {', '.join(f'{c} = %s' for c in _SOCIAL_ACCOUNT_COLUMNS)}, "
+    f"updated_at = NOW() WHERE account_id = %s RETURNING {', '.join(_SOCIAL_ACCOUNT_RETURNING)}"
+)
+_SOCIAL_ACCOUNT_DELETE_SQL = "DELETE FROM social_media_accounts WHERE account_id = %s RETURNING account_id"
+
+@app.post("/social-accounts/bulk", response_model=List[SocialMediaAccountResponse])
+def create_social_accounts_bulk(accounts: List[SocialMediaAccountCreate], conn=Depends(db)):
+    """Create many social media accounts with a single multi-row INSERT"""
+    if not accounts:
+        return []
+    try:
+        with conn.cursor() as cur:
+            rows = execute_values(
+                cur,
+                _SOCIAL_ACCOUNT_BULK_INSERT_SQL,
+                list(map(_SOCIAL_ACCOUNT_ROW, accounts)),
+                page_size=500,
+                fetch=True,
+            )
+        conn.commit()
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
+    social_accounts_cache.invalidate(_SOCIAL_ACCOUNTS_GROUP)
+    return Response(content=_SOCIAL_ACCOUNT_LIST.dump_json(
+        [SocialMediaAccountResponse.model_construct(**dict(zip(_SOCIAL_ACCOUNT_RETURNING, row))) for row in rows]
+    ), media_type="application/json")
 
 @app.get("/social-accounts", response_model=List[SocialMediaAccountResponse])
-def get_social_accounts(platform: Optional[str] = None, is_active: Optional[bool] = None):
-    """Get all social media accounts with optional filtering"""
+async def get_social_accounts(
+    request: Request,
+    platform: Optional[str] = None,
+    is_active: Optional[bool] = None,
+    limit: Optional[int] = Query(None, ge=1, le=1000),
+    cursor: Optional[int] = None,
+):
+    """Get all social media accounts with optional filtering.
+
+    With limit set, returns one page ordered by account_id, starting after cursor; the
+    X-Next-Cursor header carries the cursor for the next page while there may be more.
+    """
+    cache_key = social_accounts_cache.key(_SOCIAL_ACCOUNTS_GROUP, "list", platform, is_active)
+    if limit is None:
+        cached = await _acached_accounts_json(request, cache_key)
+        if cached is not None:
+            return cached
     try:
-        conn = get_db_connection()
-        cur = conn.cursor(cursor_factory=RealDictCursor)
-        
         # Build filter conditions
-        conditions = []
-        params = []
+        params = [platform] if platform else []
+        where_clause = _SOCIAL_ACCOUNT_FILTERS[bool(platform), is_active]
         
-        if platform:
-            conditions.append("platform = %s")
-            params.append(platform)
-        
-        if is_active is not None:
-            conditions.append("is_active = %s")
-            params.append(is_active)
         
-        where_clause = ""
-        if conditions:
-            where_clause = "WHERE " + " AND ".join(conditions)
+        if limit is not None:
+            accounts = await _fetch_rows(_account_page_sql(social_accounts_sql), [*params, cursor or 0, limit])
+            headers = {"X-Next-Cursor": str(accounts[-1]["account_id"])} if len(accounts) == limit else None
+            return Response(content=_SOCIAL_ACCOUNT_LIST.dump_json(
+                [SocialMediaAccountResponse.model_construct(**row) for row in accounts]
+            ), media_type="application/json", headers=headers)
         
+        accounts = await _fetch_rows(social_accounts_sql, params)
         
-        accounts = [dict(row) for row in cur.fetchall()]
-        cur.close()
-        conn.close()
-        
-        return accounts
+        # Rendered through the response model, so only the public fields are cached
+        return await _acache_accounts_json(request, cache_key, _SOCIAL_ACCOUNT_LIST.dump_json(
+            [SocialMediaAccountResponse.model_construct(**row) for row in accounts]
+        ))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
 
 @app.get("/social-accounts/{account_id}", response_model=SocialMediaAccountResponse)
-def get_social_account(account_id: int):
+def get_social_account(request: Request, account_id: int, conn=Depends(db)):
     """Get a specific social media account"""
+    cache_key = social_accounts_cache.key(_SOCIAL_ACCOUNTS_GROUP, "account", account_id)
+    cached = _cached_accounts_json(request, cache_key)
+    if cached is not None:
+        return cached
     try:
         
         
         if not account:
             raise HTTPException(status_code=404, detail="Social media account not found")
         
-        return dict(account)
+        return _cache_accounts_json(request, cache_key, _account_json(account))
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
 
 @app.put("/social-accounts/{account_id}", response_model=SocialMediaAccountResponse)
-def update_social_account(account_id: int, account: SocialMediaAccountCreate):
+def update_social_account(account_id: int, account: SocialMediaAccountCreate, conn=Depends(db)):
     """Update a social media account"""
     try:
-        
+        cur = conn.cursor()
+        cur.execute(_SOCIAL_ACCOUNT_UPDATE_SQL, (*_SOCIAL_ACCOUNT_ROW(account), account_id))
+        row = cur.fetchone()
+        if row is None:
+            cur.close()
             raise HTTPException(status_code=404, detail="Social media account not found")
+        updated_account = dict(zip(_SOCIAL_ACCOUNT_RETURNING, row))
         
         conn.commit()
         cur.close()
-        conn.close()
+        social_accounts_cache.invalidate(_SOCIAL_ACCOUNTS_GROUP)
+        _drop_reddit_platform(account_id)
         
-        return dict(updated_account)
+        return _account_response(updated_account)
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
 
 @app.delete("/social-accounts/{account_id}")
-def delete_social_account(account_id: int):
+def delete_social_account(account_id: int, conn=Depends(db)):
     """Delete a social media account"""
     try:
-        
+        cur = conn.cursor()
+        cur.execute(_SOCIAL_ACCOUNT_DELETE_SQL, (account_id,))
+        if cur.fetchone() is None:
+            cur.close()
             raise HTTPException(status_code=404, detail="Social media account not found")
         
         conn.commit()
         cur.close()
-        conn.close()
+        social_accounts_cache.invalidate(_SOCIAL_ACCOUNTS_GROUP)
+        _drop_reddit_platform(account_id)
         
         return {"message": "Social media account deleted successfully"}
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
 
 @app.post("/social-accounts/{account_id}/refresh-token")
-def refresh_social_account_token(account_id: int):
-    """Refresh the access token for a social media account"""
+def refresh_social_account_token(account_id: int, background_tasks: BackgroundTasks, background: bool = False, conn=Depends(db)):
+    """Refresh the access token for a social media account.
+
+    With background=true, Reddit validation runs after the response (202 plus a job id to poll).
+    """
     try:
         
             raise HTTPException(status_code=404, detail="Social media account not found")
@@ -1103,24 +1717,10 @@ def refresh_social_account_token(account_id: int):
         platform_name = (account["platform"] or "").lower()
         # Reddit: tokens are refresh-token based and typically permanent. Validate connection.
         if platform_name == "reddit":
-            cfg = load_platform_config_from_env("reddit", prefix="REDDIT")
-            if account.get("refresh_token"):
-                from pydantic import SecretStr
-                cfg.refresh_token = SecretStr(account["refresh_token"]) 
-            cfg.extra["user_agent"] = "redacted-app:v1.0 (by u/redacted-app)"
-            try:
-                rp = RedditPlatform(cfg)
-                rp.authenticate()
-                # No token rotation necessary; return success
-                cur.close(); conn.close()
-                return {
-                    "message": "Reddit token validated successfully",
-                    "account_id": account_id,
-                    "platform": "reddit",
-                }
-            except Exception as e:
-                cur.close(); conn.close()
-                raise HTTPException(status_code=401, detail=f"Reddit authentication failed: {e}")
+            cur.close()
+            if background:
+                return _enqueue_account_job(background_tasks, account_id, _validate_reddit_token, account_id, account)
+            return _validate_reddit_token(account_id, account)
         
         # Twitter/X or others: keep existing simulated refresh or platform-specific logic
         new_access_token = f"new_token_{account['platform']}_{account_id}"
@@ -1129,8 +1729,13 @@ def refresh_social_account_token(account_id: int):
         )
         
         updated_account = cur.fetchone()
+        if updated_account is None:
+            # Deleted between the lookup and the UPDATE ... RETURNING
+            cur.close()
+            raise HTTPException(status_code=404, detail="Social media account not found")
         conn.commit()
-        cur.close(); conn.close()
+        cur.close()
+        social_accounts_cache.invalidate(_SOCIAL_ACCOUNTS_GROUP)
         
         return {
             "message": "Token refreshed successfully",
@@ -1138,594 +1743,591 @@ def refresh_social_account_token(account_id: int):
             "platform": updated_account['platform'],
             "account_name": updated_account['account_name']
         }
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
 
 @app.get("/social-accounts/platform/{platform}/accounts")
-def get_accounts_by_platform(platform: str):
+async def get_accounts_by_platform(request: Request, platform: str):
     """Get all accounts for a specific platform"""
+    cache_key = social_accounts_cache.key(_SOCIAL_ACCOUNTS_GROUP, "platform", platform)
+    cached = await _acached_accounts_json(request, cache_key)
+    if cached is not None:
+        return cached
     try:
         
         
-        return {
-            "platform": platform,
-            "accounts": accounts,
-            "total_accounts": len(accounts)
-        }
+        # Postgres aggregates the rows and their count into the JSON that is sent as-is
+        accounts = await _fetch_value(
+            _json_rows_with_count_sql(platform_accounts_sql, "accounts", "total_accounts"), [platform]
+        )
+        return await _acache_accounts_json(request, cache_key, _json_object_with({"platform": platform}, accounts))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
 
 @app.post("/social-accounts/{account_id}/test-connection")
-def test_social_account_connection(account_id: int):
-    """Test the connection to a social media account"""
+def test_social_account_connection(account_id: int, background_tasks: BackgroundTasks, background: bool = False, conn=Depends(db)):
+    """Test the connection to a social media account.
+
+    With background=true the platform check runs after the response (202 plus a job id to poll).
+    """
     try:
         
         
         if not account:
             raise HTTPException(status_code=404, detail="Social media account not found")
         
-        platform_name = (account["platform"] or "").lower()
-        if platform_name == "reddit":
-            cfg = load_platform_config_from_env("reddit", prefix="REDDIT")
-            if account.get("refresh_token"):
-                from pydantic import SecretStr
-                cfg.refresh_token = SecretStr(account["refresh_token"])
-            cfg.extra["user_agent"] = "redacted-app:v1.0 (by u/redacted-app)"
-            rp = RedditPlatform(cfg)
-            rp.authenticate()
-            user = rp._reddit_client.user.me()
-            connection_status = "connected"
-            account_info = {
-                "platform": "reddit",
-                "account_name": getattr(user, "name", account['account_name']),
-                "account_handle": getattr(user, "name", account['account_handle']),
-                "link_karma": getattr(user, "link_karma", None),
-                "comment_karma": getattr(user, "comment_karma", None),
-                "created_utc": getattr(user, "created_utc", None),
-            }
-            return {
-                "message": "Connection test completed",
-                "account_id": account_id,
-                "connection_status": connection_status,
-                "account_info": account_info
-            }
-        
-        # Default behavior for other platforms (simulate success)
-        connection_status = "connected"
-        account_info = {
-            "platform": account['platform'],
-            "account_name": account['account_name'],
-            "account_handle": account['account_handle'],
-        }
-        return {
-            "message": "Connection test completed",
-            "account_id": account_id,
-            "connection_status": connection_status,
-            "account_info": account_info
-        }
+        if background:
+            return _enqueue_account_job(background_tasks, account_id, _check_account_connection, account_id, account)
+        return _check_account_connection(account_id, account)
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
 
-# ============================================================================
-# COMPREHENSIVE TESTING AND VALIDATION ENDPOINTS (Task 2.5)
-# ============================================================================
+class AccountConnectionsRequest(BaseModel):
+    account_ids: List[int] = Field(..., min_length=1, max_length=100)
 
-@app.post("/test/analytics-comprehensive")
-def test_analytics_comprehensive():
-    """Comprehensive test of all analytics functionality"""
+_ACCOUNTS_BY_ID_SQL = "SELECT * FROM social_media_accounts WHERE account_id = ANY(%s)"
+# Platform checks in flight at once across bulk requests in this worker, so a large batch
+# neither fills the shared threadpool (sync handlers need it too) nor bursts the platforms
+_BULK_CONNECTION_CHECKS = 8
+_bulk_connection_slots = asyncio.Semaphore(_BULK_CONNECTION_CHECKS)
+
+@app.post("/social-accounts/test-connection/bulk")
+async def test_social_account_connections(request: AccountConnectionsRequest):
+    """Test the connections of several accounts at once.
+
+    The accounts are loaded in one query and the (blocking) platform checks run on the
+    threadpool, at most _BULK_CONNECTION_CHECKS at a time.
+    """
     try:
-        test_results = {
-            "timestamp": "2024-08-05T21:45:00Z",
-            "test_suite": "Analytics Comprehensive Test",
-            "results": {}
-        }
-        
-        # Test 1: Raw Analytics Data Collection
-        try:
-            analytics_data = {
-                "campaign_id": 15,
-                "platform": "twitter",
-                "content_id": "test_tweet_001",
-                "metric_category": "engagement",
-                "metric_name": "likes",
-                "metric_value": 250.0,
-                "date_recorded": "2024-08-05T21:45:00Z",
-                "demographic_segment": "18-34",
-                "device_type": "mobile",
-                "location_country": "US",
-                "confidence_score": 0.95
-            }
-            
-            response = requests.post("https://redacted.example.com/analytics/collect", json=analytics_data)
-            test_results["results"]["raw_analytics"] = {
-                "status": "PASS" if response.status_code == 200 else "FAIL",
-                "response": response.json() if response.status_code == 200 else response.text,
-                "status_code": response.status_code
-            }
-        except Exception as e:
-            test_results["results"]["raw_analytics"] = {
-                "status": "ERROR",
-                "error": str(e)
-            }
-        
-        # Test 2: Content Performance Data
-        try:
-            content_data = {
-                "campaign_id": 15,
-                "content_type": "post",
-                "platform": "twitter",
-                "content_id": "test_tweet_001",
-                "title": "Test Analytics Tweet",
-                "content_text": "Testing comprehensive analytics functionality",
-                "engagement_rate": 0.12,
-                "virality_score": 0.08,
-                "sentiment_score": 0.85,
-                "keywords": ["analytics", "testing", "comprehensive"],
-                "hashtags": ["#analytics", "#testing"],
-                "mentions": ["@redacted-app"]
-            }
-            
-            response = requests.post("https://redacted.example.com/analytics/content-performance", json=content_data)
-            test_results["results"]["content_performance"] = {
-                "status": "PASS" if response.status_code == 200 else "FAIL",
-                "response": response.json() if response.status_code == 200 else response.text,
-                "status_code": response.status_code
-            }
-        except Exception as e:
-            test_results["results"]["content_performance"] = {
-                "status": "ERROR",
-                "error": str(e)
-            }
-        
-        # Test 3: Conversion Tracking
-        try:
-            conversion_data = {
-                "campaign_id": 15,
-                "platform": "twitter",
-                "conversion_type": "click",
-                "conversion_value": 10.0,
-                "conversion_currency": "USD",
-                "attribution_source": "twitter_organic",
-                "user_id": "user_123",
-                "session_id": "session_456",
-                "referrer_url": "https://redacted.example.com",
-                "landing_page": "https://redacted.example.com",
-                "conversion_date": "2024-08-05T21:45:00Z"
-            }
-            
-            response = requests.post("https://redacted.example.com/analytics/conversions", json=conversion_data)
-            test_results["results"]["conversion_tracking"] = {
-                "status": "PASS" if response.status_code == 200 else "FAIL",
-                "response": response.json() if response.status_code == 200 else response.text,
-                "status_code": response.status_code
-            }
-        except Exception as e:
-            test_results["results"]["conversion_tracking"] = {
-                "status": "ERROR",
-                "error": str(e)
-            }
-        
-        # Test 4: Platform-Specific Analytics
-        try:
-            twitter_data = {
-                "campaign_id": 15,
-                "tweet_id": "test_tweet_001",
-                "retweets": 45,
-                "likes": 250,
-                "replies": 12,
-                "quotes": 8,
-                "impressions": 8500,
-                "reach": 5200,
-                "profile_visits": 150,
-                "link_clicks": 89,
-                "date_recorded": "2024-08-05T21:45:00Z"
-            }
-            
-            response = requests.post("https://redacted.example.com/analytics/twitter", json=twitter_data)
-            test_results["results"]["twitter_analytics"] = {
-                "status": "PASS" if response.status_code == 200 else "FAIL",
-                "response": response.json() if response.status_code == 200 else response.text,
-                "status_code": response.status_code
-            }
-        except Exception as e:
-            test_results["results"]["twitter_analytics"] = {
-                "status": "ERROR",
-                "error": str(e)
-            }
-        
-        # Test 5: Analytics Summary
+        accounts = await _fetch_rows(_ACCOUNTS_BY_ID_SQL, [request.account_ids])
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
+
+    async def check(account):
         try:
-            response = requests.get("https://redacted.example.com/analytics/campaign/15/summary")
-            test_results["results"]["analytics_summary"] = {
-                "status": "PASS" if response.status_code == 200 else "FAIL",
-                "response": response.json() if response.status_code == 200 else response.text,
-                "status_code": response.status_code
-            }
+            async with _bulk_connection_slots:
+                return await run_in_threadpool(_check_account_connection, account["account_id"], account)
         except Exception as e:
-            test_results["results"]["analytics_summary"] = {
-                "status": "ERROR",
-                "error": str(e)
-            }
-        
-        # Test 6: Analytics Trends
+            return {"account_id": account["account_id"], "connection_status": "failed", "detail": str(e)}
+
+    results = await asyncio.gather(*map(check, accounts))
+    found = {account["account_id"] for account in accounts}
+    return {
+        "results": results,
+        "not_found": [account_id for account_id in request.account_ids if account_id not in found],
+    }
+
+@app.get("/social-accounts/{account_id}/jobs/{job_id}")
+def get_social_account_job(account_id: int, job_id: str):
+    """Status of a background refresh-token / test-connection job"""
+    body = social_account_jobs.get(social_account_jobs.key(account_id, "job", job_id))
+    if body is None:
+        raise HTTPException(status_code=404, detail="Job not found or expired")
+    return Response(content=body, media_type="application/json")
+
+# ============================================================================
+# BATCH ENDPOINT
+# ============================================================================
+
+class BatchOperation(BaseModel):
+    method: Literal["GET", "POST", "PUT", "DELETE"]
+    path: str
+    body: Optional[Any] = None
+    # Return only the length of a successful list/object response, for callers that just count
+    count_only: bool = False
+
+    @field_validator("path")
+    @classmethod
+    def _relative_non_batch_path(cls, v: str) -> str:
+        # Resolve the path the way the router will see it (fragment and query dropped,
+        # percent-escapes decoded) before checking it is not /batch itself
+        parts = urlsplit(v)
+        if parts.scheme or parts.netloc or not v.startswith("/"):
+            raise ValueError("path must be an absolute API path")
+        if posixpath.normpath(unquote(parts.path)).rstrip("/") == "/batch":
+            raise ValueError("path must not be /batch")
+        return v
+
+
+_BATCH_MAX_OPERATIONS = 25
+# Operations in flight across all batch requests in this worker
+_BATCH_MAX_IN_FLIGHT = 50
+_batch_slots = asyncio.Semaphore(_BATCH_MAX_IN_FLIGHT)
+# Set while a batch is being dispatched, so an operation that reaches /batch again is refused
+_in_batch = contextvars.ContextVar("in_batch", default=False)
+_batch_client = None
+
+
+def _get_batch_client():
+    """Return the in-process httpx.AsyncClient that dispatches batch operations through this app."""
+    global _batch_client
+    if _batch_client is None:
+        import httpx
+        _batch_client = httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://batch")
+    return _batch_client
+
+
+async def _dispatch_batch_operation(operation: BatchOperation) -> dict:
+    """Run one batch operation against this app and return its status and decoded body
+    (or, for a successful count_only operation, the body's length)."""
+    async with _batch_slots:
+        response = await _get_batch_client().request(
+            operation.method,
+            operation.path,
+            content=None if operation.body is None else _json_bytes(operation.body),
+            headers=None if operation.body is None else {"content-type": "application/json"},
+        )
+    try:
+        body = _json_loads(response.content)
+    except ValueError:
+        body = response.text
+    if operation.count_only and response.status_code == 200:
+        return {"status": response.status_code, "count": len(body) if isinstance(body, (list, dict)) else None}
+    return {"status": response.status_code, "body": body}
+
+
+@app.post("/batch")
+async def run_batch(operations: List[BatchOperation]):
+    """Run several API calls in one round trip.
+
+    Operations are dispatched concurrently in-process, so only batch calls that do not
+    depend on each other; results come back in request order as {status, body}, or
+    {status, count} for successful count_only operations.
+    """
+    if _in_batch.get():
+        raise HTTPException(status_code=400, detail="Batches cannot be nested")
+    if len(operations) > _BATCH_MAX_OPERATIONS:
+        raise HTTPException(status_code=400, detail=f"At most {_BATCH_MAX_OPERATIONS} operations per batch")
+    token = _in_batch.set(True)
+    try:
+        return await asyncio.gather(*(_dispatch_batch_operation(op) for op in operations))
+    finally:
+        _in_batch.reset(token)
+
+# ============================================================================
+# COMPREHENSIVE TESTING AND VALIDATION ENDPOINTS (Task 2.5)
+# ============================================================================
+
+# Self-test probes hit the deployed API; a shared client keeps connections warm
+# across runs and the timeout stops one hung endpoint from stalling a whole suite
+_SELF_TEST_BASE_URL = "https://redacted.example.com"
+_self_test_client = None
+
+
+def _get_self_test_client():
+    """Return the shared httpx.AsyncClient for self-test probes, creating it on first use."""
+    global _self_test_client
+    if _self_test_client is None:
+        import httpx
         try:
-            response = requests.get("https://redacted.example.com/analytics/campaign/15/trends/likes")
-            test_results["results"]["analytics_trends"] = {
-                "status": "PASS" if response.status_code == 200 else "FAIL",
-                "response": response.json() if response.status_code == 200 else response.text,
-                "status_code": response.status_code
-            }
-        except Exception as e:
-            test_results["results"]["analytics_trends"] = {
-                "status": "ERROR",
-                "error": str(e)
-            }
-        
-        # Calculate overall test status
-        passed_tests = sum(1 for result in test_results["results"].values() if result.get("status") == "PASS")
-        total_tests = len(test_results["results"])
-        test_results["summary"] = {
-            "total_tests": total_tests,
-            "passed_tests": passed_tests,
-            "failed_tests": total_tests - passed_tests,
-            "success_rate": f"{(passed_tests/total_tests)*100:.1f}%" if total_tests > 0 else "0%"
+            import h2  # noqa: F401  (httpx needs it for HTTP/2)
+            http2 = True
+        except ImportError:
+            http2 = False
+        # Over HTTP/2 concurrent probes multiplex on one TLS connection, so a few suffice
+        _self_test_client = httpx.AsyncClient(
+            base_url=_SELF_TEST_BASE_URL,
+            http2=http2,
+            timeout=30.0,
+            limits=httpx.Limits(max_keepalive_connections=4, max_connections=8) if http2
+            else httpx.Limits(max_keepalive_connections=20, max_connections=50),
+        )
+    return _self_test_client
+
+
+@app.on_event("shutdown")
+async def close_http_clients():
+    """Release pooled outbound connections (sync session, self-test and batch clients) on shutdown."""
+    global _self_test_client, _batch_client
+    _HTTP_SESSION.close()
+    if _self_test_client is not None:
+        await _self_test_client.aclose()
+        _self_test_client = None
+    if _batch_client is not None:
+        await _batch_client.aclose()
+        _batch_client = None
+
+
+def _probe_result(entry: dict, count: bool) -> dict:
+    """Summarise one /batch entry as a test result.
+
+    count=True reports the count of a count_only operation instead of the body.
+    """
+    ok = entry["status"] == 200
+    result = {"status": "PASS" if ok else "FAIL"}
+    if count:
+        result["response_count"] = (entry.get("count") or 0) if ok else 0
+    else:
+        result["response"] = entry.get("body")
+    result["status_code"] = entry["status"]
+    return result
+
+
+_SELF_TEST_PROBE_GROUP = "probes"
+
+
+def _probe_cache_key(method: str, path: str, count_only: bool = False) -> str:
+    return self_test_probes.key(_SELF_TEST_PROBE_GROUP, method, path, "count" if count_only else "body")
+
+
+async def _run_probes(probes: Mapping[str, tuple], counted: tuple = ()) -> Dict[str, dict]:
+    """Run independent probes in a single /batch round trip, keyed by test name.
+
+    Each probe is (method, path) or (method, path, body); names in counted are sent
+    as count_only operations, so list bodies are measured server-side instead of
+    shipped back. GET probes that recently returned 200 are answered from
+    self_test_probes instead of being sent again.
+    """
+    entries = {}
+    for name, probe in probes.items():
+        if probe[0] == "GET":
+            cached = await self_test_probes.aget(_probe_cache_key(*probe[:2], name in counted))
+            if cached is not None:
+                entries[name] = _json_loads(cached)
+    pending = {name: probe for name, probe in probes.items() if name not in entries}
+    try:
+        if pending:
+            operations = [
+                {
+                    "method": probe[0],
+                    "path": probe[1],
+                    "body": probe[2] if len(probe) > 2 else None,
+                    "count_only": name in counted,
+                }
+                for name, probe in pending.items()
+            ]
+            response = await _get_self_test_client().post(
+                "/batch", content=_json_bytes(operations), headers={"content-type": "application/json"}
+            )
+            response.raise_for_status()
+            for (name, probe), entry in zip(pending.items(), _json_loads(response.content)):
+                entries[name] = entry
+                if probe[0] == "GET" and entry["status"] == 200:
+                    await self_test_probes.aset(_probe_cache_key(*probe[:2], name in counted), _SELF_TEST_PROBE_GROUP, _json_bytes(entry))
+        return {
+            name: _probe_result(entries[name], name in counted)
+            for name in probes
         }
-        
-        return test_results
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Comprehensive test failed: {str(e)}")
+        return {name: {"status": "ERROR", "error": str(e)} for name in probes}
 
-@app.post("/test/social-accounts-comprehensive")
-def test_social_accounts_comprehensive():
-    """Comprehensive test of all social media account functionality"""
+
+def _test_summary(results: Dict[str, dict], rate_key: str = "success_rate") -> dict:
+    """Pass/fail totals for a test run."""
+    passed_tests = sum(1 for result in results.values() if result.get("status") == "PASS")
+    total_tests = len(results)
+    return {
+        "total_tests": total_tests,
+        "passed_tests": passed_tests,
+        "failed_tests": total_tests - passed_tests,
+        rate_key: f"{(passed_tests/total_tests)*100:.1f}%" if total_tests > 0 else "0%"
+    }
+
+
+async def _comprehensive_test(test_suite: str, fresh: bool, run) -> dict:
+    """Run a comprehensive suite: run(test_results) records each named result, and the
+    envelope, summary and error handling are shared. fresh drops cached GET probes first."""
     try:
+        if fresh:
+            await self_test_probes.ainvalidate(_SELF_TEST_PROBE_GROUP)
         test_results = {
-            "timestamp": "2024-08-05T21:45:00Z",
-            "test_suite": "Social Media Accounts Comprehensive Test",
+            "timestamp": _TEST_TIMESTAMP,
+            "test_suite": test_suite,
             "results": {}
         }
+        await run(test_results)
+        test_results["summary"] = _test_summary(test_results["results"])
+        return test_results
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Comprehensive test failed: {str(e)}")
+
+# Fixed inputs for the comprehensive suites, built once at import instead of per run
+_TEST_TIMESTAMP = "2024-08-05T21:45:00Z"
+
+_ANALYTICS_TEST_PAYLOAD = {
+    "campaign_id": 15,
+    "platform": "twitter",
+    "content_id": "test_tweet_001",
+    "metric_category": "engagement",
+    "metric_name": "likes",
+    "metric_value": 250.0,
+    "date_recorded": _TEST_TIMESTAMP,
+    "demographic_segment": "18-34",
+    "device_type": "mobile",
+    "location_country": "US",
+    "confidence_score": 0.95
+}
+_CONTENT_TEST_PAYLOAD = {
+    "campaign_id": 15,
+    "content_type": "post",
+    "platform": "twitter",
+    "content_id": "test_tweet_001",
+    "title": "Test Analytics Tweet",
+    "content_text": "Testing comprehensive analytics functionality",
+    "engagement_rate": 0.12,
+    "virality_score": 0.08,
+    "sentiment_score": 0.85,
+    "keywords": ["analytics", "testing", "comprehensive"],
+    "hashtags": ["#analytics", "#testing"],
+    "mentions": ["@redacted-app"]
+}
+_CONVERSION_TEST_PAYLOAD = {
+    "campaign_id": 15,
+    "platform": "twitter",
+    "conversion_type": "click",
+    "conversion_value": 10.0,
+    "conversion_currency": "USD",
+    "attribution_source": "twitter_organic",
+    "user_id": "user_123",
+    "session_id": "session_456",
+    "referrer_url": "https://redacted.example.com",
+    "landing_page": "https://redacted.example.com",
+    "conversion_date": _TEST_TIMESTAMP
+}
+_TWITTER_TEST_PAYLOAD = {
+    "campaign_id": 15,
+    "tweet_id": "test_tweet_001",
+    "retweets": 45,
+    "likes": 250,
+    "replies": 12,
+    "quotes": 8,
+    "impressions": 8500,
+    "reach": 5200,
+    "profile_visits": 150,
+    "link_clicks": 89,
+    "date_recorded": _TEST_TIMESTAMP
+}
+_ACCOUNT_TEST_PAYLOAD = {
+    "platform": "test_platform",
+    "account_name": "Test Analytics Account",
+    "account_handle": "@test_analytics",
+    "access_token": "test_token_123",
+    "refresh_token": "test_refresh_123",
+    "token_expires_at": "2024-12-31T23:59:59Z",
+    "is_active": True
+}
+_ACCOUNT_UPDATE_TEST_PAYLOAD = {
+    "platform": "test_platform",
+    "account_name": "Test Analytics Account Updated",
+    "account_handle": "@test_analytics_updated",
+    "access_token": "updated_token_123",
+    "refresh_token": "updated_refresh_123",
+    "token_expires_at": "2024-12-31T23:59:59Z",
+    "is_active": True
+}
+_ACTIVATION_TEST_PAYLOAD = {
+    "activation_date": _TEST_TIMESTAMP,
+    "platforms": ["twitter", "linkedin"]
+}
+
+# Probe waves: probes within a wave are independent, later waves see earlier writes
+_ANALYTICS_WRITE_PROBES = MappingProxyType({
+    "raw_analytics": ("POST", "/analytics/collect", _ANALYTICS_TEST_PAYLOAD),
+    "content_performance": ("POST", "/analytics/content-performance", _CONTENT_TEST_PAYLOAD),
+    "conversion_tracking": ("POST", "/analytics/conversions", _CONVERSION_TEST_PAYLOAD),
+    "twitter_analytics": ("POST", "/analytics/twitter", _TWITTER_TEST_PAYLOAD),
+})
+_ANALYTICS_READ_PROBES = MappingProxyType({
+    "analytics_summary": ("GET", "/analytics/campaign/15/summary"),
+    "analytics_trends": ("GET", "/analytics/campaign/15/trends/likes"),
+})
+_ACCOUNT_CREATE_PROBES = MappingProxyType({
+    "create_account": ("POST", "/social-accounts", _ACCOUNT_TEST_PAYLOAD),
+})
+_ACCOUNT_LISTING_PROBES = MappingProxyType({
+    "get_all_accounts": ("GET", "/social-accounts"),
+    "get_accounts_by_platform": ("GET", "/social-accounts?platform=twitter"),
+    "platform_accounts_summary": ("GET", "/social-accounts/platform/twitter/accounts"),
+})
+_ACCOUNT_COUNTED_PROBES = ("get_all_accounts", "get_accounts_by_platform")
+_CAMPAIGN_ACTIVATION_PROBES = MappingProxyType({
+    "get_todays_campaign": ("GET", "/campaigns/today"),
+    "get_draft_campaigns": ("GET", "/campaigns/draft"),
+    "get_active_campaigns": ("GET", "/campaigns/active"),
+    "activate_campaign": ("POST", "/campaigns/15/activate", _ACTIVATION_TEST_PAYLOAD),
+})
+_CAMPAIGN_COUNTED_PROBES = ("get_draft_campaigns", "get_active_campaigns")
+_CAMPAIGN_STATUS_PROBES = MappingProxyType({
+    "get_activation_status": ("GET", "/campaigns/15/activation-status"),
+})
+
+@app.post("/test/analytics-comprehensive")
+async def test_analytics_comprehensive(fresh: bool = False):
+    """Comprehensive test of all analytics functionality"""
+    async def run(test_results):
+        # Tests 1-4: data collection (independent writes, run concurrently)
+        test_results["results"].update(await _run_probes(_ANALYTICS_WRITE_PROBES))
         
+        # Tests 5-6: summary and trends, read after the writes land
+        test_results["results"].update(await _run_probes(_ANALYTICS_READ_PROBES))
+    
+    return await _comprehensive_test("Analytics Comprehensive Test", fresh, run)
+
+@app.post("/test/social-accounts-comprehensive")
+async def test_social_accounts_comprehensive(fresh: bool = False):
+    """Comprehensive test of all social media account functionality"""
+    async def create_then_account_tests(test_results) -> Dict[str, dict]:
         # Test 1: Create Social Account
-        try:
-            account_data = {
-                "platform": "test_platform",
-                "account_name": "Test Analytics Account",
-                "account_handle": "@test_analytics",
-                "access_token": "test_token_123",
-                "refresh_token": "test_refresh_123",
-                "token_expires_at": "2024-12-31T23:59:59Z",
-                "is_active": True
-            }
-            
-            response = requests.post("https://redacted.example.com/social-accounts", json=account_data)
-            test_results["results"]["create_account"] = {
-                "status": "PASS" if response.status_code == 200 else "FAIL",
-                "response": response.json() if response.status_code == 200 else response.text,
-                "status_code": response.status_code
-            }
-            
-            # Extract account_id for subsequent tests
-            if response.status_code == 200:
-                account_id = response.json().get("account_id")
-                test_results["test_account_id"] = account_id
-            else:
-                account_id = None
-                
-        except Exception as e:
-            test_results["results"]["create_account"] = {
-                "status": "ERROR",
-                "error": str(e)
-            }
-            account_id = None
-        
-        # Test 2: Get All Accounts
-        try:
-            response = requests.get("https://redacted.example.com/social-accounts")
-            test_results["results"]["get_all_accounts"] = {
-                "status": "PASS" if response.status_code == 200 else "FAIL",
-                "response_count": len(response.json()) if response.status_code == 200 else 0,
-                "status_code": response.status_code
-            }
-        except Exception as e:
-            test_results["results"]["get_all_accounts"] = {
-                "status": "ERROR",
-                "error": str(e)
-            }
-        
-        # Test 3: Get Accounts by Platform
-        try:
-            response = requests.get("https://redacted.example.com/social-accounts?platform=twitter")
-            test_results["results"]["get_accounts_by_platform"] = {
-                "status": "PASS" if response.status_code == 200 else "FAIL",
-                "response_count": len(response.json()) if response.status_code == 200 else 0,
-                "status_code": response.status_code
-            }
-        except Exception as e:
-            test_results["results"]["get_accounts_by_platform"] = {
-                "status": "ERROR",
-                "error": str(e)
-            }
+        results = await _run_probes(_ACCOUNT_CREATE_PROBES)
         
-        # Test 4: Get Specific Account (if account was created)
-        if account_id:
-            try:
-                response = requests.get(f"https://redacted.example.com/social-accounts/{account_id}")
-                test_results["results"]["get_specific_account"] = {
-                    "status": "PASS" if response.status_code == 200 else "FAIL",
-                    "response": response.json() if response.status_code == 200 else response.text,
-                    "status_code": response.status_code
-                }
-            except Exception as e:
-                test_results["results"]["get_specific_account"] = {
-                    "status": "ERROR",
-                    "error": str(e)
-                }
-        
-        # Test 5: Update Account (if account was created)
-        if account_id:
-            try:
-                update_data = {
-                    "platform": "test_platform",
-                    "account_name": "Test Analytics Account Updated",
-                    "account_handle": "@test_analytics_updated",
-                    "access_token": "updated_token_123",
-                    "refresh_token": "updated_refresh_123",
-                    "token_expires_at": "2024-12-31T23:59:59Z",
-                    "is_active": True
-                }
-                
-                response = requests.put(f"https://redacted.example.com/social-accounts/{account_id}", json=update_data)
-                test_results["results"]["update_account"] = {
-                    "status": "PASS" if response.status_code == 200 else "FAIL",
-                    "response": response.json() if response.status_code == 200 else response.text,
-                    "status_code": response.status_code
-                }
-            except Exception as e:
-                test_results["results"]["update_account"] = {
-                    "status": "ERROR",
-                    "error": str(e)
-                }
-        
-        # Test 6: Test Connection (if account was created)
-        if account_id:
-            try:
-                response = requests.post(f"https://redacted.example.com/social-accounts/{account_id}/test-connection")
-                test_results["results"]["test_connection"] = {
-                    "status": "PASS" if response.status_code == 200 else "FAIL",
-                    "response": response.json() if response.status_code == 200 else response.text,
-                    "status_code": response.status_code
-                }
-            except Exception as e:
-                test_results["results"]["test_connection"] = {
-                    "status": "ERROR",
-                    "error": str(e)
-                }
+        # Extract account_id for subsequent tests
+        created = results["create_account"]
+        if created["status"] == "PASS":
+            account_id = created["response"].get("account_id")
+            test_results["test_account_id"] = account_id
+            
+            # Tests 4-7 need the created account; they start as soon as it exists
+            if account_id:
+                results.update(await _run_probes({
+                    "get_specific_account": ("GET", f"/social-accounts/{account_id}"),
+                    "update_account": ("PUT", f"/social-accounts/{account_id}", _ACCOUNT_UPDATE_TEST_PAYLOAD),
+                    "test_connection": ("POST", f"/social-accounts/{account_id}/test-connection"),
+                    "refresh_token": ("POST", f"/social-accounts/{account_id}/refresh-token"),
+                }))
+        return results
+    
+    async def run(test_results):
+        # Tests 2, 3 and 8 do not depend on the new account, so they overlap the create chain
+        account_results, listing_results = await asyncio.gather(
+            create_then_account_tests(test_results),
+            _run_probes(_ACCOUNT_LISTING_PROBES, counted=_ACCOUNT_COUNTED_PROBES),
+        )
+        test_results["results"].update(account_results)
+        test_results["results"].update(listing_results)
+    
+    return await _comprehensive_test("Social Media Accounts Comprehensive Test", fresh, run)
+
+@app.post("/test/campaign-activation-comprehensive")
+async def test_campaign_activation_comprehensive(fresh: bool = False):
+    """Comprehensive test of campaign activation functionality"""
+    async def run(test_results):
+        # Tests 1-4: campaign listings and activation (use existing campaign)
+        test_results["results"].update(await _run_probes(_CAMPAIGN_ACTIVATION_PROBES, counted=_CAMPAIGN_COUNTED_PROBES))
         
-        # Test 7: Refresh Token (if account was created)
-        if account_id:
-            try:
-                response = requests.post(f"https://redacted.example.com/social-accounts/{account_id}/refresh-token")
-                test_results["results"]["refresh_token"] = {
-                    "status": "PASS" if response.status_code == 200 else "FAIL",
-                    "response": response.json() if response.status_code == 200 else response.text,
-                    "status_code": response.status_code
-                }
-            except Exception as e:
-                test_results["results"]["refresh_token"] = {
-                    "status": "ERROR",
-                    "error": str(e)
-                }
+        # Test 5: Get Campaign Activation Status (after activation)
+        test_results["results"].update(await _run_probes(_CAMPAIGN_STATUS_PROBES))
+    
+    return await _comprehensive_test("Campaign Activation Comprehensive Test", fresh, run)
+
+# Health checks are independent I/O, so the handler runs them concurrently in the threadpool
+
+# Check 1: Database Connection
+def _health_check_database_connection() -> dict:
+    try:
         
-        # Test 8: Platform Accounts Summary
-        try:
-            response = requests.get("https://redacted.example.com/social-accounts/platform/twitter/accounts")
-            test_results["results"]["platform_accounts_summary"] = {
-                "status": "PASS" if response.status_code == 200 else "FAIL",
-                "response": response.json() if response.status_code == 200 else response.text,
-                "status_code": response.status_code
-            }
-        except Exception as e:
-            test_results["results"]["platform_accounts_summary"] = {
-                "status": "ERROR",
-                "error": str(e)
-            }
         
-        # Calculate overall test status
-        passed_tests = sum(1 for result in test_results["results"].values() if result.get("status") == "PASS")
-        total_tests = len(test_results["results"])
-        test_results["summary"] = {
-            "total_tests": total_tests,
-            "passed_tests": passed_tests,
-            "failed_tests": total_tests - passed_tests,
-            "success_rate": f"{(passed_tests/total_tests)*100:.1f}%" if total_tests > 0 else "0%"
+        return {
+            "status": "HEALTHY" if result else "UNHEALTHY",
+            "message": "Database connection successful" if result else "Database connection failed"
         }
-        
-        return test_results
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Comprehensive test failed: {str(e)}")
+        return {
+            "status": "UNHEALTHY",
+            "message": f"Database connection error: {str(e)}"
+        }
 
-@app.post("/test/campaign-activation-comprehensive")
-def test_campaign_activation_comprehensive():
-    """Comprehensive test of campaign activation functionality"""
+
+# Check 2: Analytics Tables
+def _health_check_analytics_tables() -> dict:
     try:
-        test_results = {
-            "timestamp": "2024-08-05T21:45:00Z",
-            "test_suite": "Campaign Activation Comprehensive Test",
-            "results": {}
-        }
         
-        # Test 1: Get Today's Campaign
-        try:
-            response = requests.get("https://redacted.example.com/campaigns/today")
-            test_results["results"]["get_todays_campaign"] = {
-                "status": "PASS" if response.status_code == 200 else "FAIL",
-                "response": response.json() if response.status_code == 200 else response.text,
-                "status_code": response.status_code
-            }
-        except Exception as e:
-            test_results["results"]["get_todays_campaign"] = {
-                "status": "ERROR",
-                "error": str(e)
-            }
         
-        # Test 2: Get Draft Campaigns
-        try:
-            response = requests.get("https://redacted.example.com/campaigns/draft")
-            test_results["results"]["get_draft_campaigns"] = {
-                "status": "PASS" if response.status_code == 200 else "FAIL",
-                "response_count": len(response.json()) if response.status_code == 200 else 0,
-                "status_code": response.status_code
-            }
-        except Exception as e:
-            test_results["results"]["get_draft_campaigns"] = {
-                "status": "ERROR",
-                "error": str(e)
-            }
+        return {
+            "status": "HEALTHY" if result[0] > 0 else "UNHEALTHY",
+            "message": f"Found {result[0]} analytics tables" if result[0] > 0 else "No analytics tables found",
+            "table_count": result[0]
+        }
+    except Exception as e:
+        return {
+            "status": "UNHEALTHY",
+            "message": f"Analytics tables check error: {str(e)}"
+        }
+
+
+# Check 3: Social Media Accounts
+def _health_check_social_accounts() -> dict:
+    try:
         
-        # Test 3: Get Active Campaigns
-        try:
-            response = requests.get("https://redacted.example.com/campaigns/active")
-            test_results["results"]["get_active_campaigns"] = {
-                "status": "PASS" if response.status_code == 200 else "FAIL",
-                "response_count": len(response.json()) if response.status_code == 200 else 0,
-                "status_code": response.status_code
-            }
-        except Exception as e:
-            test_results["results"]["get_active_campaigns"] = {
-                "status": "ERROR",
-                "error": str(e)
-            }
         
-        # Test 4: Activate a Campaign (use existing campaign)
-        try:
-            activation_data = {
-                "activation_date": "2024-08-05T21:45:00Z",
-                "platforms": ["twitter", "linkedin"]
-            }
-            
-            response = requests.post("https://redacted.example.com/campaigns/15/activate", json=activation_data)
-            test_results["results"]["activate_campaign"] = {
-                "status": "PASS" if response.status_code == 200 else "FAIL",
-                "response": response.json() if response.status_code == 200 else response.text,
-                "status_code": response.status_code
-            }
-        except Exception as e:
-            test_results["results"]["activate_campaign"] = {
-                "status": "ERROR",
-                "error": str(e)
-            }
+        return {
+            "status": "HEALTHY" if result[0] >= 0 else "UNHEALTHY",
+            "message": f"Found {result[0]} active social media accounts",
+            "active_accounts": result[0]
+        }
+    except Exception as e:
+        return {
+            "status": "UNHEALTHY",
+            "message": f"Social accounts check error: {str(e)}"
+        }
+
+
+# Check 4: Campaigns
+def _health_check_campaigns() -> dict:
+    try:
         
-        # Test 5: Get Campaign Activation Status
-        try:
-            response = requests.get("https://redacted.example.com/campaigns/15/activation-status")
-            test_results["results"]["get_activation_status"] = {
-                "status": "PASS" if response.status_code == 200 else "FAIL",
-                "response": response.json() if response.status_code == 200 else response.text,
-                "status_code": response.status_code
-            }
-        except Exception as e:
-            test_results["results"]["get_activation_status"] = {
-                "status": "ERROR",
-                "error": str(e)
-            }
         
-        # Calculate overall test status
-        passed_tests = sum(1 for result in test_results["results"].values() if result.get("status") == "PASS")
-        total_tests = len(test_results["results"])
-        test_results["summary"] = {
-            "total_tests": total_tests,
-            "passed_tests": passed_tests,
-            "failed_tests": total_tests - passed_tests,
-            "success_rate": f"{(passed_tests/total_tests)*100:.1f}%" if total_tests > 0 else "0%"
+        return {
+            "status": "HEALTHY" if result[0] >= 0 else "UNHEALTHY",
+            "message": f"Found {result[0]} campaigns",
+            "total_campaigns": result[0]
         }
-        
-        return test_results
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Comprehensive test failed: {str(e)}")
+        return {
+            "status": "UNHEALTHY",
+            "message": f"Campaigns check error: {str(e)}"
+        }
+
+
+# Check 5: API Endpoints
+def _health_check_api_endpoints() -> dict:
+    try:
+        health_key = _probe_cache_key("GET", "/health")
+        if self_test_probes.get(health_key) is not None:
+            status_code = 200
+        else:
+            status_code = _HTTP_SESSION.get("https://redacted.example.com/health", timeout=5).status_code
+            if status_code == 200:
+                self_test_probes.set(health_key, _SELF_TEST_PROBE_GROUP, b"200")
+        return {
+            "status": "HEALTHY" if status_code == 200 else "UNHEALTHY",
+            "message": "API endpoints responding" if status_code == 200 else "API endpoints not responding",
+            "status_code": status_code
+        }
+    except Exception as e:
+        return {
+            "status": "UNHEALTHY",
+            "message": f"API endpoints check error: {str(e)}"
+        }
+
+
+_HEALTH_CHECKS = MappingProxyType({
+    "database_connection": _health_check_database_connection,
+    "analytics_tables": _health_check_analytics_tables,
+    "social_accounts": _health_check_social_accounts,
+    "campaigns": _health_check_campaigns,
+    "api_endpoints": _health_check_api_endpoints,
+})
 
 @app.get("/test/system-health")
-def test_system_health():
+async def test_system_health(fresh: bool = False):
     """Comprehensive system health check"""
     try:
+        if fresh:
+            await self_test_probes.ainvalidate(_SELF_TEST_PROBE_GROUP)
         health_results = {
-            "timestamp": "2024-08-05T21:45:00Z",
+            "timestamp": _TEST_TIMESTAMP,
             "system": "RedactedApp Analytics & Campaign System",
             "version": "2.0.0",
             "checks": {}
         }
         
-        # Check 1: Database Connection
-        try:
-            
-            
-            health_results["checks"]["database_connection"] = {
-                "status": "HEALTHY" if result else "UNHEALTHY",
-                "message": "Database connection successful" if result else "Database connection failed"
-            }
-        except Exception as e:
-            health_results["checks"]["database_connection"] = {
-                "status": "UNHEALTHY",
-                "message": f"Database connection error: {str(e)}"
-            }
-        
-        # Check 2: Analytics Tables
-        try:
-            
-            
-            health_results["checks"]["analytics_tables"] = {
-                "status": "HEALTHY" if result[0] > 0 else "UNHEALTHY",
-                "message": f"Found {result[0]} analytics tables" if result[0] > 0 else "No analytics tables found",
-                "table_count": result[0]
-            }
-        except Exception as e:
-            health_results["checks"]["analytics_tables"] = {
-                "status": "UNHEALTHY",
-                "message": f"Analytics tables check error: {str(e)}"
-            }
-        
-        # Check 3: Social Media Accounts
-        try:
-            
-            
-            health_results["checks"]["social_accounts"] = {
-                "status": "HEALTHY" if result[0] >= 0 else "UNHEALTHY",
-                "message": f"Found {result[0]} active social media accounts",
-                "active_accounts": result[0]
-            }
-        except Exception as e:
-            health_results["checks"]["social_accounts"] = {
-                "status": "UNHEALTHY",
-                "message": f"Social accounts check error: {str(e)}"
-            }
-        
-        # Check 4: Campaigns
-        try:
-            
-            
-            health_results["checks"]["campaigns"] = {
-                "status": "HEALTHY" if result[0] >= 0 else "UNHEALTHY",
-                "message": f"Found {result[0]} campaigns",
-                "total_campaigns": result[0]
-            }
-        except Exception as e:
-            health_results["checks"]["campaigns"] = {
-                "status": "UNHEALTHY",
-                "message": f"Campaigns check error: {str(e)}"
-            }
-        
-        # Check 5: API Endpoints
-        try:
-            response = requests.get("https://redacted.example.com/health")
-            health_results["checks"]["api_endpoints"] = {
-                "status": "HEALTHY" if response.status_code == 200 else "UNHEALTHY",
-                "message": "API endpoints responding" if response.status_code == 200 else "API endpoints not responding",
-                "status_code": response.status_code
-            }
-        except Exception as e:
-            health_results["checks"]["api_endpoints"] = {
-                "status": "UNHEALTHY",
-                "message": f"API endpoints check error: {str(e)}"
-            }
+        # Wall time is the slowest check rather than the sum of all five
+        checks = await asyncio.gather(*(run_in_threadpool(check) for check in _HEALTH_CHECKS.values()))
+        health_results["checks"] = dict(zip(_HEALTH_CHECKS, checks))
         
         # Calculate overall health
         healthy_checks = sum(1 for check in health_results["checks"].values() if check.get("status") == "HEALTHY")
@@ -1746,7 +2348,7 @@ def test_data_validation():
     """Test data validation and integrity"""
     try:
         validation_results = {
-            "timestamp": "2024-08-05T21:45:00Z",
+            "timestamp": _TEST_TIMESTAMP,
             "test_suite": "Data Validation Test",
             "results": {}
         }
@@ -1803,14 +2405,7 @@ def test_data_validation():
             }
         
         # Calculate overall validation status
-        passed_tests = sum(1 for result in validation_results["results"].values() if result.get("status") == "PASS")
-        total_tests = len(validation_results["results"])
-        validation_results["summary"] = {
-            "total_tests": total_tests,
-            "passed_tests": passed_tests,
-            "failed_tests": total_tests - passed_tests,
-            "validation_rate": f"{(passed_tests/total_tests)*100:.1f}%" if total_tests > 0 else "0%"
-        }
+        validation_results["summary"] = _test_summary(validation_results["results"], rate_key="validation_rate")
         
         return validation_results
     except Exception as e:
@@ -1827,10 +2422,10 @@ def test_analytics_models(
     """Test endpoint to verify analytics models are working correctly"""
     return {
         "message": "Analytics models working correctly",
-        "analytics_data": analytics_data.dict(),
-        "content_data": content_data.dict(),
-        "conversion_data": conversion_data.dict(),
-        "activation_request": activation_request.dict()
+        "analytics_data": dataclasses.asdict(analytics_data),
+        "content_data": dataclasses.asdict(content_data),
+        "conversion_data": dataclasses.asdict(conversion_data),
+        "activation_request": activation_request.model_dump()
     }
 
 # ============================================================================
@@ -1852,7 +2447,7 @@ def get_twitter_authorization_url():
             scopes=["tweet.read", "users.read"],
             redirect_uri=cfg.webhook_url,
         )
-        _twitter_oauth_sessions[auth_state.state] = auth_state
+        _twitter_oauth_sessions.put(auth_state.state, auth_state)
         return TwitterAuthURLResponse(authorization_url=url, state=auth_state.state)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -1869,7 +2464,7 @@ def get_twitter_authorization_url_minimal():
             scopes=["users.read"],  # Minimal scope for testing
             redirect_uri=cfg.webhook_url,
         )
-        _twitter_oauth_sessions[auth_state.state] = auth_state
+        _twitter_oauth_sessions.put(auth_state.state, auth_state)
         return TwitterAuthURLResponse(authorization_url=url, state=auth_state.state)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -1924,9 +2519,9 @@ class TwitterCallbackResponse(BaseModel):
 @app.get("/auth/x/callback", response_model=TwitterCallbackResponse)
 def twitter_oauth_callback(code: str, state: str):
     try:
-        if state not in _twitter_oauth_sessions:
-            raise HTTPException(status_code=400, detail="Invalid or expired state")
         auth_state = _twitter_oauth_sessions.pop(state)
+        if auth_state is None:
+            raise HTTPException(status_code=400, detail="Invalid or expired state")
 
         cfg = load_platform_config_from_env("twitter", prefix="TWITTER")
         platform = TwitterPlatform(cfg)
@@ -1934,16 +2529,17 @@ def twitter_oauth_callback(code: str, state: str):
 
         # Fetch user info for account identification
         headers = {"Authorization": f"Bearer {platform.config.access_token.get_secret_value()}"}
-        resp = requests.get(f"{platform.config.api_base_url}/2/users/me", headers=headers, timeout=15)
+        resp = _HTTP_SESSION.get(f"{platform.config.api_base_url}/2/users/me", headers=headers, timeout=15)
         if resp.status_code != 200:
             raise HTTPException(status_code=500, detail=f"Failed to fetch user info: {resp.text}")
-        me = resp.json().get("data", {})
+        me = _json_loads(resp.content).get("data", {})
         account_name = me.get("name") or "Twitter Account"
         account_handle = me.get("username")
 
         # Persist tokens and account info
         
 
+        social_accounts_cache.invalidate(_SOCIAL_ACCOUNTS_GROUP)
         return TwitterCallbackResponse(
             message="Twitter account connected successfully",
             account_id=row["account_id"],
@@ -1965,11 +2561,10 @@ def get_reddit_authorization_url():
     """Get Reddit OAuth authorization URL"""
     try:
         # Load config from env with redirect URI
-        cfg = load_platform_config_from_env("reddit", prefix="REDDIT")
+        cfg = _reddit_config()
         cfg.extra["redirect_uri"] = os.getenv("REDDIT_REDIRECT_URI", "https://redacted.example.com/auth/reddit/oauth2/callback")
-        cfg.extra["user_agent"] = "redacted-app:v1.0 (by u/redacted-app)"
         
-        platform = RedditPlatform(cfg)
+        platform = _reddit_platform_cls()(cfg)
         auth_url, state = platform.build_authorization_url(
             scopes=["identity", "read", "submit"],
             redirect_uri=cfg.extra["redirect_uri"]
@@ -1987,11 +2582,10 @@ def get_reddit_authorization_url():
 def get_reddit_authorization_url_alias():
     """Alias to get Reddit OAuth authorization URL with standard shape."""
     try:
-        cfg = load_platform_config_from_env("reddit", prefix="REDDIT")
+        cfg = _reddit_config()
         cfg.extra["redirect_uri"] = os.getenv("REDDIT_REDIRECT_URI", "https://redacted.example.com/auth/reddit/oauth2/callback")
-        cfg.extra["user_agent"] = "redacted-app:v1.0 (by u/redacted-app)"
         
-        platform = RedditPlatform(cfg)
+        platform = _reddit_platform_cls()(cfg)
         auth_url, state = platform.build_authorization_url(
             scopes=["identity", "read", "submit"],
             redirect_uri=cfg.extra["redirect_uri"]
@@ -2010,11 +2604,10 @@ def reddit_oauth_callback(code: str, state: Optional[str] = None):
     """Handle Reddit OAuth callback"""
     try:
         # Load config
-        cfg = load_platform_config_from_env("reddit", prefix="REDDIT")
+        cfg = _reddit_config()
         cfg.extra["redirect_uri"] = os.getenv("REDDIT_REDIRECT_URI", "https://redacted.example.com/auth/reddit/oauth2/callback")
-        cfg.extra["user_agent"] = "redacted-app:v1.0 (by u/redacted-app)"
         
-        platform = RedditPlatform(cfg)
+        platform = _reddit_platform_cls()(cfg)
         
         # Exchange code for refresh token
         refresh_token = platform.exchange_code_for_token(
@@ -2035,6 +2628,7 @@ def reddit_oauth_callback(code: str, state: Optional[str] = None):
             
             
             
+            social_accounts_cache.invalidate(_SOCIAL_ACCOUNTS_GROUP)
             # Return success HTML page
             return """
             <html>
@@ -2092,10 +2686,9 @@ def reddit_oauth_callback_alias(code: str, state: Optional[str] = None):
 def get_reddit_identity():
     """Get current Reddit user identity"""
     try:
-        cfg = load_platform_config_from_env("reddit", prefix="REDDIT")
-        cfg.extra["user_agent"] = "redacted-app:v1.0 (by u/redacted-app)"
+        cfg = _reddit_config()
         
-        platform = RedditPlatform(cfg)
+        platform = _reddit_platform_cls()(cfg)
         platform.authenticate()
         
         # Get user info directly from PRAW
@@ -2124,10 +2717,9 @@ class RedditListPostsRequest(BaseModel):
 def list_reddit_posts(request: RedditListPostsRequest):
     """List posts from a subreddit"""
     try:
-        cfg = load_platform_config_from_env("reddit", prefix="REDDIT")
-        cfg.extra["user_agent"] = "redacted-app:v1.0 (by u/redacted-app)"
+        cfg = _reddit_config()
         
-        platform = RedditPlatform(cfg)
+        platform = _reddit_platform_cls()(cfg)
         platform.authenticate()
         
         posts = platform.list_posts(
@@ -2163,10 +2755,9 @@ def submit_reddit_post(request: RedditSubmitRequest):
                 detail="Must provide either 'text' for a text post or 'url' for a link post, but not both"
             )
         
-        cfg = load_platform_config_from_env("reddit", prefix="REDDIT")
-        cfg.extra["user_agent"] = "redacted-app:v1.0 (by u/redacted-app)"
+        cfg = _reddit_config()
         
-        platform = RedditPlatform(cfg)
+        platform = _reddit_platform_cls()(cfg)
         platform.authenticate()
         
         # Format content for post_content method
@@ -2185,6 +2776,8 @@ def submit_reddit_post(request: RedditSubmitRequest):
             "url": result.url,
             "fullname": result.raw_response.get("name")
         }
+    except HTTPException:
+        raise
     except ValidationError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except SMAuthenticationError as e:
@@ -2204,10 +2797,9 @@ class RedditReplyRequest(BaseModel):
 def reply_to_reddit_item(request: RedditReplyRequest):
     """Reply to a Reddit post or comment"""
     try:
-        cfg = load_platform_config_from_env("reddit", prefix="REDDIT")
-        cfg.extra["user_agent"] = "redacted-app:v1.0 (by u/redacted-app)"
+        cfg = _reddit_config()
         
-        platform = RedditPlatform(cfg)
+        platform = _reddit_platform_cls()(cfg)
         platform.authenticate()
         
         # Determine if it's a post or comment based on fullname prefix
@@ -2226,6 +2818,8 @@ def reply_to_reddit_item(request: RedditReplyRequest):
             )
         
         return result
+    except HTTPException:
+        raise
     except ValidationError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except SMAuthenticationError as e:
@@ -2262,10 +2856,8 @@ def post_to_twitter(account_id: int, payload: TwitterPostRequest):
         # Build platform config from env + DB tokens
         cfg = load_platform_config_from_env("twitter", prefix="TWITTER")
         if row.get("access_token"):
-            from pydantic import SecretStr
             cfg.access_token = SecretStr(row["access_token"])
         if row.get("refresh_token"):
-            from pydantic import SecretStr
             cfg.refresh_token = SecretStr(row["refresh_token"])
         cfg.token_expires_at = row.get("token_expires_at")
 
@@ -2320,10 +2912,8 @@ def twitter_metrics(account_id: int, post_id: Optional[str] = None):
 
         cfg = load_platform_config_from_env("twitter", prefix="TWITTER")
         if row.get("access_token"):
-            from pydantic import SecretStr
             cfg.access_token = SecretStr(row["access_token"])
         if row.get("refresh_token"):
-            from pydantic import SecretStr
             cfg.refresh_token = SecretStr(row["refresh_token"])
         cfg.token_expires_at = row.get("token_expires_at")
 
@@ -2393,12 +2983,14 @@ def get_twitter_oauth1_authorization_url():
         url, auth_state = platform.get_request_token()
         
         # Store the OAuth state for callback verification
-        _twitter_oauth1_sessions[auth_state.oauth_token] = auth_state
+        _twitter_oauth1_sessions.put(auth_state.oauth_token, auth_state)
         
         return TwitterAuthURLResponse(
             authorization_url=url, 
             state=auth_state.oauth_token  # In OAuth 1.0a, we use oauth_token as state
         )
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -2408,10 +3000,9 @@ def twitter_oauth1_callback(oauth_token: str, oauth_verifier: str):
     """Handle OAuth 1.0a callback from Twitter/X."""
     try:
         # Retrieve the stored OAuth state
-        if oauth_token not in _twitter_oauth1_sessions:
-            raise HTTPException(status_code=400, detail="Invalid or expired oauth_token")
-        
         auth_state = _twitter_oauth1_sessions.pop(oauth_token)
+        if auth_state is None:
+            raise HTTPException(status_code=400, detail="Invalid or expired oauth_token")
         
         # Load config and exchange verifier for access token
         cfg = load_platform_config_from_env("twitter", prefix="TWITTER")
@@ -2431,6 +3022,7 @@ def twitter_oauth1_callback(oauth_token: str, oauth_verifier: str):
         # Persist tokens and account info
         
         
+        social_accounts_cache.invalidate(_SOCIAL_ACCOUNTS_GROUP)
         return TwitterCallbackResponse(
             message="Twitter account connected successfully via OAuth 1.0a",
             account_id=row["account_id"],
@@ -2447,6 +3039,13 @@ def twitter_oauth1_callback(oauth_token: str, oauth_verifier: str):
 heygen_service = HeyGenService(api_key=os.environ.get("HEYGEN_API_KEY"))
 storage_service = StorageService()
 
+
+@app.on_event("shutdown")
+async def close_heygen_session():
+    """Release pooled HeyGen connections (sync and async) on shutdown."""
+    heygen_service.close()
+    await heygen_service.aclose()
+
 # Log HeyGen readiness (mask presence only)
 if os.environ.get("HEYGEN_API_KEY"):
     logger.info("HeyGen API key configured (masked)")
@@ -2459,18 +3058,37 @@ if os.environ.get("HEYGEN_WEBHOOK_URL"):
 else:
     logger.warning("HEYGEN_WEBHOOK_URL not set; webhook events disabled")
 
+def _heygen_voice_list(result) -> list:
+    """Shape a HeyGen list_voices response for the frontend."""
+    voices = ((result or {}).get("data", {}) or {}).get("voices", [])
+    return [
+        {"id": v.get("voice_id"), "name": v.get("name"), "status": v.get("status", "available")}
+        for v in voices if v.get("voice_id")
+    ]
+
+def _heygen_avatar_list(result) -> list:
+    """Shape the stock avatars of a HeyGen list_avatars response for the frontend."""
+    api_avatars = ((result or {}).get("data", {}) or {}).get("avatars", [])
+    return [
+        {
+            "id": a.get("avatar_id"),
+            "name": a.get("avatar_name") or a.get("avatar_id"),
+            "status": a.get("status", "available"),
+            "is_custom": False,
+            "type": "avatar",
+            "gender": a.get("gender"),
+            "preview_image_url": a.get("preview_image_url")
+        }
+        for a in api_avatars if a.get("avatar_id")
+    ]
+
 @app.get("/heygen/voices")
-def get_heygen_voices():
+async def get_heygen_voices():
     if DEMO_MODE:
         return {"voices": []}
     # Fetch live voices from HeyGen API
     try:
-        result = heygen_service.list_voices() or {}
-        voices = (result.get("data", {}) or {}).get("voices", [])
-        processed = [
-            {"id": v.get("voice_id"), "name": v.get("name"), "status": v.get("status", "available")}
-            for v in voices if v.get("voice_id")
-        ]
+        processed = _heygen_voice_list(await heygen_service.a_list_voices())
         logger.info(f"Returning {len(processed)} voices from HeyGen API")
         return {"voices": processed}
     except Exception as e:
@@ -2491,7 +3109,7 @@ def get_heygen_avatars(include_defaults: bool = True):
             metadata = avatar.get('metadata') or {}
             if isinstance(metadata, str):
                 try:
-                    metadata = json.loads(metadata)
+                    metadata = _json_loads(metadata)
                 except:
                     metadata = {}
             
@@ -2511,21 +3129,8 @@ def get_heygen_avatars(include_defaults: bool = True):
     # Then, optionally fetch default avatars from HeyGen API
     if include_defaults:
         try:
-            result = heygen_service.list_avatars() or {}
-            data = result.get("data", {}) or {}
-            api_avatars = data.get("avatars", [])
-            
-            for a in api_avatars:
-                if a.get("avatar_id"):
-                    avatars_list.append({
-                        "id": a.get("avatar_id"),
-                        "name": a.get("avatar_name") or a.get("avatar_id"),
-                        "status": a.get("status", "available"),
-                        "is_custom": False,
-                        "type": "avatar",
-                        "gender": a.get("gender"),
-                        "preview_image_url": a.get("preview_image_url")
-                    })
+            api_avatars = _heygen_avatar_list(heygen_service.list_avatars())
+            avatars_list.extend(api_avatars)
             
             logger.info(f"Added {len(api_avatars)} default avatars from HeyGen API")
         except Exception as e:
@@ -2534,6 +3139,18 @@ def get_heygen_avatars(include_defaults: bool = True):
     logger.info(f"Returning total {len(avatars_list)} avatars")
     return {"avatars": avatars_list}
 
+@app.get("/heygen/bootstrap")
+async def get_heygen_bootstrap():
+    """Voices, stock avatars and templates in one call, fetched from HeyGen concurrently."""
+    if DEMO_MODE:
+        return {"voices": [], "avatars": [], "templates": []}
+    catalogs = await heygen_service.bootstrap()
+    return {
+        "voices": _heygen_voice_list(catalogs["voices"]),
+        "avatars": _heygen_avatar_list(catalogs["avatars"]),
+        "templates": ((catalogs["templates"] or {}).get("data", {}) or {}).get("templates", []),
+    }
+
 # Configuration limits for HeyGen jobs
 MAX_CONCURRENT_JOBS = int(os.environ.get("HEYGEN_MAX_CONCURRENT_JOBS", "5"))
 DAILY_JOB_LIMIT = int(os.environ.get("HEYGEN_DAILY_JOB_LIMIT", "50"))
@@ -2560,12 +3177,14 @@ class VideoCreateRequest(BaseModel):
     background: Optional[str] = None  # e.g., hex color or image URL
     caption: Optional[bool] = False  # include captions in video
     
-    @validator('avatar_id')
+    @field_validator('avatar_id')
+    @classmethod
     def validate_avatar_id(cls, v):
         # HeyGen uses string IDs, so just return as-is
         return str(v)
     
-    @validator('voice_id')
+    @field_validator('voice_id')
+    @classmethod
     def validate_voice_id(cls, v):
         # HeyGen uses string IDs, so just return as-is if provided
         return str(v) if v is not None else None
@@ -2614,20 +3233,7 @@ def create_heygen_video(background_tasks: BackgroundTasks, video_request: VideoC
             }
         else:
             # For real HeyGen IDs, make actual API call
-            webhook_url = None
-            base_webhook = os.environ.get("HEYGEN_WEBHOOK_URL")
-            public_base = os.environ.get("PUBLIC_URL")
-            if public_base:
-                webhook_url = f"{public_base.rstrip('/')}/webhooks/heygen"
-            elif base_webhook:
-                # Normalize to /webhooks/heygen
-                if base_webhook.endswith("/webhooks"):
-                    base_webhook += "/heygen"
-                elif base_webhook.endswith("/webhooks/") and not base_webhook.endswith("/webhooks/heygen"):
-                    base_webhook += "heygen"
-                webhook_url = base_webhook
-            elif public_base:
-                webhook_url = f"{public_base.rstrip('/')}/webhooks/heygen"
+            webhook_url = webhook_url_from_env()
             
             # Check if this is a custom avatar from our database
             is_talking_photo = False
@@ -2639,7 +3245,7 @@ def create_heygen_video(background_tasks: BackgroundTasks, video_request: VideoC
                 metadata = avatar_record.get('metadata', {})
                 if isinstance(metadata, str):
                     try:
-                        metadata = json.loads(metadata)
+                        metadata = _json_loads(metadata)
                     except:
                         metadata = {}
                 is_talking_photo = metadata.get('type') == 'talking_photo'
@@ -2765,12 +3371,69 @@ def get_heygen_video_status(provider_video_id: str):
         
         if not row:
             raise HTTPException(status_code=404, detail="Video job not found")
-        return dict(row)
+        return row
     except HTTPException:
         raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+# In-process subscribers for pushed video status: provider video_id -> set of queues.
+# Fed by the HeyGen webhook so clients can wait on status instead of polling.
+_video_status_subscribers: Dict[str, set] = {}
+# Idle seconds before a stream re-reads the stored status (the webhook may land on another
+# worker, or never arrive), and the longest a stream stays open before the client must reconnect
+_VIDEO_STATUS_POLL_SECONDS = 15
+_VIDEO_STATUS_STREAM_MAX_SECONDS = 30 * 60
+
+def _publish_video_status(video_id: str, status: str):
+    for queue in _video_status_subscribers.get(video_id, ()):
+        queue.put_nowait(status)
+
+async def _stored_video_status(provider_video_id: str) -> Optional[str]:
+    try:
+        row = await run_in_threadpool(get_heygen_video_status, provider_video_id)
+    except HTTPException:
+        return None
+    return (row or {}).get("status")
+
+@app.get("/heygen/videos/status/{provider_video_id}/events")
+async def stream_heygen_video_status(provider_video_id: str, request: Request):
+    """Server-sent events carrying the current status, then status changes, for one video until it
+    completes or fails (or _VIDEO_STATUS_STREAM_MAX_SECONDS pass)."""
+    queue: asyncio.Queue = asyncio.Queue()
+    # Subscribe before reading the stored status so a webhook landing in between is not lost
+    _video_status_subscribers.setdefault(provider_video_id, set()).add(queue)
+    current = await _stored_video_status(provider_video_id)
+
+    async def events():
+        last = current
+        deadline = time.monotonic() + _VIDEO_STATUS_STREAM_MAX_SECONDS
+        try:
+            if last:
+                yield f"data: {json.dumps({'video_id': provider_video_id, 'status': last})}\n\n"
+                if last in ("completed", "failed"):
+                    return
+            while time.monotonic() < deadline and not await request.is_disconnected():
+                try:
+                    status = await asyncio.wait_for(queue.get(), timeout=_VIDEO_STATUS_POLL_SECONDS)
+                except asyncio.TimeoutError:
+                    status = await _stored_video_status(provider_video_id)
+                    if not status or status == last:
+                        yield ": keepalive\n\n"
+                        continue
+                last = status
+                yield f"data: {json.dumps({'video_id': provider_video_id, 'status': status})}\n\n"
+                if status in ("completed", "failed"):
+                    break
+        finally:
+            subscribers = _video_status_subscribers.get(provider_video_id)
+            if subscribers is not None:
+                subscribers.discard(queue)
+                if not subscribers:
+                    _video_status_subscribers.pop(provider_video_id, None)
+
+    return StreamingResponse(events(), media_type="text/event-stream")
+
 def verify_webhook_signature(payload: bytes, signature: str, secret: str):
     """Verify HeyGen webhook signature"""
     expected_signature = hmac.new(
@@ -2797,13 +3460,15 @@ async def handle_heygen_webhook(request: Request):
         
         # Parse JSON payload
         try:
-            payload = await request.json()
-        except json.JSONDecodeError:
+            payload = _json_loads(body)
+        except ValueError:
             logger.error("Invalid JSON in webhook payload")
             raise HTTPException(status_code=400, detail="Invalid JSON payload")
         
         # Log the webhook payload
-        logger.info(f"Received HeyGen webhook: {json.dumps(payload, indent=2)}")
+        logger.info("Received HeyGen webhook for video %s", payload.get("video_id"))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("HeyGen webhook payload: %s", _json_bytes(payload).decode())
         
         # Extract webhook data
         event_type = payload.get("event_type", payload.get("type"))
@@ -2864,11 +3529,13 @@ async def handle_heygen_webhook(request: Request):
                     logger.info(f"Video {video_id} completed and stored with asset_id {asset_id}")
                 except Exception as e:
                     logger.error(f"Error downloading/storing video: {str(e)}")
+                    db_status = "failed"
                     # Persist failed status with error context
                     , video_url, video_id)
                     )
             else:
                 logger.error("No video URL in completed webhook")
+                db_status = "failed"
                 # Persist failed status when no URL is provided
                 
                 )
@@ -2880,6 +3547,7 @@ async def handle_heygen_webhook(request: Request):
         conn.commit()
         cur.close()
         conn.close()
+        _publish_video_status(video_id, db_status)
         
         duration = time.time() - start_time
         log_heygen_operation("webhook_process", job_id=video_id, duration=duration, status="success")
@@ -2899,17 +3567,7 @@ async def handle_heygen_webhook(request: Request):
 def get_webhook_info():
     """Get the webhook URL for HeyGen configuration"""
     # Prefer explicit webhook URL when provided, else derive from PUBLIC_URL
-    explicit = os.environ.get("HEYGEN_WEBHOOK_URL")
-    if explicit:
-        if explicit.endswith("/webhooks"):
-            webhook_url = explicit + "/heygen"
-        elif explicit.endswith("/webhooks/") and not explicit.endswith("/webhooks/heygen"):
-            webhook_url = explicit + "heygen"
-        else:
-            webhook_url = explicit
-    else:
-        base_url = os.environ.get("PUBLIC_URL", "https://redacted.example.com")
-        webhook_url = f"{base_url.rstrip('/')}/webhooks/heygen"
+    webhook_url = webhook_url_from_env() or "https://redacted.example.com/webhooks/heygen"
     
     return {
         "webhook_url": webhook_url,
@@ -2943,7 +3601,7 @@ async def clone_voice(
             s3_key = f"training/voices/{uuid.uuid4().hex}.{file_extension}"
             
             # Upload to S3
-            s3_client = boto3.client('s3')
+            s3_client = get_s3_client()
             bucket_name = os.environ.get("S3_BUCKET")
             
             s3_client.put_object(
@@ -3032,12 +3690,9 @@ async def train_avatar(
         if not inferred_content_type.startswith('image/'):
             raise HTTPException(status_code=400, detail="File must be an image (JPEG or PNG)")
         
-        # Read file content
-        file_content = await training_media.read()
-        
-        # Step 1: Upload photo to HeyGen to get image_key
+        # Step 1: Upload photo to HeyGen to get image_key (streamed from the spooled upload)
         try:
-            upload_result = heygen_service.upload_photo(file_content, inferred_content_type)
+            upload_result = await heygen_service.a_upload_photo(training_media.file, inferred_content_type)
             image_key = upload_result.get("image_key")
             image_url = upload_result.get("image_url")
             talking_photo_id = upload_result.get("talking_photo_id")
@@ -3076,15 +3731,15 @@ async def train_avatar(
             # First try to generate photo avatar photos if we have an image URL
             if image_url:
                 try:
-                    gen_result = heygen_service.generate_photo_avatar_photos(image_url)
-                    logger.info(f"Photo generation result: {gen_result}")
+                    gen_result = await heygen_service.a_generate_photo_avatar_photos(image_url)
+                    logger.info("Photo generation result code=%s", gen_result.get("code"))
                     # Update image_key if we got a new one
                     if gen_result.get("data", {}).get("image_key"):
                         image_key = gen_result["data"]["image_key"]
                 except Exception as e:
                     logger.warning(f"Photo generation not available: {e}")
             
-            group_result = heygen_service.create_photo_avatar_group(name, image_key)
+            group_result = await heygen_service.a_create_photo_avatar_group(name, image_key)
             group_data = group_result.get("data", {})
             group_id = group_data.get("group_id") or group_data.get("id")
             avatar_id = group_data.get("id")
@@ -3109,30 +3764,28 @@ async def train_avatar(
         
         # Step 3: Train the photo avatar group
         try:
-            train_result = heygen_service.train_avatar({"group_id": group_id})
-            logger.info(f"Photo avatar training started: {train_result}")
+            train_result = await heygen_service.a_train_avatar({"group_id": group_id})
+            logger.info("Photo avatar training started for group %s", group_id)
             log_heygen_operation("photo_avatar_training", job_id=group_id, status="started")
         except Exception as e:
             logger.error(f"Error starting avatar training: {str(e)}")
             # Training might be automatic, so don't fail completely
             logger.warning("Training may proceed automatically")
         
-            import uuid, boto3, os
             file_extension = training_media.filename.split('.')[-1] if training_media.filename and '.' in training_media.filename else 'jpg'
             s3_key = f"training/avatars/{uuid.uuid4().hex}.{file_extension}"
             
-            s3_client = boto3.client('s3')
+            s3_client = get_s3_client()
             bucket_name = os.environ.get("S3_BUCKET")
             
             # Reset file position before S3 upload
             await training_media.seek(0)
-            file_content = await training_media.read()
             
-            s3_client.put_object(
-                Bucket=bucket_name,
-                Key=s3_key,
-                Body=file_content,
-                ContentType=inferred_content_type
+            s3_client.upload_fileobj(
+                training_media.file,
+                bucket_name,
+                s3_key,
+                ExtraArgs={"ContentType": inferred_content_type}
             )
             
             s3_url = f"s3://{bucket_name}/{s3_key}"
@@ -3183,7 +3836,7 @@ def get_avatar_training_status(avatar_id: str):
         # Get metadata to find group_id
         metadata = avatar.get('metadata') or {}
         if isinstance(metadata, str):
-            metadata = json.loads(metadata)
+            metadata = _json_loads(metadata)
         
         group_id = metadata.get('group_id') or avatar.get('provider_id')
         
@@ -3231,10 +3884,10 @@ def get_avatar_status(avatar_id: int):
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/heygen/templates")
-def get_heygen_templates():
+async def get_heygen_templates():
     try:
         # Fetch templates from HeyGen API
-        templates = heygen_service.list_templates()
+        templates = await heygen_service.a_list_templates()
         return templates
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -3264,7 +3917,7 @@ def get_heygen_job_analytics():
     try:
         
         
-        return {
+        return RowsJSONResponse({
             "status_counts": status_counts,
             "avg_processing_time_seconds": avg_processing_time,
             "daily_counts": daily_counts,
@@ -3272,7 +3925,7 @@ def get_heygen_job_analytics():
                 "max_concurrent": MAX_CONCURRENT_JOBS,
                 "daily_limit": DAILY_JOB_LIMIT
             }
-        }
+        })
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error fetching analytics: {str(e)}")
 
@@ -3286,17 +3939,22 @@ class HeyGenVideoStatus(BaseModel):
     updated_at: str
     url: Optional[str] = None
 
-    @validator('created_at', 'updated_at', pre=True)
+    @field_validator('created_at', 'updated_at', mode='before')
+    @classmethod
     def format_dt(cls, v):
         if isinstance(v, datetime):
             return v.isoformat()
         return v
 
+_HEYGEN_VIDEO_LIST = TypeAdapter(List[HeyGenVideoStatus])
+
 @app.get("/heygen/videos", response_model=List[HeyGenVideoStatus])
 def list_heygen_videos():
     try:
         
-        return [dict(r) for r in rows]
+        # Validated once (formats the timestamps) and rendered straight to JSON bytes,
+        # instead of FastAPI's validate / json-mode dump / render passes
+        return Response(content=_HEYGEN_VIDEO_LIST.dump_json(_HEYGEN_VIDEO_LIST.validate_python(rows)), media_type="application/json")
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -3331,7 +3989,8 @@ class AutoCampaignRequest(BaseModel):
     override_tweet_text: Optional[str] = None
     override_video_caption: Optional[str] = None
 
-    @validator("platforms", pre=True)
+    @field_validator("platforms", mode='before')
+    @classmethod
     def _normalize_and_validate_platforms(cls, value):
         if not value:
             raise ValueError("At least one platform must be provided")
@@ -3340,7 +3999,7 @@ class AutoCampaignRequest(BaseModel):
         normalized = [str(p).lower().strip() for p in value if str(p).strip()]
         if not normalized:
             raise ValueError("At least one platform must be provided")
-        supported = set(svc.PLATFORM_CAPS.keys())
+        supported = svc.SUPPORTED_PLATFORMS
         filtered = [p for p in normalized if p in supported]
         if not filtered:
             raise ValueError(f"Unsupported platforms; supported: {sorted(supported)}")
@@ -3407,6 +4066,31 @@ def create_auto_campaign(request: AutoCampaignRequest):
                 base = (offer_description or offer_title or "This offer").strip()
                 script_text = (f"{base}\n\nLearn more" + (f": {cta_link_val}" if cta_link_val else ".")).strip()
 
+        platforms_norm = [p.lower() for p in (request.platforms or [])]
+
+        # Twitter: tweet content
+        tweet_text: Optional[str] = None
+        if "twitter" in platforms_norm:
+            try:
+                tweet_text = request.override_tweet_text or ai_service.generate_tweet_text(script_text, cta_link_val)
+            except Exception:
+                # Deterministic fallback
+                base = (script_text or "").strip()
+                tweet_text = ((base[:240] + (" " if base else "") + (cta_link_val or "")).strip() or (offer_title[:240] + (" " if offer_title else "") + (cta_link_val or "")).strip())[:280]
+
+        # Shorts: caption and optional video
+        caption_text: Optional[str] = None
+        if "shorts" in platforms_norm:
+            try:
+                caption_text = request.override_video_caption or ai_service.generate_shorts_caption(script_text, cta_link_val)
+            except Exception:
+                # Deterministic fallback: first 160 chars + CTA on new line
+                base = (script_text or offer_description or offer_title or "").strip()
+                caption_text = base[:160].strip()
+                if cta_link_val:
+                    caption_text = (caption_text + "\n" + cta_link_val).strip()
+                caption_text = caption_text[:220]
+
         # Begin single-connection transaction
         conn = get_db_connection()
         try:
@@ -3426,14 +4110,22 @@ def create_auto_campaign(request: AutoCampaignRequest):
             )
             script_id = cur.fetchone()["script_id"]
 
-            # Create Campaign (draft)
-            campaign_id = svc.insert_campaign(
+            # Create Campaign (draft) with its content rows in one round trip.
+            # Video asset creation is deferred to the HeyGen completion webhook,
+            # so the Shorts video row is created without an asset.
+            bundle = svc.create_campaign_bundle(
                 conn,
                 name=f"Campaign for {offer_title}",
                 description=f"Campaign generated from offer: {offer_title}",
                 persona_id=persona_id,
                 status="draft",
+                tweet_text=tweet_text,
+                tweet_source="manual" if request.override_tweet_text else "ai",
+                shorts_caption_text=caption_text,
+                shorts_caption_source="manual" if request.override_video_caption else "ai",
+                shorts_video="shorts" in platforms_norm and bool(request.generate_heygen_video),
             )
+            campaign_id = bundle["campaign_id"]
 
             # Update campaign core fields
             svc.update_campaign_core(
@@ -3447,50 +4139,19 @@ def create_auto_campaign(request: AutoCampaignRequest):
             )
 
             # Attach requested platforms
-            platforms_norm = [p.lower() for p in (request.platforms or [])]
             for plat in platforms_norm:
                 svc.attach_platform(conn, campaign_id, plat, True)
 
-            created_content_ids: List[int] = []
-
-            # Twitter: tweet content
-            if "twitter" in platforms_norm:
-                try:
-                    tweet_text = request.override_tweet_text or ai_service.generate_tweet_text(script_text, cta_link_val)
-                except Exception:
-                    # Deterministic fallback
-                    base = (script_text or "").strip()
-                    tweet_text = ((base[:240] + (" " if base else "") + (cta_link_val or "")).strip() or (offer_title[:240] + (" " if offer_title else "") + (cta_link_val or "")).strip())[:280]
-                source = "manual" if request.override_tweet_text else "ai"
-                if tweet_text:
-                    cid = svc.create_content_tweet(conn, campaign_id, tweet_text, source)
-                    created_content_ids.append(cid)
-
-            # Shorts: caption and optional video
-            if "shorts" in platforms_norm:
-                # Caption
-                try:
-                    caption_text = request.override_video_caption or ai_service.generate_shorts_caption(script_text, cta_link_val)
-                except Exception:
-                    # Deterministic fallback: first 160 chars + CTA on new line
-                    base = (script_text or offer_description or offer_title or "").strip()
-                    caption_text = base[:160].strip()
-                    if cta_link_val:
-                        caption_text = (caption_text + "\n" + cta_link_val).strip()
-                    caption_text = caption_text[:220]
-                if caption_text:
-                    source = "manual" if request.override_video_caption else "ai"
-                    cid = svc.create_content_shorts_caption(conn, campaign_id, caption_text, source)
-                    created_content_ids.append(cid)
-                # Video asset placeholder
-                if request.generate_heygen_video:
-                    # Defer asset creation to HeyGen completion webhook; create content row with no asset yet
-                    cid = svc.create_content_shorts_video(conn, campaign_id, None)
-                    created_content_ids.append(cid)
+            created_content_ids: List[int] = [
+                bundle[key]
+                for key in ("tweet_id", "shorts_caption_id", "shorts_video_id")
+                if bundle[key] is not None
+            ]
 
             # Commit transaction
             conn.commit()
             cur.close()
+            _campaign_lists.clear()
         except Exception as e:
             try:
                 conn.rollback()
@@ -3577,16 +4238,6 @@ def post_to_reddit(account_id: int, payload: RedditAccountPostRequest):
             cur.close(); conn.close()
             raise HTTPException(status_code=400, detail="Account is not a Reddit account")
 
-        # Build platform config from env + DB refresh token
-        cfg = load_platform_config_from_env("reddit", prefix="REDDIT")
-        if row.get("refresh_token"):
-            from pydantic import SecretStr
-            cfg.refresh_token = SecretStr(row["refresh_token"])
-        cfg.extra["user_agent"] = "redacted-app:v1.0 (by u/redacted-app)"
-
-        platform = RedditPlatform(cfg)
-        platform.authenticate()
-
         # Format content for RedditPlatform.post_content method
         content_parts = [f"subreddit:{payload.subreddit}", f"title:{payload.title}"]
         if payload.text:
@@ -3595,7 +4246,9 @@ def post_to_reddit(account_id: int, payload: RedditAccountPostRequest):
             content_parts.append(f"url:{payload.url}")
         content_text = " ".join(content_parts)
 
-        result = platform.post_content(content_text)
+        # Authenticated client for the account's stored refresh token
+        with _reddit_platform(account_id, row) as platform:
+            result = platform.post_content(content_text)
 
         # Close DB
         cur.close(); conn.close()
@@ -3628,20 +4281,12 @@ def reddit_metrics(account_id: int, post_id: Optional[str] = None):
             cur.close(); conn.close()
             raise HTTPException(status_code=400, detail="Account is not a Reddit account")
 
-        # Build platform config from env + DB refresh token
-        cfg = load_platform_config_from_env("reddit", prefix="REDDIT")
-        if row.get("refresh_token"):
-            from pydantic import SecretStr
-            cfg.refresh_token = SecretStr(row["refresh_token"])
-        cfg.extra["user_agent"] = "redacted-app:v1.0 (by u/redacted-app)"
-
-        platform = RedditPlatform(cfg)
-        platform.authenticate()
-
         if not post_id:
             raise HTTPException(status_code=400, detail="post_id is required for Reddit metrics")
 
-        results = platform.fetch_metrics(post_id=post_id)
+        # Authenticated client for the account's stored refresh token
+        with _reddit_platform(account_id, row) as platform:
+            results = platform.fetch_metrics(post_id=post_id)
 
         cur.close(); conn.close()
 
@@ -3675,9 +4320,9 @@ def get_campaign_detail(campaign_id: int):
         content = cur.fetchall() or []
         cur.close(); conn.close()
         return {
-            "campaign": dict(campaign),
-            "platforms": [dict(p) for p in platforms],
-            "content": [dict(r) for r in content],
+            "campaign": campaign,
+            "platforms": platforms,
+            "content": content,
         }
     except HTTPException:
         raise
@@ -0,0 +1,57 @@
+# oauth_state_store.py
+
+import os
+import threading
+import time
+from typing import Dict, Generic, Optional, Tuple, Type, TypeVar
+
+from pydantic import BaseModel
+
+from redis_client import redis_client as _redis
+
+# Pending authorizations older than this are dropped (the user never came back)
+OAUTH_STATE_TTL_SECONDS = int(os.environ.get("OAUTH_STATE_TTL", "600"))
+# Upper bound for the in-process store before expired entries are swept
+_LOCAL_MAX_ENTRIES = 10000
+
+StateT = TypeVar("StateT", bound=BaseModel)
+
+
+class OAuthStateStore(Generic[StateT]):
+    """Pending OAuth states keyed by state / oauth_token, expiring after a TTL.
+
+    Backed by Redis (SETEX + GETDEL) when REDIS_URL is set, so the callback can be
+    served by any worker; otherwise by a lock-guarded in-process dict, which only
+    works with a single worker.
+    """
+
+    def __init__(self, namespace: str, model: Type[StateT], ttl_seconds: int = OAUTH_STATE_TTL_SECONDS):
+        self.namespace = namespace
+        self.model = model
+        self.ttl_seconds = ttl_seconds
+        self._local: Dict[str, Tuple[float, StateT]] = {}
+        self._lock = threading.Lock()
+
+    def _key(self, key: str) -> str:
+        return f"oauth:{self.namespace}:{key}"
+
+    def put(self, key: str, state: StateT) -> None:
+        if _redis is not None:
+            _redis.setex(self._key(key), self.ttl_seconds, state.model_dump_json())
+            return
+        now = time.monotonic()
+        with self._lock:
+            if len(self._local) >= _LOCAL_MAX_ENTRIES:
+                self._local = {k: v for k, v in self._local.items() if v[0] > now}
+            self._local[key] = (now + self.ttl_seconds, state)
+
+    def pop(self, key: str) -> Optional[StateT]:
+        """Remove and return the state for key, or None if it is unknown or expired."""
+        if _redis is not None:
+            raw = _redis.getdel(self._key(key))
+            return self.model.model_validate_json(raw) if raw is not None else None
+        with self._lock:
+            entry = self._local.pop(key, None)
+        if entry is None or entry[0] <= time.monotonic():
+            return None
+        return entry[1]
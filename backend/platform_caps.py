@@ -0,0 +1,11 @@
+from types import MappingProxyType
+
+# Registry of platform capabilities used by the orchestration layer:
+# platform -> content types it supports. Read-only and tuple-valued so it can be
+# shared by both campaign services and iterated cheaply.
+PLATFORM_CAPS = MappingProxyType({
+    "twitter": ("tweet",),
+    "shorts": ("shorts_caption", "video"),
+})
+
+SUPPORTED_PLATFORMS = frozenset(PLATFORM_CAPS)
@@ -4,11 +4,14 @@ import json
 import os
 import secrets
 from datetime import datetime, timezone
+from http.cookiejar import DefaultCookiePolicy
 from typing import Any, Dict, List, Optional, Tuple
 
 import praw
 import prawcore
+import requests
 from pydantic import SecretStr
+from requests.adapters import HTTPAdapter
 from demo_flags import DEMO_MODE
 
 from social_media_service import (
@@ -27,6 +30,20 @@ from social_media_service import (
 # Token storage file path
 TOKEN_FILE = os.path.join(os.path.dirname(__file__), "reddit_token.json")
 
+# One connection pool for every PRAW client (token exchanges and API calls), so connections
+# to reddit.com stay open across requests instead of paying a TLS handshake per client
+_HTTP_ADAPTER = HTTPAdapter(pool_connections=4, pool_maxsize=50)
+
+
+def _requestor_kwargs() -> Dict[str, Any]:
+    """PRAW requestor kwargs: a Session of its own on the shared adapter.
+    The session rejects all cookies, so nothing one account's client receives is sent for another.
+    """
+    session = requests.Session()
+    session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+    session.mount("https://", _HTTP_ADAPTER)
+    return {"session": session}
+
 
 class RedditPlatform(SocialMediaPlatform):
     """Reddit integration using PRAW with refresh token authentication."""
@@ -60,6 +77,7 @@ class RedditPlatform(SocialMediaPlatform):
                 client_secret=self.config.client_secret.get_secret_value(),
                 refresh_token=self.config.refresh_token.get_secret_value(),
                 user_agent=self._user_agent,
+                requestor_kwargs=_requestor_kwargs(),
             )
             # Test the connection
             self._reddit_client.user.me()
@@ -112,6 +130,7 @@ class RedditPlatform(SocialMediaPlatform):
             client_secret=self.config.client_secret.get_secret_value() if self.config.client_secret else None,
             redirect_uri=redirect_uri,
             user_agent=self._user_agent,
+            requestor_kwargs=_requestor_kwargs(),
         )
         
         auth_url = reddit.auth.url(scopes=scopes, state=state, duration="permanent")
@@ -130,6 +149,7 @@ class RedditPlatform(SocialMediaPlatform):
             client_secret=self.config.client_secret.get_secret_value() if self.config.client_secret else None,
             redirect_uri=redirect_uri,
             user_agent=self._user_agent,
+            requestor_kwargs=_requestor_kwargs(),
         )
         refresh_token = reddit.auth.authorize(code)
         self.save_refresh_token(refresh_token)
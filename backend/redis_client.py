@@ -0,0 +1,15 @@
+# redis_client.py
+
+import os
+
+from demo_flags import DEMO_MODE
+
+try:
+    import redis
+except ImportError:  # callers fall back to in-process storage
+    redis = None
+
+# Shared Redis connection pool for cross-worker state; None when REDIS_URL is unset,
+# redis-py is missing, or in demo mode
+_redis_url = os.environ.get("REDIS_URL")
+redis_client = redis.Redis.from_url(_redis_url) if (redis is not None and _redis_url and not DEMO_MODE) else None
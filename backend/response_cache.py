@@ -0,0 +1,132 @@
+# response_cache.py
+
+import asyncio
+import logging
+import os
+import threading
+import time
+from typing import Dict, Hashable, Optional, Tuple
+
+from redis_client import redis_client as _redis
+
+try:
+    from redis.exceptions import RedisError
+except ImportError:  # no redis-py: the in-process dict is the only backend
+    RedisError = ()
+
+logger = logging.getLogger(__name__)
+
+# Rendered analytics responses are reused this long unless a write for the campaign busts them
+ANALYTICS_CACHE_TTL_SECONDS = int(os.environ.get("ANALYTICS_CACHE_TTL", "3600"))
+# Social-account reads change rarely; writes bust them, the TTL bounds anything that slips past
+SOCIAL_ACCOUNTS_CACHE_TTL_SECONDS = int(os.environ.get("SOCIAL_ACCOUNTS_CACHE_TTL", "300"))
+# Outcomes of background account checks stay pollable this long
+ACCOUNT_JOB_TTL_SECONDS = int(os.environ.get("ACCOUNT_JOB_TTL", "600"))
+# Successful GET probes from the self-test endpoints are replayed this long
+SELF_TEST_PROBE_CACHE_TTL_SECONDS = int(os.environ.get("SELF_TEST_PROBE_CACHE_TTL", "60"))
+# Upper bound for the in-process cache before expired entries are swept
+_LOCAL_MAX_ENTRIES = 5000
+# Invalidation of the in-process dict only reaches the worker that handled the write, so
+# with several workers (uvicorn/gunicorn export WEB_CONCURRENCY) it is only used with Redis
+_MULTI_WORKER = int(os.environ.get("WEB_CONCURRENCY", "1")) > 1
+
+
+class ResponseCache:
+    """Rendered JSON bodies of read endpoints, invalidated a group at a time.
+
+    Backed by Redis when REDIS_URL is set (each group's keys are tracked in a set so
+    invalidate can drop them together); otherwise by an in-process TTL dict, unless
+    several workers are running, in which case nothing is cached. Redis errors are
+    logged and treated as a miss (get) or a no-op (set, invalidate).
+    """
+
+    def __init__(self, prefix: str, ttl_seconds: int):
+        self.prefix = prefix
+        self.ttl_seconds = ttl_seconds
+        self._local: Dict[str, Tuple[float, Hashable, bytes]] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def shared(self) -> bool:
+        """True when every worker sees the same entries (Redis, or a single worker)."""
+        return _redis is not None or not _MULTI_WORKER
+
+    def key(self, group: Hashable, view: str, *parts) -> str:
+        return ":".join([self.prefix, str(group), view, *("" if p is None else str(p) for p in parts)])
+
+    def get(self, key: str) -> Optional[bytes]:
+        if _redis is not None:
+            try:
+                return _redis.get(key)
+            except RedisError:
+                logger.warning("Response cache read failed for %s", self.prefix, exc_info=True)
+                return None
+        if _MULTI_WORKER:
+            return None
+        with self._lock:
+            entry = self._local.get(key)
+        if entry is None or entry[0] <= time.monotonic():
+            return None
+        return entry[2]
+
+    def set(self, key: str, group: Hashable, body: bytes) -> None:
+        if _redis is not None:
+            index = f"{self.prefix}:{group}:keys"
+            pipe = _redis.pipeline(transaction=False)
+            pipe.setex(key, self.ttl_seconds, body)
+            pipe.sadd(index, key)
+            pipe.expire(index, self.ttl_seconds)
+            try:
+                pipe.execute()
+            except RedisError:
+                logger.warning("Response cache write failed for %s", self.prefix, exc_info=True)
+            return
+        if _MULTI_WORKER:
+            return
+        now = time.monotonic()
+        with self._lock:
+            if len(self._local) >= _LOCAL_MAX_ENTRIES:
+                self._local = {k: v for k, v in self._local.items() if v[0] > now}
+            self._local[key] = (now + self.ttl_seconds, group, body)
+
+    # Async variants for async handlers: Redis round trips run in a worker thread so they
+    # do not block the event loop (the in-process dict is touched directly)
+
+    async def aget(self, key: str) -> Optional[bytes]:
+        if _redis is None:
+            return self.get(key)
+        return await asyncio.to_thread(self.get, key)
+
+    async def aset(self, key: str, group: Hashable, body: bytes) -> None:
+        if _redis is None:
+            return self.set(key, group, body)
+        await asyncio.to_thread(self.set, key, group, body)
+
+    async def ainvalidate(self, group: Hashable) -> None:
+        if _redis is None:
+            return self.invalidate(group)
+        await asyncio.to_thread(self.invalidate, group)
+
+    def invalidate(self, group: Hashable) -> None:
+        """Drop every cached view in group (called after writes that affect it)."""
+        if _redis is not None:
+            index = f"{self.prefix}:{group}:keys"
+            try:
+                keys = _redis.smembers(index)
+                _redis.delete(index, *keys)
+            except RedisError:
+                # Entries left behind still expire with the TTL
+                logger.warning("Response cache invalidation failed for %s", self.prefix, exc_info=True)
+            return
+        with self._lock:
+            self._local = {k: v for k, v in self._local.items() if v[1] != group}
+
+
+# Grouped by campaign_id
+analytics_cache = ResponseCache("sgtma:analytics", ANALYTICS_CACHE_TTL_SECONDS)
+# One group: any account write can change every list and per-platform view
+social_accounts_cache = ResponseCache("sgtma:social_accounts", SOCIAL_ACCOUNTS_CACHE_TTL_SECONDS)
+# Grouped by account_id
+social_account_jobs = ResponseCache("sgtma:social_account_jobs", ACCOUNT_JOB_TTL_SECONDS)
+# One group: ?fresh=true on any self-test endpoint drops every cached probe
+self_test_probes = ResponseCache("sgtma:self_test_probes", SELF_TEST_PROBE_CACHE_TTL_SECONDS)
@@ -1,12 +1,26 @@
 # storage_service.py
 
-import boto3, mimetypes, requests, os, datetime, uuid
+import boto3, mimetypes, requests, os, datetime, uuid, threading
+from botocore.config import Config
 from demo_flags import DEMO_MODE
 
-_s3 = boto3.client("s3", region_name=os.environ.get("AWS_REGION")) if not DEMO_MODE else None
+# One S3 client per process; a larger pool so concurrent requests do not queue on connections
+_S3_CONFIG = Config(max_pool_connections=50, retries={"max_attempts": 3, "mode": "adaptive"})
+_s3 = boto3.client("s3", region_name=os.environ.get("AWS_REGION"), config=_S3_CONFIG) if not DEMO_MODE else None
+_s3_lock = threading.Lock()
 _BUCKET = os.environ.get("S3_BUCKET", "REDACTED_BUCKET")
 _PREFIX = os.environ.get("S3_PREFIX", "")
 
+
+def get_s3_client():
+    """Return the shared S3 client (created on first use when DEMO_MODE skipped it at import)."""
+    global _s3
+    if _s3 is None:
+        with _s3_lock:
+            if _s3 is None:
+                _s3 = boto3.client("s3", region_name=os.environ.get("AWS_REGION"), config=_S3_CONFIG)
+    return _s3
+
 class StorageService:
     def __init__(self):
         pass
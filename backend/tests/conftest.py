@@ -0,0 +1,7 @@
+import os
+import sys
+
+# Modules read DEMO_MODE at import, so it is fixed before any of them load; demo mode
+# keeps external clients (Bedrock, Redis, HeyGen) from being created
+os.environ["DEMO_MODE"] = "1"
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
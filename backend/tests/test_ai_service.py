@@ -0,0 +1,20 @@
+import asyncio
+
+import pytest
+
+pytest.importorskip("boto3")
+
+import ai_service
+
+
+def test_module_instance_is_created_on_import():
+    assert isinstance(ai_service.ai_service, ai_service.AIService)
+
+
+def test_instance_attributes_fit_slots():
+    # Assigning an attribute missing from __slots__ raises in __init__, so constructing
+    # and exercising the instance catches slot drift
+    service = ai_service.AIService()
+    assert not hasattr(service, "__dict__")
+    service.cache_clear()
+    asyncio.run(service.aclose())